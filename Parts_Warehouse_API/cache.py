@@ -0,0 +1,270 @@
+"""
+This module implements the read-through cache of the documents served by the API.
+
+The representations of the documents are stored in the Django cache ('CACHES' setting), keyed by their ObjectId,
+so the cache is private to each worker with the default local memory backend and shared by all workers
+with a memcached backend. The entries are evicted by the backend (least recently used entries first,
+and after 'CACHE_TIMEOUT' seconds), and invalidated by every write to the documents.
+
+The key of a representation is also stamped with the revision of the document, a random value read before
+loading the document and replaced by every invalidation. A representation loaded before a write and stored
+after it is stored under the previous revision, so it is never read.
+
+A cache can hold the representations already encoded to JSON. The list responses are then assembled
+by joining the cached fragments, so only the documents that changed are serialized again.
+
+The results of the queries on a collection are cached under keys stamped with the generation of the collection,
+a counter incremented by every write to the collection. The results cached before a write are never read again
+and expire from the cache, so they do not need to be invalidated one by one. The generation starts at a random
+value, so a counter evicted from the cache never restarts at a value already used to stamp cached results.
+
+The hits and misses are counted per worker, to size the cache.
+"""
+from collections import Counter
+from json import dumps
+from random import randrange
+from threading import Lock
+from typing import Any, Callable, Iterable
+
+from bson import ObjectId
+from django.core.cache import cache
+
+
+document_caches = {}
+
+
+class DocumentCache:
+    """
+    Read-through cache of the representations of the documents of a collection, or of the results of its queries.
+
+    Attributes:
+        name (str): The name of the cache, used as prefix of its keys.
+        version (int): The version of the cached representations, passed to the Django cache with each key,
+            so the entries written by a previous format are never read.
+        revised (bool): Whether the keys are stamped with the revisions of the documents. The results of the queries,
+            keyed by the generation of their collection and never invalidated, do not need revisions.
+        stats (Counter): The number of hits and misses of the worker.
+    """
+    def __init__(self, name: str, version: int = 1, revised: bool = True):
+        self.name = name
+        self.version = version
+        self.revised = revised
+        self.stats = Counter(hits=0, misses=0)
+        self.lock = Lock()
+        document_caches[name] = self
+
+    def get_key(self, object_id: ObjectId | str, revision: int | None = None) -> str:
+        """
+        Get the cache key of a document.
+
+        Args:
+            object_id (ObjectId | str): The ID of the document, or the key of a query result.
+            revision (int): The revision of the document, or None if the cache is not revised.
+
+        Returns:
+            str: The cache key.
+        """
+        if revision is None:
+            return f'{self.name}:{object_id}'
+        return f'{self.name}:{object_id}:{revision}'
+
+    def get_revision_key(self, object_id: ObjectId | str) -> str:
+        """
+        Get the cache key of the revision of a document.
+
+        Args:
+            object_id (ObjectId | str): The ID of the document.
+
+        Returns:
+            str: The cache key of the revision.
+        """
+        return f'{self.name}:revision:{object_id}'
+
+    def get_keys(self, object_ids: list[ObjectId | str]) -> dict[ObjectId | str, str]:
+        """
+        Get the cache keys of documents, stamped with their current revisions.
+
+        The missing revisions are created, so the keys must be read before loading the documents.
+        The revisions never expire, so a revision is only created once per document (unless the backend evicts it)
+        and only replaced by 'invalidate'.
+
+        Args:
+            object_ids (list[ObjectId | str]): The IDs of the documents.
+
+        Returns:
+            dict: The cache keys keyed by the document IDs.
+        """
+        if not self.revised:
+            return {object_id: self.get_key(object_id) for object_id in object_ids}
+
+        revision_keys = {self.get_revision_key(object_id): object_id for object_id in object_ids}
+        revisions = {revision_keys[key]: value for key, value in cache.get_many(revision_keys).items()}
+        for object_id in object_ids:
+            if object_id not in revisions:
+                revision = randrange(2 ** 62)
+                if not cache.add(self.get_revision_key(object_id), revision, timeout=None):
+                    revision = cache.get(self.get_revision_key(object_id), revision)
+                revisions[object_id] = revision
+        return {object_id: self.get_key(object_id, revisions[object_id]) for object_id in object_ids}
+
+    def _count(self, event: str, number: int = 1) -> None:
+        with self.lock:
+            self.stats[event] += number
+
+    def get(self, object_id: ObjectId | str, load: Callable[[ObjectId | str], Any]) -> Any:
+        """
+        Get the representation of a document, loading and caching it on a miss.
+
+        Args:
+            object_id (ObjectId | str): The ID of the document, or the key of a query result.
+            load (Callable): The function reading the representation from the database,
+                returning None if the document does not exist.
+
+        Returns:
+            The representation of the document, or None if the document does not exist.
+        """
+        key = self.get_keys([object_id])[object_id]
+        data = cache.get(key, version=self.version)
+        if data is not None:
+            self._count('hits')
+            return data
+
+        self._count('misses')
+        data = load(object_id)
+        if data is not None:
+            cache.set(key, data, version=self.version)
+        return data
+
+    def get_many(
+        self, object_ids: list[ObjectId], load: Callable[[list[ObjectId]], dict[ObjectId, Any]]
+    ) -> dict[ObjectId, Any]:
+        """
+        Get the representations of many documents, loading and caching the missing ones with a single call.
+
+        Args:
+            object_ids (list[ObjectId]): The IDs of the documents.
+            load (Callable): The function reading the representations of many documents from the database,
+                keyed by their IDs, without the documents that do not exist.
+
+        Returns:
+            dict: The representations keyed by the document IDs, without the documents that do not exist.
+        """
+        keys = self.get_keys(object_ids)
+        object_ids_by_key = {key: object_id for object_id, key in keys.items()}
+        cached = cache.get_many(object_ids_by_key, version=self.version)
+        data = {object_ids_by_key[key]: value for key, value in cached.items()}
+        missing = [object_id for object_id in object_ids if object_id not in data]
+        self._count('hits', len(data))
+        self._count('misses', len(missing))
+
+        if missing:
+            loaded = load(missing)
+            cache.set_many({keys[object_id]: value for object_id, value in loaded.items()}, version=self.version)
+            data.update(loaded)
+        return data
+
+    def invalidate(self, object_ids: Iterable[ObjectId]) -> None:
+        """
+        Invalidate the cached representations of documents, by replacing their revisions.
+
+        The representations stored under the previous revisions, including those loaded before the write
+        and stored after it, are never read again and expire from the cache.
+
+        Args:
+            object_ids (Iterable[ObjectId]): The IDs of the changed or deleted documents.
+        """
+        if self.revised:
+            revisions = {self.get_revision_key(object_id): randrange(2 ** 62) for object_id in object_ids}
+            if revisions:
+                cache.set_many(revisions, timeout=None)
+            return
+
+        keys = [self.get_key(object_id) for object_id in object_ids]
+        if keys:
+            cache.delete_many(keys, version=self.version)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the hit and miss counters of the worker.
+
+        Returns:
+            dict: The number of hits and misses, and the hit ratio.
+        """
+        with self.lock:
+            hits, misses = self.stats['hits'], self.stats['misses']
+        return {'hits': hits, 'misses': misses, 'hit_ratio': hits / (hits + misses) if hits + misses else None}
+
+
+def get_generation(name: str) -> int:
+    """
+    Get the generation of a collection.
+
+    Args:
+        name (str): The name of the collection.
+
+    Returns:
+        int: The generation, incremented by every write to the collection.
+    """
+    key = f'{name}:generation'
+    generation = cache.get(key)
+    if generation is None:
+        generation = randrange(2 ** 62)
+        if not cache.add(key, generation, timeout=None):
+            generation = cache.get(key, generation)
+    return generation
+
+
+def get_query_key(name: str, uri: str) -> str:
+    """
+    Get the key of a query on a collection, stamped with the current generation of the collection.
+
+    The key identifies the query in flight and its ETag, so a query started before a write is never shared
+    with the requests arriving after the write.
+
+    Args:
+        name (str): The name of the collection.
+        uri (str): The absolute URI of the request.
+
+    Returns:
+        str: The key of the query.
+    """
+    return f'{name}:{get_generation(name)}:{uri}'
+
+
+def bump_generation(name: str) -> None:
+    """
+    Increment the generation of a collection after a write.
+
+    Args:
+        name (str): The name of the collection.
+    """
+    try:
+        cache.incr(f'{name}:generation')
+    except ValueError:
+        cache.add(f'{name}:generation', randrange(2 ** 62), timeout=None)
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    Encode data to JSON, in the compact format of the API responses.
+
+    Args:
+        data (Any): The JSON-compatible data.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+    return dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def join_json(fragments: Iterable[bytes]) -> bytes:
+    """
+    Join encoded JSON fragments into a JSON array.
+
+    Args:
+        fragments (Iterable[bytes]): The encoded JSON values.
+
+    Returns:
+        bytes: The encoded JSON array.
+    """
+    return b'[' + b','.join(fragments) + b']'
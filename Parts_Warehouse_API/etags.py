@@ -0,0 +1,64 @@
+"""
+This module implements the entity tags (ETags) of the read endpoints and the conditional GET requests.
+
+A client sends the ETag of its copy in the 'If-None-Match' header, and the response is 304 Not Modified
+without a body if the ETag is still current. The ETags are computed before the responses, from the cache:
+
+- The ETag of a document is the SHA-1 of its cached JSON, which is also the body of the response,
+  so it changes with every write to the document.
+- The ETag of a list or search is derived from the generation of the collection and the URI of the request,
+  so it changes with every write to the collection and is computed without reading the database.
+"""
+from hashlib import sha1
+from typing import Callable
+
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+
+def get_content_etag(content: bytes) -> str:
+    """
+    Get the ETag of an encoded document.
+
+    Args:
+        content (bytes): The encoded document.
+
+    Returns:
+        str: The strong ETag, quoted.
+    """
+    return quote_etag(sha1(content).hexdigest())
+
+
+def get_key_etag(key: str) -> str:
+    """
+    Get the ETag of a list or search, from its key stamped with the generation of its collection.
+
+    Args:
+        key (str): The key of the query, from 'get_query_key' or 'parts.cache.get_search_key'.
+
+    Returns:
+        str: The strong ETag, quoted.
+    """
+    return quote_etag(sha1(key.encode('utf-8')).hexdigest())
+
+
+def conditional_response(
+    request: HttpRequest, etag: str, get_response: Callable[[], HttpResponseBase]
+) -> HttpResponseBase:
+    """
+    Answer a conditional request, or get the response if the client's copy is not current.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        etag (str): The current ETag of the resource, quoted.
+        get_response (Callable): The function getting the response, only called if the client's copy is not current.
+
+    Returns:
+        HttpResponseBase: The 304 Not Modified response, or the response with the ETag header.
+    """
+    response = get_conditional_response(request, etag=etag) or get_response()
+    if request.method in ('GET', 'HEAD') and response.status_code in (200, 304):
+        response.setdefault('ETag', etag)
+    return response
@@ -0,0 +1,66 @@
+"""
+This module implements the sparse fieldsets of the list endpoints.
+
+The 'fields' query parameter selects the fields returned for each item (e.g. 'fields=name,quantity').
+The '_id' is always returned. The selection is pushed down to the database, with '.only()' for the
+querysets or a projection for the pymongo queries, so the fields that are not returned are never read.
+"""
+from django.db.models import Model
+from django.http import QueryDict
+from rest_framework import serializers
+
+
+def get_fieldset(params: QueryDict, model: type[Model]) -> list[str] | None:
+    """
+    Parse the 'fields' query parameter.
+
+    Args:
+        params (QueryDict): The query parameters of the request.
+        model (type[Model]): The model of the listed items.
+
+    Returns:
+        list[str]: The selected field names, starting with '_id', or None if all fields are requested.
+
+    Raises:
+        serializers.ValidationError: If a selected field is not a field of the model.
+    """
+    if 'fields' not in params:
+        return None
+
+    fields = [field for field in params['fields'].split(',') if field]
+    fields_name = [field.name for field in model._meta.concrete_fields]
+    invalid_fields = [field for field in fields if field not in fields_name]
+    if invalid_fields:
+        raise serializers.ValidationError(
+            {'error': f'Invalid fields: {", ".join(invalid_fields)}. Allowed fields: {", ".join(fields_name)}.'}
+        )
+    return list(dict.fromkeys(['_id', *fields]))
+
+
+def get_projection(fields: list[str] | None) -> dict[str, int] | None:
+    """
+    Get the MongoDB projection of a fieldset.
+
+    Args:
+        fields (list[str]): The selected field names, or None if all fields are requested.
+
+    Returns:
+        dict: The projection document, or None if all fields are requested.
+    """
+    if fields is None:
+        return None
+    return {field: 1 for field in fields}
+
+
+class SparseFieldsMixin:
+    """
+    Serializer mixin restricting the serialized fields to the 'fields' keyword argument.
+
+    Usage:
+        PartSerializer(parts, many=True, fields=['_id', 'name'])
+    """
+    def __init__(self, *args, fields: list[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
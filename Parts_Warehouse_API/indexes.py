@@ -0,0 +1,199 @@
+"""
+This module manages the MongoDB indexes declared by the apps.
+
+Each app may declare the indexes of its collection in an 'indexes' module, with:
+- MODEL (Model): The model stored in the collection.
+- INDEXES (list[IndexModel]): The pymongo index models, each with an explicit name.
+
+The indexes created by djongo from the model fields (the '_id' index, unique fields and foreign keys)
+are not managed here and are never reported as stale.
+"""
+from importlib import import_module
+from typing import NamedTuple
+
+from django.apps import AppConfig, apps
+from django.db.models import Model
+from django.utils.module_loading import module_has_submodule
+from djongo.models import DjongoManager
+from pymongo import ASCENDING, IndexModel
+
+
+INDEX_OPTIONS = ['unique', 'sparse', 'partialFilterExpression', 'expireAfterSeconds']
+
+
+class IndexDeclaration(NamedTuple):
+    """
+    The indexes declared for the collection of a model.
+    """
+    model: type[Model]
+    indexes: list[IndexModel]
+
+
+class IndexDrift(NamedTuple):
+    """
+    The differences between the declared indexes and the indexes of a collection.
+
+    Attributes:
+        missing (list[IndexModel]): The declared indexes that do not exist.
+        changed (list[IndexModel]): The declared indexes that exist with different keys or options.
+        stale (list[str]): The names of the existing indexes that are not declared.
+    """
+    missing: list[IndexModel]
+    changed: list[IndexModel]
+    stale: list[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.missing or self.changed or self.stale)
+
+
+def get_app_index_declaration(app_config: AppConfig) -> IndexDeclaration | None:
+    """
+    Get the indexes declared in the 'indexes' module of an app.
+
+    Args:
+        app_config (AppConfig): The configuration of the app.
+
+    Returns:
+        IndexDeclaration: The declared indexes, or None if the app does not declare any.
+    """
+    if not module_has_submodule(app_config.module, 'indexes'):
+        return None
+    module = import_module(f'{app_config.name}.indexes')
+    return IndexDeclaration(module.MODEL, module.INDEXES)
+
+
+def get_index_declarations() -> list[IndexDeclaration]:
+    """
+    Get the indexes declared by all installed apps.
+
+    Returns:
+        list[IndexDeclaration]: The declared indexes per collection.
+    """
+    declarations = [get_app_index_declaration(app_config) for app_config in apps.get_app_configs()]
+    return [declaration for declaration in declarations if declaration is not None]
+
+
+def get_manager(model: type[Model], using: str = 'default') -> DjongoManager:
+    """
+    Get the manager of a model bound to a database, giving access to the pymongo collection methods.
+
+    Args:
+        model (type[Model]): The model with a 'DjongoManager' as default manager.
+        using (str): The alias of the database.
+
+    Returns:
+        DjongoManager: The manager of the model.
+    """
+    return model._default_manager.db_manager(using)
+
+
+def get_model_index_keys(model: type[Model]) -> list[list[tuple[str, int]]]:
+    """
+    Get the keys of the indexes created by djongo from the model fields.
+
+    Args:
+        model (type[Model]): The model.
+
+    Returns:
+        list: The keys of the indexes on the unique and foreign key columns.
+    """
+    return [
+        [(field.column, ASCENDING)]
+        for field in model._meta.concrete_fields
+        if not field.primary_key and (field.unique or field.is_relation)
+    ]
+
+
+def _index_matches(declared: dict, existing: dict) -> bool:
+    if 'text' in declared['key'].values():
+        # Text indexes are stored with internal keys, so they are compared by their weighted fields.
+        weights = {field: 1 for field, kind in declared['key'].items() if kind == 'text'}
+        weights.update(declared.get('weights', {}))
+        if existing.get('weights') != weights:
+            return False
+    elif list(declared['key'].items()) != [(field, kind) for field, kind in existing['key']]:
+        return False
+
+    return all(declared.get(option) == existing.get(option) for option in INDEX_OPTIONS)
+
+
+def get_index_drift(model: type[Model], indexes: list[IndexModel], using: str = 'default') -> IndexDrift:
+    """
+    Compare the declared indexes with the indexes of the collection.
+
+    Args:
+        model (type[Model]): The model stored in the collection.
+        indexes (list[IndexModel]): The declared indexes.
+        using (str): The alias of the database.
+
+    Returns:
+        IndexDrift: The missing, changed and stale indexes.
+    """
+    existing = get_manager(model, using).mongo_index_information()
+    declared = {index.document['name']: index for index in indexes}
+    model_index_keys = get_model_index_keys(model)
+
+    missing, changed = [], []
+    for name, index in declared.items():
+        if name not in existing:
+            missing.append(index)
+        elif not _index_matches(index.document, existing[name]):
+            changed.append(index)
+
+    stale = [
+        name for name, info in existing.items()
+        if name not in declared and name != '_id_' and list(info['key']) not in model_index_keys
+    ]
+    return IndexDrift(missing, changed, stale)
+
+
+def create_indexes(model: type[Model], indexes: list[IndexModel], using: str = 'default') -> None:
+    """
+    Create indexes on the collection of a model in the background.
+
+    Args:
+        model (type[Model]): The model stored in the collection.
+        indexes (list[IndexModel]): The indexes to create.
+        using (str): The alias of the database.
+    """
+    if indexes:
+        background_indexes = [
+            IndexModel(
+                list(index.document['key'].items()),
+                background=True,
+                **{option: value for option, value in index.document.items() if option not in ['key', 'background']}
+            )
+            for index in indexes
+        ]
+        get_manager(model, using).mongo_create_indexes(background_indexes)
+
+
+def create_missing_indexes(sender: AppConfig, using: str = 'default', **kwargs) -> None:
+    """
+    Create the declared indexes of an app that do not exist yet.
+
+    This function is connected to the 'post_migrate' signal of the apps declaring indexes.
+
+    Args:
+        sender (AppConfig): The configuration of the migrated app.
+        using (str): The alias of the database.
+        **kwargs: Arbitrary keyword arguments sent with the signal.
+    """
+    declaration = get_app_index_declaration(sender)
+    if declaration is not None:
+        drift = get_index_drift(declaration.model, declaration.indexes, using)
+        create_indexes(declaration.model, drift.missing, using)
+
+
+def drop_indexes(model: type[Model], names: list[str], using: str = 'default') -> None:
+    """
+    Drop indexes from the collection of a model.
+
+    Args:
+        model (type[Model]): The model stored in the collection.
+        names (list[str]): The names of the indexes to drop.
+        using (str): The alias of the database.
+    """
+    manager = get_manager(model, using)
+    for name in names:
+        manager.mongo_drop_index(name)
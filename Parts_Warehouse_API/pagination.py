@@ -0,0 +1,92 @@
+"""
+This module defines the keyset (cursor) pagination used by the list endpoints.
+
+The list and search endpoints also report the total number of matching items in the 'X-Total-Count'
+header, and return only that number when the 'count_only' query parameter is set.
+"""
+from bson import ObjectId
+from django.http import HttpResponse, QueryDict
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+from .cache import encode_json
+
+
+TOTAL_COUNT_HEADER = 'X-Total-Count'
+
+
+def is_count_only(params: QueryDict) -> bool:
+    """
+    Check whether the request only asks for the number of matching items.
+
+    Args:
+        params (QueryDict): The query parameters of the request.
+
+    Returns:
+        bool: True if the 'count_only' query parameter is '1' or 'true'.
+    """
+    return params.get('count_only', '').lower() in ['1', 'true']
+
+
+def get_counted_response(content: bytes, count: int) -> HttpResponse:
+    """
+    Get the response of a list or search endpoint, with the total number of matching items in the header.
+
+    Args:
+        content (bytes): The encoded JSON content.
+        count (int): The total number of matching items.
+
+    Returns:
+        HttpResponse: The JSON response.
+    """
+    response = HttpResponse(content, content_type='application/json')
+    response[TOTAL_COUNT_HEADER] = count
+    return response
+
+
+class ObjectIdCursorPagination(CursorPagination):
+    """
+    Cursor pagination keyed on the '_id' ObjectId of the documents.
+
+    Each page is resolved as an '_id' range scan ordered by the primary key, so the cost of
+    fetching a page does not depend on how deep the client is in the collection.
+
+    Query parameters:
+    - cursor (str): The opaque cursor returned in the 'next' or 'previous' link.
+    - limit (int): The number of items per page, capped at 'max_page_size'.
+    """
+    ordering = '_id'
+    page_size_query_param = 'limit'
+    max_page_size = 1000
+
+    def decode_cursor(self, request):
+        """
+        Decode the cursor from the request and make sure its position is a valid ObjectId.
+
+        Args:
+            request (Request): The HTTP request object.
+
+        Returns:
+            Cursor: The decoded cursor, or None if the request does not contain one.
+
+        Raises:
+            NotFound: If the cursor is malformed or its position is not a valid ObjectId.
+        """
+        cursor = super().decode_cursor(request)
+        if cursor is not None and cursor.position is not None and not ObjectId.is_valid(cursor.position):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def get_encoded_page(self, results: bytes) -> bytes:
+        """
+        Encode the page with its results already encoded to JSON.
+
+        Args:
+            results (bytes): The encoded JSON array of the items on the page.
+
+        Returns:
+            bytes: The encoded page, with the same content as the response of 'get_paginated_response'.
+        """
+        return b'{"next":%s,"previous":%s,"results":%s}' % (
+            encode_json(self.get_next_link()), encode_json(self.get_previous_link()), results
+        )
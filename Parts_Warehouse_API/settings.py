@@ -49,6 +49,7 @@ INSTALLED_APPS = [
 
     'categories.apps.CategoriesConfig',
     'parts.apps.PartsConfig',
+    'reservations.apps.ReservationsConfig',
 ]
 
 MIDDLEWARE = [
@@ -153,8 +154,48 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
-    ]
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'Parts_Warehouse_API.pagination.ObjectIdCursorPagination',
+    'PAGE_SIZE': 100,
 }
 
+# Cache of the parts and categories served by the detail endpoints. The local memory cache of each worker
+# is used by default and evicts the least recently used entries beyond 'CACHE_MAX_ENTRIES'. In production,
+# a cache shared by the workers is set with 'CACHE_BACKEND' and 'CACHE_LOCATION'
+# (e.g. 'django.core.cache.backends.memcached.PyLibMCCache' and '127.0.0.1:11211').
+# The entries expire after 'CACHE_TIMEOUT' seconds.
+CACHE_BACKEND = getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': getenv('CACHE_LOCATION', ''),
+        'TIMEOUT': int(getenv('CACHE_TIMEOUT', '300')),
+    }
+}
+if 'memcached' not in CACHE_BACKEND:
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': int(getenv('CACHE_MAX_ENTRIES', '10000'))}
+
+# Coalescing of the identical concurrent reads of the list and search endpoints. The requests are always
+# coalesced within a worker. With 'SINGLE_FLIGHT_SHARED', they are also coalesced across the workers with a lock
+# in the cache, which requires a cache shared by the workers. A worker waits at most 'SINGLE_FLIGHT_TIMEOUT'
+# seconds for the result of another worker before computing it itself.
+SINGLE_FLIGHT_SHARED = getenv('SINGLE_FLIGHT_SHARED', 'False') == 'True'
+SINGLE_FLIGHT_TIMEOUT = float(getenv('SINGLE_FLIGHT_TIMEOUT', '5'))
+
+# Engine used by the parts search endpoint: 'orm' (Django ORM through djongo) or 'mongo' (native pymongo query).
+# It can be overridden per request with the 'engine' query parameter.
+PARTS_SEARCH_ENGINE = getenv('PARTS_SEARCH_ENGINE', 'orm')
+
+# Write-behind of the stock increments: the increments are buffered per part in each worker and flushed
+# as a single bulk write every 'PARTS_STOCK_FLUSH_INTERVAL' seconds, or as soon as the buffer holds
+# 'PARTS_STOCK_BUFFER_SIZE' parts. The decrements, and all movements when disabled, are written immediately.
+PARTS_STOCK_WRITE_BEHIND = getenv('PARTS_STOCK_WRITE_BEHIND', 'False') == 'True'
+PARTS_STOCK_FLUSH_INTERVAL = float(getenv('PARTS_STOCK_FLUSH_INTERVAL', '0.05'))
+PARTS_STOCK_BUFFER_SIZE = int(getenv('PARTS_STOCK_BUFFER_SIZE', '1000'))
+
+# Lifetime in seconds of the stock reservations, by default and at most when requested by the client.
+RESERVATIONS_TTL = int(getenv('RESERVATIONS_TTL', '300'))
+RESERVATIONS_MAX_TTL = int(getenv('RESERVATIONS_MAX_TTL', '3600'))
+
 
 TEST_RUNNER = "conftest.DatabaseConnectionCleanupTestRunner"
@@ -0,0 +1,131 @@
+"""
+This module implements the coalescing of identical concurrent reads ("single flight").
+
+The first request for a key computes the result, and the identical requests arriving while it is in flight
+wait for it and share its result instead of running the same queries. Within a worker (with threads),
+the requests wait on an event. With the 'SINGLE_FLIGHT_SHARED' setting, the workers also coordinate
+through a lock in the cache: the worker holding the lock computes the result and stores it in the cache,
+where the other workers poll for it. If the result is not available after 'SINGLE_FLIGHT_TIMEOUT' seconds,
+the waiting worker computes it itself.
+
+The results are only shared by the requests in flight at the same time and are never served afterwards.
+"""
+from hashlib import sha1
+from threading import Event, Lock
+from time import monotonic, sleep
+from typing import Any, Callable
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+POLL_INTERVAL = 0.01
+
+
+class Flight:
+    """
+    A computation in flight, shared by the requests of a worker.
+
+    Attributes:
+        done (Event): Set when the computation is finished.
+        result (Any): The result of the computation.
+        error (Exception): The error raised by the computation, if any.
+    """
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalescing of the identical concurrent computations, keyed by a string.
+
+    Attributes:
+        shared (bool): Whether the computations are also coalesced across the workers, with a lock in the cache.
+        timeout (float): The maximum time in seconds a worker waits for the result computed by another worker.
+    """
+    def __init__(self, shared: bool, timeout: float):
+        self.shared = shared
+        self.timeout = timeout
+        self.flights = {}
+        self.lock = Lock()
+
+    def do(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Compute a result, or wait for the identical computation in flight and share its result.
+
+        Args:
+            key (str): The key identifying the computation.
+            compute (Callable): The function computing the result. With the shared mode, the result must be
+                picklable.
+
+        Returns:
+            Any: The result of the computation.
+
+        Raises:
+            Exception: The error raised by the computation, in the request that ran it and in the waiting requests.
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self.run(key, compute) if self.shared else compute()
+        except Exception as error:
+            flight.error = error
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+        return flight.result
+
+    def run(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Compute a result, or wait for the identical computation of another worker and take its result.
+
+        The lock in the cache holds a token identifying the computation, and the result is stored under this token,
+        so a worker only takes the result of the computation that was in flight when it arrived.
+
+        Args:
+            key (str): The key identifying the computation.
+            compute (Callable): The function computing the result.
+
+        Returns:
+            Any: The result of the computation.
+        """
+        lock_key = f'single_flight:{sha1(key.encode("utf-8")).hexdigest()}'
+        token = uuid4().hex
+        leader_token = None
+        deadline = monotonic() + self.timeout
+        while True:
+            if leader_token is not None:
+                result = cache.get(f'{lock_key}:{leader_token}')
+                if result is not None:
+                    return result
+            if cache.add(lock_key, token, timeout=self.timeout):
+                break
+            leader_token = cache.get(lock_key, leader_token)
+            if monotonic() >= deadline:
+                return compute()
+            sleep(POLL_INTERVAL)
+
+        try:
+            result = compute()
+            cache.set(f'{lock_key}:{token}', result, timeout=self.timeout)
+            return result
+        finally:
+            cache.delete(lock_key)
+
+
+single_flight = SingleFlight(settings.SINGLE_FLIGHT_SHARED, settings.SINGLE_FLIGHT_TIMEOUT)
@@ -8,12 +8,22 @@ These patterns include the following endpoints:
 
 - 'parts/':
     - Include the URL patterns for the 'parts' app.
+
+- 'reservations/':
+    - Include the URL patterns for the 'reservations' app.
+
+- 'cache/stats/':
+    - GET: Retrieve the hit and miss counters of the document caches.
 """
 from django.contrib import admin
 from django.urls import path, include
 
+from .views import CacheStats
+
 
 urlpatterns = [
     path('categories/', include('categories.urls')),
     path('parts/', include('parts.urls')),
+    path('reservations/', include('reservations.urls')),
+    path('cache/stats/', CacheStats.as_view(), name='cache_stats'),
 ]
@@ -0,0 +1,26 @@
+from django.http import HttpRequest
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .cache import document_caches
+
+
+class CacheStats(APIView):
+    """
+    API view for retrieving the counters of the document caches.
+
+    GET:
+    Retrieve the number of hits and misses and the hit ratio of each document cache,
+    counted by the worker serving the request since it started.
+    """
+    def get(self, request: HttpRequest) -> Response:
+        """
+        Retrieve the counters of the document caches.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: Response with the counters of each cache, keyed by the name of the cache.
+        """
+        return Response({name: document_cache.get_stats() for name, document_cache in document_caches.items()})
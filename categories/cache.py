@@ -0,0 +1,59 @@
+"""
+This module defines the read-through cache of the categories served by the 'CategoryDetails' view.
+
+The categories are cached encoded to JSON. The version of the cache is 'CATEGORY_JSON_VERSION',
+to be bumped when the representation changes.
+
+Every write to the 'categories' collection calls 'invalidate_categories' with the IDs of the written categories,
+which also increments the generation of the collection.
+"""
+from typing import Iterable
+
+from bson import ObjectId
+
+from .models import Category
+from .serializers import CategorySerializer
+from Parts_Warehouse_API.cache import DocumentCache, bump_generation, encode_json
+
+
+CATEGORY_JSON_VERSION = 1
+
+category_cache = DocumentCache('categories', CATEGORY_JSON_VERSION)
+
+
+def load_category(object_id: ObjectId) -> bytes | None:
+    """
+    Read a category from the database and encode it to JSON.
+
+    Args:
+        object_id (ObjectId): The ID of the category.
+
+    Returns:
+        bytes: The encoded category, or None if the category does not exist.
+    """
+    category = Category.objects.filter(pk=object_id).first()
+    return encode_json(CategorySerializer(category).data) if category else None
+
+
+def get_cached_category(object_id: ObjectId) -> bytes | None:
+    """
+    Get a category encoded to JSON from the cache, or from the database on a miss.
+
+    Args:
+        object_id (ObjectId): The ID of the category.
+
+    Returns:
+        bytes: The encoded category, or None if the category does not exist.
+    """
+    return category_cache.get(object_id, load_category)
+
+
+def invalidate_categories(object_ids: Iterable[ObjectId]) -> None:
+    """
+    Invalidate the cached categories and lists after a write.
+
+    Args:
+        object_ids (Iterable[ObjectId]): The IDs of the created, changed or deleted categories.
+    """
+    category_cache.invalidate(object_ids)
+    bump_generation(Category._meta.db_table)
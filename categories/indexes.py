@@ -0,0 +1,16 @@
+"""
+This module declares the MongoDB indexes of the 'categories' collection.
+
+The indexes are created after migrations and can be verified with the 'sync_indexes' management command.
+"""
+from pymongo import ASCENDING, IndexModel
+
+from .models import Category
+
+
+MODEL = Category
+
+INDEXES = [
+    # Used by the duplicate check of the category serializer, which filters by 'name' and 'parent_id'.
+    IndexModel([('parent_id', ASCENDING), ('name', ASCENDING)], name='parent_name'),
+]
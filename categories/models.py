@@ -14,6 +14,10 @@ class Category(models.Model):
     - name (CharField): The name of the category.
     - parent_id (ForeignKey): The foreign key reference to the parent category, allowing for hierarchical structure.
 
+    Manager:
+        objects (DjongoManager): The default manager, which also exposes the pymongo collection methods
+        prefixed with 'mongo_' (e.g. 'Category.objects.mongo_find()').
+
     Meta:
         db_table (str): The database table name for the 'Category' model.
     """
@@ -22,5 +26,7 @@ class Category(models.Model):
     parent_id = models.ForeignKey('self', on_delete=models.PROTECT,
                                   null=True, blank=True, db_column='parent_id')
 
+    objects = djongo_models.DjongoManager()
+
     class Meta:
         db_table = 'categories'
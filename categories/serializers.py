@@ -6,12 +6,15 @@ from typing import Any
 from rest_framework import serializers
 
 from .models import Category
+from Parts_Warehouse_API.fieldsets import SparseFieldsMixin
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the 'Category' model.
 
+    The 'fields' keyword argument restricts the serialized fields (see 'SparseFieldsMixin').
+
     Methods:
         to_representation(instance): Converts the model instance to a Python dictionary for serialization.
         validate(attrs): Performs validation checks on the provided attributes before saving.
@@ -26,6 +29,7 @@ class CategorySerializer(serializers.ModelSerializer):
 
         Overrides the default behavior to include string representations of the '_id'
         and 'parent_id' fields in the serialized data for improved readability.
+        The 'parent_id' is taken from the stored column, so the parent category is never fetched.
 
         Args:
             instance: The model instance to be serialized.
@@ -37,8 +41,8 @@ class CategorySerializer(serializers.ModelSerializer):
 
         if instance._id:
             rep['_id'] = str(instance._id)
-        if instance.parent_id:
-            rep['parent_id'] = str(instance.parent_id._id)
+        if 'parent_id' in rep and instance.parent_id_id:
+            rep['parent_id'] = str(instance.parent_id_id)
         return rep
 
     def validate(self, attrs: Any) -> dict:
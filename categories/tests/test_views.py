@@ -1,6 +1,8 @@
 """
 This module contains unit test cases for testing the API views related to category management.
 """
+import json
+
 import pytest
 
 from rest_framework import status
@@ -30,14 +32,15 @@ class TestCategoriesList(APITestCase):
         """
         # we create 6 objects because for each side category we create new main category
         SideCategoryFactory.create_batch(3)
-        categories = Category.objects.all()
+        categories = Category.objects.order_by('_id')
 
         request = self.factory.get('/categories/')
         response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 6
-        assert response.data == CategorySerializer(categories, many=True).data
+        assert len(data['results']) == 6
+        assert data['results'] == CategorySerializer(categories, many=True).data
 
     def test_get_categories_no_results(self):
         """
@@ -45,9 +48,87 @@ class TestCategoriesList(APITestCase):
         """
         request = self.factory.get('/categories/')
         response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(data['results']) == 0
+
+    def test_get_categories_pages(self):
+        """
+        Test walking through the list of categories with the cursor from the 'next' link.
+        """
+        SideCategoryFactory.create_batch(2)
+        categories = CategorySerializer(Category.objects.order_by('_id'), many=True).data
+
+        request = self.factory.get('/categories/', {'limit': 3})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert len(data['results']) == 3
+        assert data['next'] is not None
+
+        request = self.factory.get(data['next'])
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert len(data['results']) == 1
+        assert data['next'] is None
+        assert data['results'] == categories[3:]
+
+    def test_get_categories_count_only(self):
+        """
+        Test retrieving only the number of categories, also returned in the header.
+        """
+        SideCategoryFactory.create_batch(2)
+
+        request = self.factory.get('/categories/', {'count_only': 'true'})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data == {'count': 4}
+        assert response['X-Total-Count'] == '4'
+
+    def test_get_categories_with_fields(self):
+        """
+        Test retrieving a list of categories with a subset of their fields.
+        """
+        category = MainCategoryFactory()
+
+        request = self.factory.get('/categories/', {'fields': 'name'})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data['results'] == [{'_id': str(category._id), 'name': category.name}]
+
+    def test_get_categories_not_modified(self):
+        """
+        Test revalidating a page of categories with its ETag, before and after a category is created.
+        """
+        MainCategoryFactory()
+        etag = self.view(self.factory.get('/categories/'))['ETag']
+
+        response = self.view(self.factory.get('/categories/', HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+
+        self.view(self.factory.post('/categories/', {'name': 'New Category'}, format='json'))
+        response = self.view(self.factory.get('/categories/', HTTP_IF_NONE_MATCH=etag))
+        data = json.loads(response.content.decode('utf-8'))
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 0
+        assert len(data['results']) == 2
+
+    def test_get_categories_with_wrong_fields(self):
+        """
+        Test retrieving a list of categories with a field that does not exist.
+        """
+        request = self.factory.get('/categories/', {'fields': 'wrong_field'})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_successfully_create_category_without_parent(self):
         """
@@ -101,11 +182,43 @@ class TestCategoryDetails(APITestCase):
         """
         request = self.factory.get(f'categories/{self.side_category._id}/')
         response = self.view(request, object_id=self.side_category._id)
+        data = json.loads(response.content.decode('utf-8'))
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data.get('_id') == str(self.side_category._id)
-        assert response.data.get('name') == self.side_category.name
-        assert response.data.get('parent_id') == str(self.side_category.parent_id._id)
+        assert data.get('_id') == str(self.side_category._id)
+        assert data.get('name') == self.side_category.name
+        assert data.get('parent_id') == str(self.side_category.parent_id._id)
+
+    def test_get_category_details_not_modified(self):
+        """
+        Test revalidating the details of a category with its ETag, before and after an update.
+        """
+        object_id = self.side_category._id
+        etag = self.view(self.factory.get(f'categories/{object_id}/'), object_id=object_id)['ETag']
+
+        response = self.view(self.factory.get(f'categories/{object_id}/', HTTP_IF_NONE_MATCH=etag), object_id=object_id)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert response.content == b''
+
+        self.view(self.factory.put(f'categories/{object_id}/', {'name': 'NewName'}, format='json'), object_id=object_id)
+        response = self.view(self.factory.get(f'categories/{object_id}/', HTTP_IF_NONE_MATCH=etag), object_id=object_id)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_get_category_details_after_update(self):
+        """
+        Test retrieving the updated details of a category after reading the cached details.
+        """
+        object_id = self.side_category._id
+        self.view(self.factory.get(f'categories/{object_id}/'), object_id=object_id)
+        self.view(self.factory.put(f'categories/{object_id}/', {'name': 'NewName'}, format='json'), object_id=object_id)
+
+        response = self.view(self.factory.get(f'categories/{object_id}/'), object_id=object_id)
+
+        assert json.loads(response.content.decode('utf-8')).get('name') == 'NewName'
 
     def test_update_name_category(self):
         """
@@ -1,12 +1,19 @@
 from django.db.models.deletion import ProtectedError
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import status
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .cache import get_cached_category, invalidate_categories
 from .models import Category
 from .serializers import CategorySerializer
+from Parts_Warehouse_API.cache import encode_json, get_query_key
+from Parts_Warehouse_API.etags import conditional_response, get_content_etag, get_key_etag
+from Parts_Warehouse_API.fieldsets import get_fieldset
+from Parts_Warehouse_API.pagination import ObjectIdCursorPagination, get_counted_response, is_count_only
+from Parts_Warehouse_API.singleflight import single_flight
 from Parts_Warehouse_API.validators import valid_object_id
 
 
@@ -15,28 +22,70 @@ class CategoriesList(APIView):
     API view for listing and creating categories.
 
     GET:
-    List all categories.
+    List all categories, one page at a time.
 
     POST:
     Create a new category.
 
+    The list is paginated with a cursor keyed on '_id'. The 'limit' query parameter sets the page size
+    and the 'next' link of the response points to the following page.
+    The 'fields' query parameter (a comma-separated list of field names) selects the returned fields,
+    which are the only fields read from the database.
+    The total number of categories, taken from the collection metadata, is returned in the 'X-Total-Count' header.
+    With the 'count_only' query parameter, only this number is returned.
+    The identical pages requested concurrently are read once and shared (see 'Parts_Warehouse_API.singleflight').
+    The ETag of the pages is derived from the generation of the categories, so a client revalidating its copy
+    with 'If-None-Match' gets 304 Not Modified without reading the database until a category is written.
+
     If the request includes 'parent_id', it associates the new category with the specified parent category.
     The 'parent_id' is used to determine the parent category, and it should be a valid ObjectId.
     If the 'parent_id' is not provided or invalid, the new category will be created as a top-level category.
     """
-    def get(self, request: HttpRequest) -> Response:
+    pagination_class = ObjectIdCursorPagination
+
+    def get(self, request: HttpRequest) -> HttpResponse:
         """
-        Retrieve a list of all categories.
+        Retrieve a page of categories.
 
         Args:
             request (HttpRequest): The HTTP request object.
 
         Returns:
-            Response: Response with the serialized category data.
+            HttpResponse: Response with the serialized category data of the page
+            and the links to the next and previous pages, or with the number of categories,
+            or 304 Not Modified response if the client's copy is current.
         """
-        categories = Category.objects.all()
-        serializer = CategorySerializer(categories, many=True)
-        return Response(serializer.data)
+        fields = get_fieldset(request.query_params, Category)
+        key = get_query_key(Category._meta.db_table, request.build_absolute_uri())
+
+        def get_response() -> HttpResponse:
+            content, count = single_flight.do(key, lambda: self.get_page(request, fields))
+            return get_counted_response(content, count)
+
+        return conditional_response(request, get_key_etag(key), get_response)
+
+    def get_page(self, request: HttpRequest, fields: list[str] | None) -> tuple[bytes, int]:
+        """
+        Read and encode a page of categories, or their number.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            fields (list[str]): The fields to return, or None for all fields.
+
+        Returns:
+            tuple: The encoded page (or number of categories) and the total number of categories.
+        """
+        count = Category.objects.mongo_estimated_document_count()
+        if is_count_only(request.query_params):
+            return encode_json({'count': count}), count
+
+        queryset = Category.objects.all()
+        if fields:
+            queryset = queryset.only(*fields)
+        paginator = self.pagination_class()
+        categories = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = CategorySerializer(categories, many=True, fields=fields)
+        return paginator.get_encoded_page(encode_json(serializer.data)), count
 
     def post(self, request: HttpRequest) -> Response:
         """
@@ -58,7 +107,8 @@ class CategoriesList(APIView):
 
         serializer = CategorySerializer(data=data)
         if serializer.is_valid():
-            serializer.save()
+            category = serializer.save()
+            invalidate_categories([category._id])
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -76,13 +126,17 @@ class CategoryDetails(APIView):
     DELETE:
     Delete a specific category.
 
+    The category is retrieved from a read-through cache, invalidated by the updates and the deletion of the category.
+    Its ETag is the hash of its cached JSON, so a client revalidating its copy with 'If-None-Match'
+    gets 304 Not Modified until the category changes.
+
     If the request includes 'parent_id' in the PUT method, it associates the updated category with the specified parent category.
     The 'parent_id' is used to determine the parent category, and it should be a valid ObjectId.
 
     If the DELETE operation fails due to references by other objects, a 400 Bad Request response is returned
     with an error message indicating that the category cannot be deleted because it is referenced by other objects.
     """
-    def get(self, request: HttpRequest, object_id: str) -> Response:
+    def get(self, request: HttpRequest, object_id: str) -> HttpResponse:
         """
         Retrieve details of a specific category.
 
@@ -91,11 +145,18 @@ class CategoryDetails(APIView):
             object_id (str): The ID of the category.
 
         Returns:
-            Response: Response with the serialized category data.
+            HttpResponse: Response with the serialized category data,
+            or 304 Not Modified response if the client's copy is current.
+
+        Raises:
+            NotFound: If the category does not exist.
         """
-        category = get_object_or_404(Category, pk=valid_object_id(object_id))
-        serializer = CategorySerializer(category)
-        return Response(serializer.data)
+        category = get_cached_category(valid_object_id(object_id))
+        if category is None:
+            raise NotFound()
+        return conditional_response(
+            request, get_content_etag(category), lambda: HttpResponse(category, content_type='application/json')
+        )
 
     def put(self, request: HttpRequest, object_id: str) -> Response:
         """
@@ -126,6 +187,7 @@ class CategoryDetails(APIView):
         serializer = CategorySerializer(category, data=data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            invalidate_categories([category._id])
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -140,9 +202,11 @@ class CategoryDetails(APIView):
         Returns:
             Response: Response with the status of the delete operation.
         """
-        category = get_object_or_404(Category, pk=valid_object_id(object_id))
+        object_id = valid_object_id(object_id)
+        category = get_object_or_404(Category, pk=object_id)
         try:
             category.delete()
+            invalidate_categories([object_id])
             return Response(status=status.HTTP_204_NO_CONTENT)
         except ProtectedError:
             return Response(
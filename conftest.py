@@ -1,3 +1,7 @@
+from unittest import TextTestResult
+
+import pytest
+from django.core.cache import cache
 from django.test.runner import DiscoverRunner
 
 
@@ -8,3 +12,24 @@ class DatabaseConnectionCleanupTestRunner(DiscoverRunner):
         to prevent the database error from being raised during the execution tests of the
         application.
         """
+
+    def get_resultclass(self):
+        """
+        Get the result class of the tests, clearing the cache before each test like the 'clear_cache' fixture.
+        """
+        resultclass = super().get_resultclass() or TextTestResult
+
+        class CacheClearingTestResult(resultclass):
+            def startTest(self, test):
+                cache.clear()
+                super().startTest(test)
+
+        return CacheClearingTestResult
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start each test with an empty cache, since the cached documents outlive the test database.
+    """
+    cache.clear()
@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+from Parts_Warehouse_API.indexes import create_missing_indexes
 
 
 class PartsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'parts'
+
+    def ready(self):
+        post_migrate.connect(create_missing_indexes, sender=self)
@@ -0,0 +1,478 @@
+"""
+This module implements the bulk operations of the 'PartsBulk' view.
+
+The rows of a bulk request are validated together, so the related categories are fetched with a single
+query for the whole batch, and the valid rows are written with a single MongoDB command.
+Each row is reported separately by its index in the request, so one invalid row does not reject the batch.
+"""
+from itertools import islice
+from typing import Any
+
+from bson import ObjectId
+from django.core.exceptions import ValidationError
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from rest_framework import serializers
+
+from .cache import get_cached_parts_json, invalidate_parts
+from .models import Part, LOCATION_FIELDS
+from .search import RESERVED_PARAMS, MongoSearchEngine
+from .serializers import part_document_representation
+from categories.models import Category
+from Parts_Warehouse_API.cache import encode_json, join_json
+from Parts_Warehouse_API.fieldsets import get_projection
+
+
+MAX_BULK_SIZE = 1000
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def split_location(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Move the keys of a row that are not fields of the 'Part' model into its 'location' field.
+
+    Args:
+        data (dict): The row from the request.
+
+    Returns:
+        dict: The row with the extra keys moved into 'location'.
+    """
+    fields_name = [field.name for field in Part._meta.get_fields()]
+    row = {key: value for key, value in data.items() if key in fields_name}
+    location = {key: value for key, value in data.items() if key not in fields_name}
+    if location:
+        row['location'] = {**(row.get('location') or {}), **location}
+    return row
+
+
+def get_categories_parent(category_ids: list[ObjectId]) -> dict[ObjectId, ObjectId | None]:
+    """
+    Fetch the parents of the categories referenced by a batch with a single query.
+
+    Args:
+        category_ids (list[ObjectId]): The ids of the categories.
+
+    Returns:
+        dict: The 'parent_id' of each existing category, keyed by the category id.
+    """
+    if not category_ids:
+        return {}
+    documents = Category.objects.mongo_find({'_id': {'$in': list(set(category_ids))}}, {'parent_id': 1})
+    return {document['_id']: document.get('parent_id') for document in documents}
+
+
+def validate_category(category_id: ObjectId, parents: dict[ObjectId, ObjectId | None]) -> list[str]:
+    """
+    Validate that a category exists and is not a base category.
+
+    Args:
+        category_id (ObjectId): The id of the category.
+        parents (dict): The parents of the categories of the batch, from 'get_categories_parent'.
+
+    Returns:
+        list[str]: The validation errors, empty if the category is valid.
+    """
+    if category_id not in parents:
+        return ['Category not found.']
+    if parents[category_id] is None:
+        return ['Cannot add data to a base category.']
+    return []
+
+
+def validate_part_document(data: dict[str, Any], exclude: list[str] | None = None) -> dict[str, Any]:
+    """
+    Validate the fields of a row against the 'Part' model and convert it to a 'parts' document.
+
+    The category is not validated here, since it is checked against the categories fetched for the whole batch.
+
+    Args:
+        data (dict): The row with the model fields.
+        exclude (list[str]): The fields that are not validated.
+
+    Returns:
+        dict: The document with the values converted to the stored types.
+
+    Raises:
+        ValidationError: If a field is invalid or the location contains a key that is not allowed.
+    """
+    exclude = ['_id', 'category_id', *(exclude or [])]
+    location = data.get('location')
+    part = Part(**{key: value for key, value in data.items() if key != 'category_id'})
+    try:
+        # djongo cannot clean a location that is not a dict, so it is checked separately.
+        part.clean_fields(exclude=[*exclude, 'location'] if not isinstance(location, dict) else exclude)
+        errors = {}
+    except ValidationError as error:
+        errors = error.message_dict
+
+    if 'location' in data and not isinstance(location, dict):
+        errors['location'] = ['The location must be an object.']
+    elif location is None and 'location' not in exclude:
+        errors['location'] = ['This field is required.']
+    elif location:
+        invalid_keys = [key for key in location if key not in LOCATION_FIELDS]
+        if invalid_keys:
+            errors.setdefault('location', []).extend(f'Invalid field: {key}' for key in invalid_keys)
+    if errors:
+        raise ValidationError(errors)
+
+    return {
+        field.column: getattr(part, field.attname)
+        for field in Part._meta.concrete_fields
+        if field.name in data and field.name not in ['_id', 'category_id']
+    }
+
+
+def prepare_parts(rows: list[Any]) -> tuple[dict[int, dict], dict[int, dict]]:
+    """
+    Validate the rows of a bulk creation and convert them to 'parts' documents.
+
+    Args:
+        rows (list): The rows from the request.
+
+    Returns:
+        tuple: The documents of the valid rows and the errors of the invalid rows, both keyed by the row index.
+    """
+    parsed, errors = {}, {}
+    for index, data in enumerate(rows):
+        if not isinstance(data, dict):
+            errors[index] = {'error': 'Each row must be an object.'}
+            continue
+        data = split_location(data)
+        if not data.get('category_id'):
+            errors[index] = {'category_id': ['This field is required.']}
+            continue
+        try:
+            data['category_id'] = ObjectId(data['category_id'])
+        except Exception as error:
+            errors[index] = {'category_id': [str(error)]}
+            continue
+        parsed[index] = data
+
+    parents = get_categories_parent([data['category_id'] for data in parsed.values()])
+
+    documents, serial_numbers = {}, set()
+    for index, data in parsed.items():
+        try:
+            document = validate_part_document(data)
+            row_errors = {}
+        except ValidationError as error:
+            document, row_errors = None, error.message_dict
+
+        category_errors = validate_category(data['category_id'], parents)
+        if category_errors:
+            row_errors['category_id'] = category_errors
+        if document and document['serial_number'] in serial_numbers:
+            row_errors['serial_number'] = ['Duplicate serial number in the request.']
+
+        if row_errors:
+            errors[index] = row_errors
+        else:
+            serial_numbers.add(document['serial_number'])
+            documents[index] = {'_id': ObjectId(), **document, 'category_id': data['category_id']}
+    return documents, errors
+
+
+def get_write_errors(error: BulkWriteError, indexes: list[int]) -> dict[int, dict]:
+    """
+    Get the errors of the operations rejected by the database during a bulk write.
+
+    Args:
+        error (BulkWriteError): The error raised by the bulk write.
+        indexes (list[int]): The row index of each operation, in the order of the operations.
+
+    Returns:
+        dict: The errors keyed by the row index.
+    """
+    errors = {}
+    for write_error in error.details['writeErrors']:
+        index = indexes[write_error['index']]
+        if write_error['code'] == DUPLICATE_KEY_ERROR:
+            errors[index] = {'serial_number': ['Part with this serial number already exists.']}
+        else:
+            errors[index] = {'error': write_error['errmsg']}
+    return errors
+
+
+def create_parts(rows: list[Any]) -> tuple[list[dict], list[dict]]:
+    """
+    Create the valid rows with a single unordered 'insert_many'.
+
+    The insert is unordered, so a row rejected by the database (e.g. a serial number that already exists)
+    does not prevent the insertion of the other rows.
+
+    Args:
+        rows (list): The rows from the request.
+
+    Returns:
+        tuple: The created parts and the errors, each entry with the 'index' of its row.
+    """
+    documents, errors = prepare_parts(rows)
+
+    if documents:
+        try:
+            Part.objects.mongo_insert_many(list(documents.values()), ordered=False)
+        except BulkWriteError as error:
+            write_errors = get_write_errors(error, list(documents))
+            for index in write_errors:
+                del documents[index]
+            errors.update(write_errors)
+        invalidate_parts(document['_id'] for document in documents.values())
+
+    results = [{'index': index, **part_document_representation(document)} for index, document in documents.items()]
+    return results, [{'index': index, **errors[index]} for index in sorted(errors)]
+
+
+def get_update_fields(document: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get the '$set' fields of a partial 'parts' document.
+
+    The location keys are set with dotted paths, so the keys that are not changed are kept.
+
+    Args:
+        document (dict): The changed fields of the part.
+
+    Returns:
+        dict: The fields of the '$set' operator.
+    """
+    fields = {}
+    for key, value in document.items():
+        if key == 'location':
+            fields.update({f'location.{name}': location_value for name, location_value in value.items()})
+        else:
+            fields[key] = value
+    return fields
+
+
+def prepare_updates(items: list[Any]) -> tuple[dict[int, tuple[ObjectId, dict]], dict[int, dict]]:
+    """
+    Validate the items of a bulk update and convert their changes to '$set' fields.
+
+    Each item has the format {'_id': <part id>, 'changes': <fields in the format of 'PartDetails.put'>}.
+    The existence of the parts and the categories of the whole batch are checked with one query each.
+
+    Args:
+        items (list): The items from the request.
+
+    Returns:
+        tuple: The id and '$set' fields of the valid items and the errors of the invalid items,
+        both keyed by the item index.
+    """
+    parsed, errors, object_ids = {}, {}, set()
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get('_id') or not isinstance(item.get('changes'), dict):
+            errors[index] = {'error': "Each item must be an object with '_id' and 'changes'."}
+            continue
+        try:
+            object_id = ObjectId(item['_id'])
+        except Exception as error:
+            errors[index] = {'_id': [str(error)]}
+            continue
+        if object_id in object_ids:
+            errors[index] = {'_id': ['Duplicate _id in the request.']}
+            continue
+
+        changes = split_location(item['changes'])
+        if not changes:
+            errors[index] = {'error': 'The changes cannot be empty.'}
+            continue
+        if '_id' in changes:
+            errors[index] = {'_id': ['This field cannot be changed.']}
+            continue
+        if 'category_id' in changes:
+            try:
+                changes['category_id'] = ObjectId(changes['category_id'] or '')
+            except Exception as error:
+                errors[index] = {'category_id': [str(error)]}
+                continue
+        object_ids.add(object_id)
+        parsed[index] = (object_id, changes)
+
+    existing = {
+        document['_id'] for document in Part.objects.mongo_find({'_id': {'$in': list(object_ids)}}, {'_id': 1})
+    } if object_ids else set()
+    parents = get_categories_parent([
+        changes['category_id'] for _, changes in parsed.values() if 'category_id' in changes
+    ])
+
+    operations = {}
+    for index, (object_id, changes) in parsed.items():
+        if object_id not in existing:
+            errors[index] = {'_id': ['Part not found.']}
+            continue
+
+        exclude = [field.name for field in Part._meta.concrete_fields if field.name not in changes]
+        try:
+            document = validate_part_document(changes, exclude=exclude)
+            row_errors = {}
+        except ValidationError as error:
+            document, row_errors = None, error.message_dict
+
+        if 'category_id' in changes:
+            category_errors = validate_category(changes['category_id'], parents)
+            if category_errors:
+                row_errors['category_id'] = category_errors
+
+        if row_errors:
+            errors[index] = row_errors
+        else:
+            if 'category_id' in changes:
+                document['category_id'] = changes['category_id']
+            operations[index] = (object_id, get_update_fields(document))
+    return operations, errors
+
+
+def update_parts(items: list[Any]) -> tuple[list[dict], list[dict]]:
+    """
+    Apply the valid items with a single unordered 'bulk_write' of '$set' operations.
+
+    Args:
+        items (list): The items from the request.
+
+    Returns:
+        tuple: The ids of the updated parts and the errors, each entry with the 'index' of its item.
+    """
+    operations, errors = prepare_updates(items)
+
+    if operations:
+        object_ids = [object_id for object_id, _ in operations.values()]
+        try:
+            Part.objects.mongo_bulk_write(
+                [UpdateOne({'_id': object_id}, {'$set': fields}) for object_id, fields in operations.values()],
+                ordered=False
+            )
+        except BulkWriteError as error:
+            write_errors = get_write_errors(error, list(operations))
+            for index in write_errors:
+                del operations[index]
+            errors.update(write_errors)
+        invalidate_parts(object_ids)
+
+    results = [{'index': index, '_id': str(object_id)} for index, (object_id, _) in operations.items()]
+    return results, [{'index': index, **errors[index]} for index in sorted(errors)]
+
+
+def parse_ids(ids: Any) -> list[ObjectId]:
+    """
+    Validate a list of part ids from a bulk request.
+
+    Args:
+        ids (Any): The ids from the request.
+
+    Returns:
+        list[ObjectId]: The ids in the order of the request, without duplicates.
+
+    Raises:
+        serializers.ValidationError: If the ids are not a non-empty list of at most 'MAX_BULK_SIZE' valid ObjectIds.
+    """
+    if not isinstance(ids, list) or not ids:
+        raise serializers.ValidationError({'error': 'The ids must be a non-empty list.'})
+    if len(ids) > MAX_BULK_SIZE:
+        raise serializers.ValidationError({'error': f'The ids cannot contain more than {MAX_BULK_SIZE} items.'})
+    if not all(isinstance(object_id, str) and ObjectId.is_valid(object_id) for object_id in ids):
+        raise serializers.ValidationError({'error': 'The ids must be valid ObjectIds.'})
+    return list(dict.fromkeys(ObjectId(object_id) for object_id in ids))
+
+
+def get_parts(object_ids: list[ObjectId], fields: list[str] | None = None) -> tuple[list[dict], list[str]]:
+    """
+    Fetch many parts with a single '$in' query.
+
+    Args:
+        object_ids (list[ObjectId]): The ids of the parts.
+        fields (list[str]): The fields to read and return, or None for all fields.
+
+    Returns:
+        tuple: The serialized parts in the order of the ids, and the ids of the parts that do not exist.
+    """
+    documents = {
+        document['_id']: document
+        for document in Part.objects.mongo_find({'_id': {'$in': object_ids}}, get_projection(fields))
+    }
+    results = [
+        part_document_representation(documents[object_id], fields)
+        for object_id in object_ids if object_id in documents
+    ]
+    missing = [str(object_id) for object_id in object_ids if object_id not in documents]
+    return results, missing
+
+
+def render_parts_batch(object_ids: list[ObjectId]) -> bytes:
+    """
+    Assemble the JSON of many parts from their cached JSON, reading only the uncached parts with a single query.
+
+    Args:
+        object_ids (list[ObjectId]): The ids of the parts.
+
+    Returns:
+        bytes: The encoded parts in the order of the ids ('results'), and the ids of the parts that do not exist
+        ('missing').
+    """
+    parts_json = get_cached_parts_json(object_ids)
+    results = join_json(parts_json[object_id] for object_id in object_ids if object_id in parts_json)
+    missing = [str(object_id) for object_id in object_ids if object_id not in parts_json]
+    return b'{"results":%s,"missing":%s}' % (results, encode_json(missing))
+
+
+def get_delete_filter(data: Any) -> dict[str, Any]:
+    """
+    Compile the selection of a bulk deletion into a MongoDB filter document.
+
+    The parts are selected either by a list of ids ({'ids': [...]}) or by a filter in the format of the
+    'PartSearch' query parameters ({'filter': {'room': '12', 'price__lt': 5}}), including the full-text
+    search 'q'. The filter cannot be empty, so a bulk deletion never selects the whole collection by accident.
+
+    Args:
+        data (Any): The request data.
+
+    Returns:
+        dict: The MongoDB filter document.
+
+    Raises:
+        serializers.ValidationError: If the selection is missing, empty or invalid.
+    """
+    if not isinstance(data, dict) or ('ids' in data) == ('filter' in data):
+        raise serializers.ValidationError({'error': "The request must contain either 'ids' or 'filter'."})
+
+    if 'ids' in data:
+        return {'_id': {'$in': parse_ids(data['ids'])}}
+
+    filters = data['filter']
+    if not isinstance(filters, dict) or not filters:
+        raise serializers.ValidationError({'error': 'The filter must be a non-empty object.'})
+    invalid_keys = [key for key in filters if key in RESERVED_PARAMS and key != 'q']
+    if invalid_keys:
+        raise serializers.ValidationError({'error': f'Invalid lookup: {", ".join(invalid_keys)}'})
+    mongo_filter = MongoSearchEngine({key: str(value) for key, value in filters.items()}).compile_filters()
+    if not mongo_filter:
+        raise serializers.ValidationError({'error': 'The filter must be a non-empty object.'})
+    return mongo_filter
+
+
+def delete_parts(mongo_filter: dict[str, Any], dry_run: bool = False) -> int:
+    """
+    Delete the parts matching a filter, in batches of at most 'MAX_BULK_SIZE' parts.
+
+    The IDs of the matching parts are read from a single cursor, so the filter is run once, and each batch
+    of IDs is deleted with a '$in' query before its cached representations are invalidated. The memory
+    and the size of the '$in' query do not depend on the number of matching parts.
+
+    Args:
+        mongo_filter (dict): The MongoDB filter document, from 'get_delete_filter'.
+        dry_run (bool): If True, only count the matching parts.
+
+    Returns:
+        int: The number of matching parts if 'dry_run' is set, otherwise the number of deleted parts.
+    """
+    if dry_run:
+        return Part.objects.mongo_count_documents(mongo_filter)
+
+    documents = iter(Part.objects.mongo_find(mongo_filter, {'_id': 1}).batch_size(MAX_BULK_SIZE))
+    deleted_count = 0
+    while True:
+        object_ids = [document['_id'] for document in islice(documents, MAX_BULK_SIZE)]
+        if not object_ids:
+            return deleted_count
+        deleted_count += Part.objects.mongo_delete_many({'_id': {'$in': object_ids}}).deleted_count
+        invalidate_parts(object_ids)
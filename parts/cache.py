@@ -0,0 +1,143 @@
+"""
+This module defines the read-through caches of the parts.
+
+- 'part_json_cache': The representations of the parts encoded to JSON, served by the 'PartDetails' view
+  and joined into the list, search and batch responses. Its version is 'PART_JSON_VERSION', to be bumped
+  when the representation changes.
+- 'search_cache': The responses of the 'PartSearch' view, keyed by the normalized query string
+  and stamped with the generation of the 'parts' collection.
+
+Every write to the 'parts' collection calls 'invalidate_parts' with the IDs of the written parts,
+which also increments the generation of the collection.
+"""
+from hashlib import sha1
+from typing import Callable, Iterable
+
+from bson import ObjectId
+from django.http import QueryDict
+from django.utils.http import urlencode
+
+from .models import Part
+from .serializers import part_document_representation
+from Parts_Warehouse_API.cache import DocumentCache, bump_generation, encode_json, get_generation, join_json
+
+
+PART_JSON_VERSION = 1
+
+part_json_cache = DocumentCache('parts_json', PART_JSON_VERSION)
+search_cache = DocumentCache('parts_search', revised=False)
+
+
+def load_part_json(object_id: ObjectId) -> bytes | None:
+    """
+    Read a part from the database and encode it to JSON.
+
+    Args:
+        object_id (ObjectId): The ID of the part.
+
+    Returns:
+        bytes: The encoded part, or None if the part does not exist.
+    """
+    document = Part.objects.mongo_find_one({'_id': object_id})
+    return encode_json(part_document_representation(document)) if document else None
+
+
+def get_cached_part_json(object_id: ObjectId) -> bytes | None:
+    """
+    Get a part encoded to JSON from the cache, or from the database on a miss.
+
+    Args:
+        object_id (ObjectId): The ID of the part.
+
+    Returns:
+        bytes: The encoded part, or None if the part does not exist.
+    """
+    return part_json_cache.get(object_id, load_part_json)
+
+
+def load_parts_json(object_ids: list[ObjectId]) -> dict[ObjectId, bytes]:
+    """
+    Read many parts from the database with a single '$in' query and encode them to JSON.
+
+    Args:
+        object_ids (list[ObjectId]): The IDs of the parts.
+
+    Returns:
+        dict: The encoded parts keyed by their IDs, without the parts that do not exist.
+    """
+    return {
+        document['_id']: encode_json(part_document_representation(document))
+        for document in Part.objects.mongo_find({'_id': {'$in': object_ids}})
+    }
+
+
+def get_cached_parts_json(object_ids: list[ObjectId]) -> dict[ObjectId, bytes]:
+    """
+    Get many parts encoded to JSON from the cache, reading only the missing parts from the database.
+
+    Args:
+        object_ids (list[ObjectId]): The IDs of the parts.
+
+    Returns:
+        dict: The encoded parts keyed by their IDs, without the parts that do not exist.
+    """
+    return part_json_cache.get_many(object_ids, load_parts_json)
+
+
+def render_parts(object_ids: list[ObjectId]) -> bytes:
+    """
+    Assemble the JSON array of many parts from their cached JSON.
+
+    Args:
+        object_ids (list[ObjectId]): The IDs of the parts.
+
+    Returns:
+        bytes: The encoded parts in the order of the IDs, without the parts that do not exist.
+    """
+    parts_json = get_cached_parts_json(object_ids)
+    return join_json(parts_json[object_id] for object_id in object_ids if object_id in parts_json)
+
+
+def get_search_key(params: QueryDict) -> str:
+    """
+    Get the cache key of a search, stamped with the current generation of the 'parts' collection.
+
+    The query string is normalized by sorting its parameters, so the same search always has the same key.
+
+    Args:
+        params (QueryDict): The query parameters of the search request.
+
+    Returns:
+        str: The cache key of the search.
+    """
+    query = urlencode(sorted((key, value) for key, values in params.lists() for value in values))
+    return f'{get_generation(Part._meta.db_table)}:{sha1(query.encode("utf-8")).hexdigest()}'
+
+
+def get_cached_search(key: str, search: Callable[[], tuple[bytes, int]]) -> tuple[bytes, int]:
+    """
+    Get the response of a search from the cache, or run the search on a miss.
+
+    The key is taken before running the search, so a result computed during a write is stamped
+    with the previous generation and never served after the write.
+
+    Args:
+        key (str): The cache key of the search, from 'get_search_key'.
+        search (Callable): The function running the search, returning the encoded response and the number
+            of matching parts.
+
+    Returns:
+        tuple: The encoded response and the number of matching parts.
+    """
+    return search_cache.get(key, lambda key: search())
+
+
+def invalidate_parts(object_ids: Iterable[ObjectId]) -> None:
+    """
+    Invalidate the cached parts and searches after a write.
+
+    Args:
+        object_ids (Iterable[ObjectId]): The IDs of the created, changed or deleted parts.
+    """
+    part_json_cache.invalidate(object_ids)
+    bump_generation(Part._meta.db_table)
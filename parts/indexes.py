@@ -0,0 +1,29 @@
+"""
+This module declares the MongoDB indexes of the 'parts' collection.
+
+Djongo only creates the indexes derived from the model fields (e.g. the unique 'serial_number'),
+so the indexes needed by the search and list endpoints are declared here. They are created after
+migrations and can be verified with the 'sync_indexes' management command.
+"""
+from pymongo import ASCENDING, TEXT, IndexModel
+
+from .models import LOCATION_FIELDS, Part
+
+
+MODEL = Part
+
+INDEXES = [
+    # Compound index in the location hierarchy order, so equality filters on any prefix
+    # of the hierarchy (e.g. room, or room and bookcase) are resolved with an index range scan.
+    IndexModel([(f'location.{field}', ASCENDING) for field in LOCATION_FIELDS], name='location_hierarchy'),
+    # Indexes for the range filters and the ordering of the search. The sort field comes first,
+    # so a sort on it (in either direction) combined with a range on the other field is read from the index.
+    IndexModel([('price', ASCENDING), ('quantity', ASCENDING)], name='price_quantity'),
+    IndexModel([('quantity', ASCENDING), ('price', ASCENDING)], name='quantity_price'),
+    # Index for the full-text search, with the matches in the name ranked above those in the description.
+    IndexModel(
+        [('name', TEXT), ('description', TEXT)],
+        name='name_description_text',
+        weights={'name': 10, 'description': 1},
+    ),
+]
@@ -0,0 +1,80 @@
+"""
+This management command creates and verifies the MongoDB indexes declared by the apps.
+
+Usage:
+    python manage.py sync_indexes [--check] [--drop-stale] [--database <alias>]
+
+Arguments:
+    --check: Only report the drift between the declared and the existing indexes,
+             and exit with an error if there is any.
+    --drop-stale: Drop the existing indexes that are not declared, and rebuild the changed ones.
+    --database: The alias of the database (default: 'default').
+
+Example:
+    python manage.py sync_indexes --drop-stale
+
+The indexes are declared per collection in the 'indexes' module of each app ('parts', 'categories', 'reservations').
+Missing indexes are created in the background. The indexes created by djongo from the model fields
+are left untouched.
+"""
+from sys import stdout
+
+from django.core.management import BaseCommand, CommandError
+
+from Parts_Warehouse_API.indexes import create_indexes, drop_indexes, get_index_declarations, get_index_drift
+
+
+class Command(BaseCommand):
+    help = 'Create the declared MongoDB indexes and report the drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            help='Only report the drift and exit with an error if there is any',
+            action='store_true',
+            dest='check',
+        )
+        parser.add_argument(
+            '--drop-stale',
+            help='Drop the indexes that are not declared and rebuild the changed ones',
+            action='store_true',
+            dest='drop_stale',
+        )
+        parser.add_argument(
+            '--database',
+            help='The alias of the database',
+            default='default',
+            dest='database',
+        )
+
+    def handle(self, *args, **options):
+        using = options.get('database')
+        has_drift = False
+
+        for model, indexes in get_index_declarations():
+            collection = model._meta.db_table
+            drift = get_index_drift(model, indexes, using)
+            has_drift = has_drift or bool(drift)
+
+            for index in drift.missing:
+                stdout.write(f'{collection}: missing index {index.document["name"]}\n')
+            for index in drift.changed:
+                stdout.write(f'{collection}: changed index {index.document["name"]}\n')
+            for name in drift.stale:
+                stdout.write(f'{collection}: stale index {name}\n')
+
+            if options.get('check'):
+                continue
+
+            if options.get('drop_stale'):
+                drop_indexes(model, drift.stale + [index.document['name'] for index in drift.changed], using)
+                create_indexes(model, drift.missing + drift.changed, using)
+            else:
+                create_indexes(model, drift.missing, using)
+
+        if options.get('check'):
+            if has_drift:
+                raise CommandError('The indexes are not in sync with the declarations.')
+            stdout.write('The indexes are in sync.\n')
+        else:
+            stdout.write('Successfully synchronized the indexes.\n')
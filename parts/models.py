@@ -8,6 +8,9 @@ from django.db import models
 from categories.models import Category
 
 
+LOCATION_FIELDS = ['room', 'bookcase', 'shelf', 'cuvette', 'column', 'row', ]
+
+
 class Part(models.Model):
     """
     The 'Part' model represents a part in the system.
@@ -30,6 +33,10 @@ class Part(models.Model):
     - column (str): The column where the part is positioned.
     - row (str): The row where the part is placed.
 
+    Manager:
+        objects (DjongoManager): The default manager, which also exposes the pymongo collection methods
+        prefixed with 'mongo_' (e.g. 'Part.objects.mongo_find()').
+
     Meta:
         db_table (str): The database table name for the 'Part' model.
     """
@@ -42,14 +49,14 @@ class Part(models.Model):
     price = models.FloatField()
     location = djongo_models.JSONField()
 
+    objects = djongo_models.DjongoManager()
+
     class Meta:
         db_table = 'parts'
 
     def save(self, *args, **kwargs):
-        allowed_fields = ['room', 'bookcase', 'shelf', 'cuvette', 'column', 'row', ]
-
         for key in self.location.keys():
-            if key not in allowed_fields:
+            if key not in LOCATION_FIELDS:
                 raise ValidationError(f'Invalid field: {key}')
 
         super().save(*args, **kwargs)
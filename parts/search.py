@@ -0,0 +1,394 @@
+"""
+This module defines the search engines used by the 'PartSearch' view.
+
+Two engines are available:
+- 'orm': Filters the parts with the Django ORM, which djongo translates to a MongoDB query.
+- 'mongo': Compiles the filters directly into a MongoDB filter document and runs it with pymongo.
+
+Both engines return the same representation of the parts. The default engine is set with the
+'PARTS_SEARCH_ENGINE' setting and can be overridden per request with the 'engine' query parameter.
+The full-text search ('q' query parameter) uses the MongoDB text index, so it is always run by the 'mongo' engine.
+The ORM cannot express the dotted paths into the 'location' sub-document, so the searches filtering on the location
+are also always run by the 'mongo' engine, with the 'location_hierarchy' index.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple
+
+from bson import ObjectId
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import QueryDict
+from pymongo import ASCENDING, DESCENDING
+from pymongo.cursor import Cursor
+from rest_framework import serializers
+
+from .models import Part
+from .serializers import PartSerializer, part_document_representation
+from Parts_Warehouse_API.fieldsets import get_fieldset, get_projection
+from Parts_Warehouse_API.validators import valid_object_id
+
+
+RESERVED_PARAMS = ['engine', 'ordering', 'q', 'limit', 'fields', 'count_only', ]
+
+VALUE_TYPES = {
+    '_id': valid_object_id,
+    'category_id': valid_object_id,
+    'quantity': int,
+    'price': float,
+}
+
+RANGE_FIELDS = ['quantity', 'price', ]
+RANGE_OPERATORS = ['gt', 'gte', 'lt', 'lte', ]
+ORDERING_FIELDS = ['quantity', 'price', ]
+
+MAX_LIMIT = 1000
+TEXT_SEARCH_LIMIT = 50
+
+
+class Condition(NamedTuple):
+    """
+    A single search condition parsed from the query parameters.
+
+    Attributes:
+        field (str): The model field name, or the dotted path of a location field (e.g. 'location.room').
+        operator (str): 'exact' or one of the range operators.
+        value (Any): The value converted to the type stored in the database.
+    """
+    field: str
+    operator: str
+    value: Any
+
+
+class SearchEngine(ABC):
+    """
+    Base class for the part search engines.
+
+    Filters on the model fields are matched by equality, with their values coerced to the stored types.
+    The 'quantity' and 'price' fields also accept the range operators 'gt', 'gte', 'lt' and 'lte'
+    (e.g. 'price__lte=5'). Any other key is matched against the 'location' sub-document.
+
+    The 'ordering' parameter sorts the results by a comma-separated list of fields,
+    prefixed with '-' for descending order (e.g. 'ordering=-price,-quantity'). The fields are sorted
+    in the same direction, so the sort is always read from the 'price_quantity' or 'quantity_price' index.
+    The 'limit' parameter caps the number of results.
+    The 'fields' parameter selects the returned fields, which are the only fields read from the database.
+
+    Attributes:
+        params (QueryDict): The query parameters of the search request.
+    """
+    def __init__(self, params: QueryDict):
+        self.params = params
+        self.fields_name = [field.name for field in Part._meta.get_fields()]
+
+    def get_filters(self) -> dict[str, str]:
+        """
+        Get the search filters from the query parameters, without the reserved parameters.
+
+        Returns:
+            dict: The filters with their raw values.
+        """
+        return {key: value for key, value in self.params.items() if key not in RESERVED_PARAMS}
+
+    def coerce(self, field: str, value: str) -> Any:
+        """
+        Convert the raw value of a filter to the type stored in the database.
+
+        Args:
+            field (str): The name of the field.
+            value (str): The raw value from the query string.
+
+        Returns:
+            Any: The converted value.
+
+        Raises:
+            serializers.ValidationError: If the value cannot be converted.
+        """
+        value_type = VALUE_TYPES.get(field)
+        if value_type is None:
+            return value
+        try:
+            return value_type(value)
+        except (TypeError, ValueError):
+            raise serializers.ValidationError({'error': f'Invalid value for {field}: {value}'})
+
+    def get_conditions(self) -> list[Condition]:
+        """
+        Parse the search filters into conditions.
+
+        Returns:
+            list[Condition]: The search conditions.
+
+        Raises:
+            serializers.ValidationError: If a value or a range operator is invalid.
+        """
+        conditions = []
+        for key, value in self.get_filters().items():
+            field, _, operator = key.partition('__')
+            if field not in self.fields_name and not operator:
+                conditions.append(Condition(f'location.{key}', 'exact', value))
+            elif field in self.fields_name and not operator:
+                conditions.append(Condition(field, 'exact', self.coerce(field, value)))
+            elif field in RANGE_FIELDS and operator in RANGE_OPERATORS:
+                conditions.append(Condition(field, operator, self.coerce(field, value)))
+            else:
+                raise serializers.ValidationError({'error': f'Invalid lookup: {key}'})
+        return conditions
+
+    def get_ordering(self) -> list[tuple[str, int]]:
+        """
+        Parse the 'ordering' query parameter.
+
+        Returns:
+            list[tuple[str, int]]: The sort fields with their directions.
+
+        Raises:
+            serializers.ValidationError: If a field cannot be used for ordering, is repeated,
+                or the fields are sorted in different directions.
+        """
+        ordering = []
+        for field in filter(None, self.params.get('ordering', '').split(',')):
+            direction = DESCENDING if field.startswith('-') else ASCENDING
+            field = field.lstrip('-')
+            if field not in ORDERING_FIELDS:
+                raise serializers.ValidationError(
+                    {'error': f'Invalid ordering: {field}. Allowed fields: {", ".join(ORDERING_FIELDS)}.'}
+                )
+            if field in dict(ordering):
+                raise serializers.ValidationError({'error': f'Invalid ordering: {field} is repeated.'})
+            ordering.append((field, direction))
+
+        # The compound indexes are ascending, so they only serve the sorts with all fields in the same direction.
+        if len({direction for _, direction in ordering}) > 1:
+            raise serializers.ValidationError(
+                {'error': 'Invalid ordering: the fields must be sorted in the same direction.'}
+            )
+        return ordering
+
+    def get_limit(self, default: int | None = None) -> int | None:
+        """
+        Parse the 'limit' query parameter.
+
+        Args:
+            default (int): The limit used if the parameter is not provided.
+
+        Returns:
+            int: The maximum number of results capped at 'MAX_LIMIT', or None if the results are not limited.
+
+        Raises:
+            serializers.ValidationError: If the limit is not a positive integer.
+        """
+        limit = self.params.get('limit')
+        if limit is None:
+            return default
+        if not limit.isdigit() or int(limit) < 1:
+            raise serializers.ValidationError({'error': 'The limit must be a positive integer.'})
+        return min(int(limit), MAX_LIMIT)
+
+    def get_fields(self) -> list[str] | None:
+        """
+        Parse the 'fields' query parameter.
+
+        Returns:
+            list[str]: The selected field names, or None if all fields are requested.
+
+        Raises:
+            serializers.ValidationError: If a selected field is not a field of the model.
+        """
+        return get_fieldset(self.params, Part)
+
+    def compile_filters(self) -> dict[str, Any]:
+        """
+        Compile the search filters into a MongoDB filter document.
+
+        The document is used by the 'mongo' engine to find the parts, and by all engines to count them.
+
+        Returns:
+            dict: The MongoDB filter document.
+        """
+        operators = {}
+        for condition in self.get_conditions():
+            operator = '$eq' if condition.operator == 'exact' else f'${condition.operator}'
+            operators.setdefault(condition.field, {})[operator] = condition.value
+
+        mongo_filter = {
+            field: field_operators['$eq'] if list(field_operators) == ['$eq'] else field_operators
+            for field, field_operators in operators.items()
+        }
+        if self.params.get('q'):
+            mongo_filter['$text'] = {'$search': self.params['q']}
+        return mongo_filter
+
+    def count(self) -> int:
+        """
+        Count the parts matching the filters, without reading them.
+
+        Returns:
+            int: The number of matching parts, regardless of the limit.
+        """
+        return Part.objects.mongo_count_documents(self.compile_filters())
+
+    @abstractmethod
+    def search(self) -> list[dict]:
+        """
+        Find the parts matching the filters.
+
+        Returns:
+            list[dict]: The serialized matching parts.
+        """
+
+    @abstractmethod
+    def search_ids(self) -> list[ObjectId]:
+        """
+        Find the ids of the parts matching the filters, without reading the other fields.
+
+        Returns:
+            list[ObjectId]: The ids of the matching parts, in the order of the results.
+        """
+
+
+class OrmSearchEngine(SearchEngine):
+    """
+    Search engine filtering the parts with the Django ORM.
+
+    The location filters are not supported, see 'get_search_engine'.
+    """
+    def get_queryset(self) -> QuerySet:
+        """
+        Get the queryset based on the search filters and ordering.
+
+        Returns:
+            QuerySet: The filtered queryset of parts.
+
+        Raises:
+            serializers.ValidationError: If a filter is on a location field.
+        """
+        queryset = Part.objects.all()
+
+        for condition in self.get_conditions():
+            if condition.field.startswith('location.'):
+                raise serializers.ValidationError({'error': 'The location filters require the mongo engine.'})
+            if condition.operator == 'exact':
+                queryset = queryset.filter(**{condition.field: condition.value})
+            else:
+                queryset = queryset.filter(**{f'{condition.field}__{condition.operator}': condition.value})
+
+        ordering = self.get_ordering()
+        if ordering:
+            queryset = queryset.order_by(*[
+                f'-{field}' if direction == DESCENDING else field for field, direction in ordering
+            ])
+        return queryset
+
+    def get_results(self, fields: list[str] | None) -> QuerySet:
+        """
+        Get the limited queryset of the matching parts, reading only the given fields.
+
+        Args:
+            fields (list[str]): The fields to read, or None for all fields.
+
+        Returns:
+            QuerySet: The queryset of the results.
+        """
+        queryset = self.get_queryset().distinct()
+        if fields:
+            queryset = queryset.only(*fields)
+        limit = self.get_limit()
+        if limit:
+            queryset = queryset[:limit]
+        return queryset
+
+    def search(self) -> list[dict]:
+        fields = self.get_fields()
+        return PartSerializer(self.get_results(fields), many=True, fields=fields).data
+
+    def search_ids(self) -> list[ObjectId]:
+        return [part._id for part in self.get_results(['_id'])]
+
+
+class MongoSearchEngine(SearchEngine):
+    """
+    Search engine compiling the filters into a MongoDB filter document executed with pymongo.
+
+    The location fields are matched with dotted paths, which are backed by the 'location_hierarchy' index.
+    The sorts on 'price' and 'quantity' are backed by the 'price_quantity' and 'quantity_price' indexes.
+
+    The 'q' parameter runs a full-text search over the name and description of the parts with the
+    'name_description_text' index. The results are ranked by relevance unless an ordering is provided,
+    and limited to 'TEXT_SEARCH_LIMIT' unless a limit is provided.
+    """
+    def get_results(self, projection: dict[str, int] | None) -> Cursor:
+        """
+        Get the sorted and limited cursor of the matching parts, reading only the projected fields.
+
+        Args:
+            projection (dict): The MongoDB projection document, or None for all fields.
+
+        Returns:
+            Cursor: The pymongo cursor of the results.
+        """
+        ordering = self.get_ordering()
+        if self.params.get('q'):
+            text_score = {'$meta': 'textScore'}
+            documents = Part.objects.mongo_find(self.compile_filters(), {**(projection or {}), 'score': text_score})
+            return documents.sort(ordering or [('score', text_score)]).limit(self.get_limit(TEXT_SEARCH_LIMIT))
+
+        documents = Part.objects.mongo_find(self.compile_filters(), projection)
+        if ordering:
+            documents = documents.sort(ordering)
+        limit = self.get_limit()
+        if limit:
+            documents = documents.limit(limit)
+        return documents
+
+    def search(self) -> list[dict]:
+        fields = self.get_fields()
+        return [part_document_representation(document, fields) for document in self.get_results(get_projection(fields))]
+
+    def search_ids(self) -> list[ObjectId]:
+        return [document['_id'] for document in self.get_results({'_id': 1})]
+
+
+SEARCH_ENGINES = {
+    'orm': OrmSearchEngine,
+    'mongo': MongoSearchEngine,
+}
+
+
+def has_location_filters(params: QueryDict) -> bool:
+    """
+    Check whether a search filters on the location fields.
+
+    Args:
+        params (QueryDict): The query parameters of the search request.
+
+    Returns:
+        bool: True if a filter, without a lookup, is not on a field of the 'Part' model.
+    """
+    fields_name = [field.name for field in Part._meta.get_fields()]
+    return any('__' not in key and key not in fields_name for key in params if key not in RESERVED_PARAMS)
+
+
+def get_search_engine(params: QueryDict) -> SearchEngine:
+    """
+    Create the search engine selected by the 'engine' query parameter or the 'PARTS_SEARCH_ENGINE' setting.
+
+    The full-text searches and the searches filtering on the location are always run by the 'mongo' engine.
+
+    Args:
+        params (QueryDict): The query parameters of the search request.
+
+    Returns:
+        SearchEngine: The search engine for the request.
+
+    Raises:
+        serializers.ValidationError: If the selected engine does not exist.
+    """
+    if params.get('q') or has_location_filters(params):
+        name = 'mongo'
+    else:
+        name = params.get('engine', settings.PARTS_SEARCH_ENGINE)
+    if name not in SEARCH_ENGINES:
+        raise serializers.ValidationError(
+            {'error': f'Invalid engine: {name}. Allowed engines: {", ".join(SEARCH_ENGINES)}.'}
+        )
+    return SEARCH_ENGINES[name](params)
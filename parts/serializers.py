@@ -2,21 +2,28 @@
 This module defines a Django Serializer.
 """
 from json import loads
+from typing import Any
+from pymongo.errors import DuplicateKeyError
 from rest_framework.exceptions import ValidationError
 
-from .models import Part
+from .models import Part, LOCATION_FIELDS
 from categories.models import Category
 
 from rest_framework import serializers
+from Parts_Warehouse_API.fieldsets import SparseFieldsMixin
 from Parts_Warehouse_API.validators import valid_object_id
 
 
-class PartSerializer(serializers.ModelSerializer):
+class PartSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the 'Part' model.
 
+    The 'fields' keyword argument restricts the serialized fields (see 'SparseFieldsMixin').
+
     Methods:
         validate(data): Perform additional validation on the input data before saving.
+        get_changed_fields(instance, validated_data): Get the '$set' fields of the changed values.
+        update(instance, validated_data): Write the changed fields of an existing part.
         to_representation(instance): Convert the model instance to a JSON-compatible representation.
     """
     class Meta:
@@ -45,12 +52,73 @@ class PartSerializer(serializers.ModelSerializer):
                 raise ValidationError({'error': 'Cannot add data to a base category.'})
         return data
 
+    @staticmethod
+    def get_changed_fields(instance: Part, validated_data: dict) -> dict[str, Any]:
+        """
+        Get the '$set' fields of the values that differ from the stored part.
+
+        The location keys are compared one by one and set with dotted paths ('location.<key>'),
+        so the location keys that are not changed are not rewritten.
+
+        Args:
+            instance (Part): The stored part.
+            validated_data (dict): The validated input data.
+
+        Returns:
+            dict: The fields of the '$set' operator, keyed by the stored column names.
+        """
+        fields = {}
+        for name, value in validated_data.items():
+            if name == 'location':
+                location = loads(instance.location) if isinstance(instance.location, str) else instance.location or {}
+                fields.update({
+                    f'location.{key}': location_value
+                    for key, location_value in value.items() if location.get(key) != location_value
+                })
+            elif name == 'category_id':
+                if value.pk != instance.category_id_id:
+                    fields['category_id'] = value.pk
+            elif getattr(instance, name) != value:
+                fields[Part._meta.get_field(name).column] = value
+        return fields
+
+    def update(self, instance: Part, validated_data: dict) -> Part:
+        """
+        Write the changed fields of an existing part with a single '$set', instead of rewriting the whole document.
+
+        Args:
+            instance (Part): The stored part.
+            validated_data (dict): The validated input data.
+
+        Raises:
+            ValidationError: If the location contains a key that is not allowed,
+            or if the serial number was taken by another part in the meantime.
+
+        Returns:
+            Part: The updated part.
+        """
+        invalid_keys = [key for key in validated_data.get('location', {}) if key not in LOCATION_FIELDS]
+        if invalid_keys:
+            raise ValidationError({'location': [f'Invalid field: {key}' for key in invalid_keys]})
+
+        fields = self.get_changed_fields(instance, validated_data)
+        if fields:
+            try:
+                Part.objects.mongo_update_one({'_id': instance._id}, {'$set': fields})
+            except DuplicateKeyError:
+                raise ValidationError({'serial_number': ['Part with this serial number already exists.']})
+
+        for name, value in validated_data.items():
+            setattr(instance, name, value)
+        return instance
+
     def to_representation(self, instance: Part) -> dict:
         """
         Convert the model instance to a JSON-compatible representation.
 
         This method overrides the default behavior to handle special cases like converting
         ObjectId fields to strings and transforming the 'location' field from a string to a dictionary.
+        The 'category_id' is taken from the stored column, so the related category is never fetched.
 
         Args:
             instance (Part): The 'Part' model instance to be converted.
@@ -62,11 +130,46 @@ class PartSerializer(serializers.ModelSerializer):
 
         if instance._id:
             rep['_id'] = str(instance._id)
-        if instance.category_id:
-            rep['category_id'] = str(instance.category_id._id)
-        if instance.location:
+        if 'category_id' in rep and instance.category_id_id:
+            rep['category_id'] = str(instance.category_id_id)
+        if 'location' in rep and instance.location:
             if isinstance(instance.location, str):
                 rep['location'] = loads(instance.location)
             else:
                 rep['location'] = dict(instance.location)
         return rep
+
+
+def part_document_representation(document: dict[str, Any], fields: list[str] | None = None) -> dict:
+    """
+    Convert a raw 'parts' document read with pymongo to the representation of PartSerializer.
+
+    This allows endpoints that bypass the ORM to return the same JSON as the serializer,
+    without building model instances.
+
+    Args:
+        document (dict): The document from the 'parts' collection.
+        fields (list[str]): The fields of the representation, or None for all fields.
+
+    Returns:
+        dict: The JSON-compatible representation of the document.
+    """
+    location = document.get('location')
+    if isinstance(location, str):
+        location = loads(location)
+    elif location:
+        location = dict(location)
+
+    rep = {
+        '_id': str(document['_id']),
+        'serial_number': document.get('serial_number'),
+        'name': document.get('name'),
+        'description': document.get('description'),
+        'quantity': document.get('quantity'),
+        'price': document.get('price'),
+        'location': location,
+        'category_id': str(document['category_id']) if document.get('category_id') else None,
+    }
+    if fields is not None:
+        rep = {key: value for key, value in rep.items() if key in fields}
+    return rep
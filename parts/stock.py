@@ -0,0 +1,224 @@
+"""
+This module implements the stock movements of the parts.
+
+A stock movement is a signed delta applied to the 'quantity' of a part with a single conditional '$inc',
+so concurrent movements never overwrite each other and the quantity can never drop below zero.
+
+With the 'PARTS_STOCK_WRITE_BEHIND' setting, the increments are buffered instead and summed per part in the worker
+until the buffer is flushed as a single 'bulk_write' of '$inc' operations. An increment can never be rejected,
+so summing the increments does not change the outcome of any movement. The decrements are still applied
+immediately, each with its own conditional '$inc', so a decrement larger than the quantity in stock is rejected
+in the response and never cancels the other movements.
+"""
+import atexit
+import logging
+from threading import Lock, Timer
+
+from bson import ObjectId
+from django.conf import settings
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from .cache import invalidate_parts
+from .models import Part
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_stock_filter(object_id: ObjectId, delta: int) -> dict:
+    """
+    Get the filter matching a part only if its quantity covers a negative delta.
+
+    Args:
+        object_id (ObjectId): The ID of the part.
+        delta (int): The signed change of the quantity.
+
+    Returns:
+        dict: The MongoDB filter document.
+    """
+    mongo_filter = {'_id': object_id}
+    if delta < 0:
+        mongo_filter['quantity'] = {'$gte': -delta}
+    return mongo_filter
+
+
+def apply_stock_delta(object_id: ObjectId, delta: int) -> int | None:
+    """
+    Apply a signed delta to the quantity of a part.
+
+    The filter only matches the part if its quantity covers a negative delta, so the check and the update
+    are a single atomic operation.
+
+    Args:
+        object_id (ObjectId): The ID of the part.
+        delta (int): The signed change of the quantity.
+
+    Returns:
+        int: The new quantity, or None if the part does not exist or its quantity is lower than the decrement.
+    """
+    document = Part.objects.mongo_find_one_and_update(
+        get_stock_filter(object_id, delta),
+        {'$inc': {'quantity': delta}},
+        projection={'quantity': 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if document is None:
+        return None
+    invalidate_parts([object_id])
+    return document['quantity']
+
+
+class StockBuffer:
+    """
+    Buffer of the stock increments waiting to be written, summed per part.
+
+    The buffer is flushed by a timer 'interval' seconds after the first buffered increment. If the buffer
+    already holds 'max_size' parts, it is flushed synchronously by the request adding a new part.
+
+    The increments that could not be written are put back in the buffer and written by the next flush,
+    so a failed write never discards them. The parts being written count towards 'max_size' until the write
+    ends, so the restored increments never grow the buffer beyond 'max_size' parts: while it is full,
+    the increments of the other parts are refused and applied immediately by the caller.
+
+    Attributes:
+        interval (float): The delay in seconds between the first buffered movement and the flush.
+        max_size (int): The maximum number of parts in the buffer.
+    """
+    def __init__(self, interval: float, max_size: int):
+        self.interval = interval
+        self.max_size = max_size
+        self.deltas = {}
+        self.writing = 0
+        self.lock = Lock()
+        self.timer = None
+
+    def add(self, object_id: ObjectId, delta: int) -> bool:
+        """
+        Buffer a stock increment.
+
+        Args:
+            object_id (ObjectId): The ID of the part.
+            delta (int): The positive change of the quantity.
+
+        Returns:
+            bool: True if the increment was buffered, False if the buffer is still full after a flush
+            (e.g. because the writes fail), in which case the caller must apply the increment itself.
+
+        Raises:
+            ValueError: If the delta is not positive.
+        """
+        if delta <= 0:
+            raise ValueError('Only the stock increments can be buffered.')
+
+        with self.lock:
+            if self._buffer(object_id, delta):
+                return True
+            full_deltas = self._take_for_write() if not self.writing else {}
+
+        self._write_taken(full_deltas)
+        with self.lock:
+            return self._buffer(object_id, delta)
+
+    def _buffer(self, object_id: ObjectId, delta: int) -> bool:
+        if object_id not in self.deltas and len(self.deltas) + self.writing >= self.max_size:
+            return False
+        self.deltas[object_id] = self.deltas.get(object_id, 0) + delta
+        self._start_timer()
+        return True
+
+    def _take_for_write(self) -> dict[ObjectId, int]:
+        deltas = self._take()
+        self.writing += len(deltas)
+        return deltas
+
+    def _write_taken(self, deltas: dict[ObjectId, int]) -> None:
+        try:
+            self.write(deltas)
+        finally:
+            with self.lock:
+                self.writing -= len(deltas)
+
+    def _start_timer(self) -> None:
+        if self.timer is None:
+            self.timer = Timer(self.interval, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _take(self) -> dict[ObjectId, int]:
+        deltas, self.deltas = self.deltas, {}
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        return deltas
+
+    def drain(self) -> dict[ObjectId, int]:
+        """
+        Take the buffered increments out of the buffer.
+
+        Returns:
+            dict: The summed increments keyed by the part ID.
+        """
+        with self.lock:
+            return self._take()
+
+    def restore(self, deltas: dict[ObjectId, int]) -> None:
+        """
+        Put increments that could not be written back in the buffer, to be written by the next flush.
+
+        Args:
+            deltas (dict): The summed increments keyed by the part ID.
+        """
+        with self.lock:
+            for object_id, delta in deltas.items():
+                self.deltas[object_id] = self.deltas.get(object_id, 0) + delta
+            self._start_timer()
+
+    def write(self, deltas: dict[ObjectId, int]) -> None:
+        """
+        Write summed increments with a single unordered 'bulk_write'.
+
+        The increments rejected by the database, or all of them if the write fails, are put back in the buffer.
+
+        Args:
+            deltas (dict): The summed increments keyed by the part ID.
+        """
+        if not deltas:
+            return
+
+        object_ids = list(deltas)
+        operations = [
+            UpdateOne(get_stock_filter(object_id, deltas[object_id]), {'$inc': {'quantity': deltas[object_id]}})
+            for object_id in object_ids
+        ]
+        try:
+            result = Part.objects.mongo_bulk_write(operations, ordered=False)
+        except BulkWriteError as error:
+            # The write is unordered, so the operations without a write error were applied.
+            failed_ids = [object_ids[write_error['index']] for write_error in error.details['writeErrors']]
+            logger.exception('Failed to write %d buffered stock increments, retrying them.', len(failed_ids))
+            self.restore({object_id: deltas[object_id] for object_id in failed_ids})
+            return
+        except Exception:
+            logger.exception('Failed to write %d buffered stock increments, retrying them.', len(operations))
+            self.restore(deltas)
+            return
+        finally:
+            invalidate_parts(object_ids)
+        if result.matched_count < len(operations):
+            logger.warning(
+                '%d buffered stock increments were not applied (part deleted since the movement was accepted).',
+                len(operations) - result.matched_count
+            )
+
+    def flush(self) -> None:
+        """
+        Write the buffered deltas.
+        """
+        with self.lock:
+            deltas = self._take_for_write()
+        self._write_taken(deltas)
+
+
+stock_buffer = StockBuffer(settings.PARTS_STOCK_FLUSH_INTERVAL, settings.PARTS_STOCK_BUFFER_SIZE)
+atexit.register(stock_buffer.flush)
@@ -0,0 +1,124 @@
+"""
+This module contains unit tests for testing the helpers of the bulk operations on parts.
+"""
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from bson import ObjectId
+from rest_framework.exceptions import ValidationError
+
+from parts import bulk
+from parts.bulk import MAX_BULK_SIZE, delete_parts, get_delete_filter, get_update_fields, parse_ids, split_location
+
+
+def test_split_location():
+    """
+    Test moving the keys that are not model fields into the location.
+    """
+    row = split_location({'name': 'part_A', 'location': {'room': '12'}, 'shelf': 'z'})
+
+    assert row == {'name': 'part_A', 'location': {'room': '12', 'shelf': 'z'}}
+
+
+def test_update_fields_with_location():
+    """
+    Test setting the location keys by their dotted paths.
+    """
+    fields = get_update_fields({'quantity': 5, 'location': {'room': '12', 'shelf': 'z'}})
+
+    assert fields == {'quantity': 5, 'location.room': '12', 'location.shelf': 'z'}
+
+
+def test_parse_ids():
+    """
+    Test parsing the ids in the order of the request, without duplicates.
+    """
+    ids = ['5fc6e6ba9f84e500c7f3b89d', '5fc6e6ba9f84e500c7f3b89c', '5fc6e6ba9f84e500c7f3b89d']
+
+    assert parse_ids(ids) == [ObjectId('5fc6e6ba9f84e500c7f3b89d'), ObjectId('5fc6e6ba9f84e500c7f3b89c')]
+
+
+def test_delete_filter_by_ids():
+    """
+    Test selecting the parts to delete by their ids.
+    """
+    object_id = '5fc6e6ba9f84e500c7f3b89c'
+
+    mongo_filter = get_delete_filter({'ids': [object_id]})
+
+    assert mongo_filter == {'_id': {'$in': [ObjectId(object_id)]}}
+
+
+def test_delete_filter_by_search_filter():
+    """
+    Test selecting the parts to delete by a filter in the format of the search query parameters.
+    """
+    mongo_filter = get_delete_filter({'filter': {'room': '12', 'price__lt': 5, 'q': 'resistor'}})
+
+    assert mongo_filter == {'location.room': '12', 'price': {'$lt': 5.0}, '$text': {'$search': 'resistor'}}
+
+
+@pytest.mark.parametrize('data', [
+    {},
+    {'ids': ['5fc6e6ba9f84e500c7f3b89c'], 'filter': {'room': '12'}},
+    {'ids': []},
+    {'ids': ['wrong_id']},
+    {'ids': ['5fc6e6ba9f84e500c7f3b89c'] * (MAX_BULK_SIZE + 1)},
+    {'filter': {}},
+    {'filter': {'q': ''}},
+    {'filter': {'limit': 10}},
+    {'filter': {'quantity': 'x'}},
+])
+def test_invalid_delete_filter(data):
+    """
+    Test rejecting a missing, empty or invalid selection of the parts to delete.
+    """
+    with pytest.raises(ValidationError):
+        get_delete_filter(data)
+
+
+class FakeCursor(list):
+    """
+    Fake pymongo cursor supporting 'batch_size'.
+    """
+    def batch_size(self, batch_size: int) -> 'FakeCursor':
+        return self
+
+
+class FakeCollection:
+    """
+    Fake 'parts' collection, recording the number of queries and the size of each deleted batch.
+    """
+    def __init__(self, count: int):
+        self.object_ids = [ObjectId() for _ in range(count)]
+        self.queries = 0
+        self.batches = []
+
+    def mongo_find(self, mongo_filter: dict, projection: dict) -> FakeCursor:
+        self.queries += 1
+        return FakeCursor({'_id': object_id} for object_id in self.object_ids)
+
+    def mongo_delete_many(self, mongo_filter: dict) -> SimpleNamespace:
+        object_ids = mongo_filter['_id']['$in']
+        self.batches.append(len(object_ids))
+        self.object_ids = [object_id for object_id in self.object_ids if object_id not in object_ids]
+        return SimpleNamespace(deleted_count=len(object_ids))
+
+
+def test_delete_parts_in_batches():
+    """
+    Test deleting the parts matching a filter in batches of at most 'MAX_BULK_SIZE' parts, read with a single query.
+    """
+    collection = FakeCollection(MAX_BULK_SIZE * 2 + 1)
+
+    with (
+        mock.patch.object(bulk, 'Part', SimpleNamespace(objects=collection)),
+        mock.patch.object(bulk, 'invalidate_parts') as invalidate_parts,
+    ):
+        assert delete_parts({'quantity': {'$gte': 0}}) == MAX_BULK_SIZE * 2 + 1
+
+    assert collection.queries == 1
+    assert collection.batches == [MAX_BULK_SIZE, MAX_BULK_SIZE, 1]
+    assert invalidate_parts.call_count == 3
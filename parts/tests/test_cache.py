@@ -0,0 +1,293 @@
+"""
+This module contains unit tests for testing the read-through cache of the documents.
+"""
+from bson import ObjectId
+from django.core.cache import cache
+from django.http import HttpResponse, QueryDict
+from django.urls import resolve, reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from parts.cache import get_cached_search, get_search_key, invalidate_parts, part_json_cache
+from Parts_Warehouse_API.cache import (
+    DocumentCache, bump_generation, encode_json, get_generation, get_query_key, join_json,
+)
+from Parts_Warehouse_API.etags import conditional_response, get_content_etag
+from Parts_Warehouse_API.views import CacheStats
+
+
+PART_A = ObjectId('5fc6e6ba9f84e500c7f3b89c')
+PART_B = ObjectId('5fc6e6ba9f84e500c7f3b89d')
+
+
+class Loader:
+    """
+    Fake database read, recording the loaded IDs.
+    """
+    def __init__(self, documents: dict):
+        self.documents = documents
+        self.loaded = []
+
+    def __call__(self, object_id: ObjectId) -> dict | None:
+        self.loaded.append(object_id)
+        return self.documents.get(object_id)
+
+    def load_many(self, object_ids: list[ObjectId]) -> dict:
+        self.loaded.append(object_ids)
+        return {object_id: self.documents[object_id] for object_id in object_ids if object_id in self.documents}
+
+
+def test_read_through():
+    """
+    Test loading a document on the first read only.
+    """
+    document_cache = DocumentCache('test_read_through')
+    load = Loader({PART_A: {'_id': str(PART_A)}})
+
+    assert document_cache.get(PART_A, load) == {'_id': str(PART_A)}
+    assert document_cache.get(PART_A, load) == {'_id': str(PART_A)}
+    assert load.loaded == [PART_A]
+    assert document_cache.get_stats() == {'hits': 1, 'misses': 1, 'hit_ratio': 0.5}
+
+
+def test_missing_document_not_cached():
+    """
+    Test reading a document that does not exist from the database each time.
+    """
+    document_cache = DocumentCache('test_missing_document')
+    load = Loader({})
+
+    assert document_cache.get(PART_A, load) is None
+    assert document_cache.get(PART_A, load) is None
+    assert load.loaded == [PART_A, PART_A]
+
+
+def test_read_through_many():
+    """
+    Test loading only the uncached documents, with a single call.
+    """
+    document_cache = DocumentCache('test_read_through_many')
+    load = Loader({PART_A: b'{"quantity":1}', PART_B: b'{"quantity":2}'})
+    document_cache.get_many([PART_A], load.load_many)
+
+    data = document_cache.get_many([PART_B, PART_A, ObjectId('5fc6e6ba9f84e500c7f3b123')], load.load_many)
+
+    assert data == {PART_A: b'{"quantity":1}', PART_B: b'{"quantity":2}'}
+    assert load.loaded == [[PART_A], [PART_B, ObjectId('5fc6e6ba9f84e500c7f3b123')]]
+    assert document_cache.get_stats()['hits'] == 1
+
+
+def test_versions():
+    """
+    Test never reading the entries written with another version of the representation.
+    """
+    load = Loader({PART_A: {'quantity': 1}})
+    DocumentCache('test_versions', 1).get(PART_A, load)
+    DocumentCache('test_versions', 2).get(PART_A, load)
+
+    assert load.loaded == [PART_A, PART_A]
+
+
+def test_join_json():
+    """
+    Test joining encoded documents into a JSON array in the compact format.
+    """
+    fragments = [encode_json({'name': 'Résistance', 'price': 0.5}), encode_json({'name': None})]
+
+    assert join_json(fragments) == '[{"name":"Résistance","price":0.5},{"name":null}]'.encode('utf-8')
+    assert join_json([]) == b'[]'
+
+
+def test_invalidate():
+    """
+    Test reloading only the invalidated documents.
+    """
+    document_cache = DocumentCache('test_invalidate')
+    load = Loader({PART_A: {'quantity': 1}, PART_B: {'quantity': 2}})
+    document_cache.get(PART_A, load)
+    document_cache.get(PART_B, load)
+
+    load.documents[PART_A] = {'quantity': 3}
+    document_cache.invalidate([PART_A])
+
+    assert document_cache.get(PART_A, load) == {'quantity': 3}
+    assert document_cache.get(PART_B, load) == {'quantity': 2}
+    assert load.loaded == [PART_A, PART_B, PART_A]
+
+
+def test_invalidate_during_load():
+    """
+    Test that a document loaded before a concurrent write is not served after the write.
+    """
+    document_cache = DocumentCache('test_invalidate_during_load')
+    load = Loader({PART_A: {'quantity': 1}})
+
+    def load_before_write(object_id):
+        document = load(object_id)
+        load.documents[PART_A] = {'quantity': 2}
+        document_cache.invalidate([PART_A])
+        return document
+
+    assert document_cache.get(PART_A, load_before_write) == {'quantity': 1}
+    assert document_cache.get(PART_A, load) == {'quantity': 2}
+
+
+def test_invalidate_during_load_many():
+    """
+    Test that documents loaded with a single call before a concurrent write are not served after the write.
+    """
+    document_cache = DocumentCache('test_invalidate_during_load_many')
+    load = Loader({PART_A: {'quantity': 1}, PART_B: {'quantity': 1}})
+
+    def load_many_before_write(object_ids):
+        documents = load.load_many(object_ids)
+        load.documents[PART_A] = {'quantity': 2}
+        document_cache.invalidate([PART_A])
+        return documents
+
+    document_cache.get_many([PART_A, PART_B], load_many_before_write)
+
+    documents = document_cache.get_many([PART_A, PART_B], load.load_many)
+
+    assert documents == {PART_A: {'quantity': 2}, PART_B: {'quantity': 1}}
+    assert load.loaded[-1] == [PART_A]
+
+
+def test_invalidate_parts():
+    """
+    Test invalidating the cached parts after a write.
+    """
+    load = Loader({PART_A: b'{"quantity":1}'})
+    part_json_cache.get(PART_A, load)
+
+    invalidate_parts([PART_A])
+    part_json_cache.get(PART_A, load)
+
+    assert load.loaded == [PART_A, PART_A]
+
+
+def test_generation():
+    """
+    Test incrementing the generation of a collection, also after the counter was evicted.
+    """
+    generation = get_generation('test_generation')
+    bump_generation('test_generation')
+
+    assert get_generation('test_generation') == generation + 1
+
+    cache.delete('test_generation:generation')
+    bump_generation('test_generation')
+
+    assert get_generation('test_generation') is not None
+
+
+def test_search_key():
+    """
+    Test normalizing the query string of a search and stamping it with the generation of the parts.
+    """
+    key = get_search_key(QueryDict('room=1&ordering=price&fields=name'))
+
+    assert get_search_key(QueryDict('fields=name&room=1&ordering=price')) == key
+    assert get_search_key(QueryDict('fields=name&room=2&ordering=price')) != key
+
+    invalidate_parts([PART_A])
+
+    assert get_search_key(QueryDict('room=1&ordering=price&fields=name')) != key
+
+
+def test_cached_search():
+    """
+    Test running a search again only after a write to the parts.
+    """
+    searches = []
+
+    def search():
+        searches.append(len(searches))
+        return b'[]', len(searches)
+
+    assert get_cached_search(get_search_key(QueryDict('room=1')), search) == (b'[]', 1)
+    assert get_cached_search(get_search_key(QueryDict('room=1')), search) == (b'[]', 1)
+
+    invalidate_parts([PART_A])
+
+    assert get_cached_search(get_search_key(QueryDict('room=1')), search) == (b'[]', 2)
+    assert searches == [0, 1]
+
+
+def test_content_etag():
+    """
+    Test deriving a strong ETag from the encoded document.
+    """
+    etag = get_content_etag(b'{"quantity":1}')
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert get_content_etag(b'{"quantity":1}') == etag
+    assert get_content_etag(b'{"quantity":2}') != etag
+
+
+def test_query_key():
+    """
+    Test stamping the key of a list with the generation of the collection, so a write changes the key.
+    """
+    key = get_query_key('test_query_key', 'http://testserver/parts/?limit=2')
+
+    assert get_query_key('test_query_key', 'http://testserver/parts/?limit=2') == key
+    assert get_query_key('test_query_key', 'http://testserver/parts/?limit=3') != key
+
+    bump_generation('test_query_key')
+
+    assert get_query_key('test_query_key', 'http://testserver/parts/?limit=2') != key
+
+
+def test_conditional_response():
+    """
+    Test answering 304 Not Modified without getting the response if the client's copy is current.
+    """
+    factory = APIRequestFactory()
+    etag = get_content_etag(b'[]')
+    responses = []
+
+    def get_response():
+        responses.append(HttpResponse(b'[]', content_type='application/json'))
+        return responses[-1]
+
+    response = conditional_response(factory.get('/parts/'), etag, get_response)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['ETag'] == etag
+
+    response = conditional_response(factory.get('/parts/', HTTP_IF_NONE_MATCH=etag), etag, get_response)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response['ETag'] == etag
+    assert len(responses) == 1
+
+    response = conditional_response(factory.get('/parts/', HTTP_IF_NONE_MATCH='"stale"'), etag, get_response)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(responses) == 2
+
+
+def test_stats_view():
+    """
+    Test retrieving the counters of the caches.
+    """
+    document_cache = DocumentCache('test_stats_view')
+    document_cache.get(PART_A, Loader({}))
+
+    request = APIRequestFactory().get('/cache/stats/')
+    response = CacheStats.as_view()(request)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['test_stats_view'] == {'hits': 0, 'misses': 1, 'hit_ratio': 0.0}
+    assert 'parts_json' in response.data
+
+
+def test_stats_url():
+    """
+    Test resolving URLs for the cache counters view.
+    """
+    found = resolve(reverse('cache_stats'))
+
+    assert found.func.view_class == CacheStats
+    assert reverse('cache_stats') == '/cache/stats/'
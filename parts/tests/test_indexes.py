@@ -0,0 +1,86 @@
+"""
+This module contains unit tests for the indexes of the 'parts', 'categories' and 'reservations' collections.
+"""
+import pytest
+
+from django.core.management import call_command, CommandError
+from pymongo import ASCENDING, IndexModel
+
+from categories.models import Category
+from parts.indexes import INDEXES
+from parts.models import LOCATION_FIELDS, Part
+from reservations.models import Reservation
+from Parts_Warehouse_API.indexes import get_index_declarations, get_index_drift, get_model_index_keys
+
+
+def test_location_index_in_hierarchy_order():
+    """
+    Test that the location index keys follow the location hierarchy.
+    """
+    index = next(index.document for index in INDEXES if index.document['name'] == 'location_hierarchy')
+
+    assert list(index['key']) == [f'location.{field}' for field in LOCATION_FIELDS]
+
+
+def test_index_declarations():
+    """
+    Test that the indexes are declared for the 'parts', 'categories' and 'reservations' collections.
+    """
+    models = [declaration.model for declaration in get_index_declarations()]
+
+    assert Part in models
+    assert Category in models
+    assert Reservation in models
+
+
+def test_model_index_keys():
+    """
+    Test that the indexes created by djongo from the model fields are recognized.
+    """
+    assert get_model_index_keys(Part) == [[('serial_number', ASCENDING)], [('category_id', ASCENDING)]]
+
+
+@pytest.mark.django_db
+def test_indexes_created_after_migrations():
+    """
+    Test that the declared indexes exist in the test database.
+    """
+    for model, indexes in get_index_declarations():
+        drift = get_index_drift(model, indexes)
+
+        assert drift.missing == []
+        assert drift.changed == []
+
+
+@pytest.mark.django_db
+def test_sync_indexes_creates_missing_index():
+    """
+    Test that the sync_indexes command reports and creates a missing index.
+    """
+    Part.objects.mongo_drop_index('location_hierarchy')
+
+    with pytest.raises(CommandError):
+        call_command('sync_indexes', '--check')
+
+    call_command('sync_indexes')
+
+    assert 'location_hierarchy' in Part.objects.mongo_index_information()
+    call_command('sync_indexes', '--check')
+
+
+@pytest.mark.django_db
+def test_sync_indexes_drops_stale_index():
+    """
+    Test that the sync_indexes command drops a stale index only on request.
+    """
+    Part.objects.mongo_create_indexes([IndexModel([('name', ASCENDING)], name='stale_name')])
+
+    assert get_index_drift(Part, INDEXES).stale == ['stale_name']
+
+    call_command('sync_indexes')
+
+    assert 'stale_name' in Part.objects.mongo_index_information()
+
+    call_command('sync_indexes', '--drop-stale')
+
+    assert 'stale_name' not in Part.objects.mongo_index_information()
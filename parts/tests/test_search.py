@@ -0,0 +1,273 @@
+"""
+This module contains unit tests for testing the part search engines.
+"""
+import pytest
+
+from bson import ObjectId
+from django.http import QueryDict
+from django.test import override_settings
+from pymongo import ASCENDING, DESCENDING
+from rest_framework.exceptions import ValidationError
+
+from parts.search import MAX_LIMIT, TEXT_SEARCH_LIMIT, MongoSearchEngine, OrmSearchEngine, get_search_engine
+from Parts_Warehouse_API.pagination import is_count_only
+
+
+def test_compile_model_fields():
+    """
+    Test compiling filters on the model fields with their values coerced to the stored types.
+    """
+    category_id = '5fc6e6ba9f84e500c7f3b89c'
+    params = QueryDict(f'serial_number=abc&name=part_A&category_id={category_id}&quantity=12&price=0.82')
+
+    mongo_filter = MongoSearchEngine(params).compile_filters()
+
+    assert mongo_filter == {
+        'serial_number': 'abc',
+        'name': 'part_A',
+        'category_id': ObjectId(category_id),
+        'quantity': 12,
+        'price': 0.82,
+    }
+
+
+def test_compile_location_fields():
+    """
+    Test compiling filters on the location fields to dotted paths.
+    """
+    params = QueryDict('room=12&shelf=z')
+
+    mongo_filter = MongoSearchEngine(params).compile_filters()
+
+    assert mongo_filter == {'location.room': '12', 'location.shelf': 'z'}
+
+
+def test_compile_without_reserved_params():
+    """
+    Test that the reserved query parameters are not compiled into filters.
+    """
+    params = QueryDict('engine=mongo&name=part_A')
+
+    mongo_filter = MongoSearchEngine(params).compile_filters()
+
+    assert mongo_filter == {'name': 'part_A'}
+
+
+def test_compile_range_filters():
+    """
+    Test compiling range filters on quantity and price.
+    """
+    params = QueryDict('price__gte=1.5&price__lt=5&quantity__gt=0')
+
+    mongo_filter = MongoSearchEngine(params).compile_filters()
+
+    assert mongo_filter == {'price': {'$gte': 1.5, '$lt': 5.0}, 'quantity': {'$gt': 0}}
+
+
+def test_compile_exact_and_range_filters_on_same_field():
+    """
+    Test compiling an exact filter combined with a range filter on the same field.
+    """
+    params = QueryDict('quantity=3&quantity__lte=10')
+
+    mongo_filter = MongoSearchEngine(params).compile_filters()
+
+    assert mongo_filter == {'quantity': {'$eq': 3, '$lte': 10}}
+
+
+def test_compile_wrong_lookup():
+    """
+    Test compiling a range filter on a field that does not support it.
+    """
+    params = QueryDict('name__gte=a')
+
+    with pytest.raises(ValidationError) as error:
+        MongoSearchEngine(params).compile_filters()
+
+    assert str(error.value.detail['error']) == 'Invalid lookup: name__gte'
+
+
+def test_compile_location_lookup():
+    """
+    Test rejecting a lookup on a location field, instead of matching a location key containing '__'.
+    """
+    params = QueryDict('room__gte=3')
+
+    with pytest.raises(ValidationError) as error:
+        MongoSearchEngine(params).compile_filters()
+
+    assert str(error.value.detail['error']) == 'Invalid lookup: room__gte'
+    assert isinstance(get_search_engine(QueryDict('engine=orm&room__gte=3')), OrmSearchEngine)
+
+
+def test_ordering():
+    """
+    Test parsing the ordering parameter.
+    """
+    params = QueryDict('ordering=-price,-quantity')
+
+    assert MongoSearchEngine(params).get_ordering() == [('price', DESCENDING), ('quantity', DESCENDING)]
+    assert MongoSearchEngine(params).compile_filters() == {}
+
+
+@pytest.mark.parametrize('ordering', ['price,-quantity', '-quantity,price', 'price,-price'])
+def test_ordering_not_covered_by_index(ordering):
+    """
+    Test rejecting the orderings that no index can serve, which would be sorted in memory.
+    """
+    with pytest.raises(ValidationError):
+        MongoSearchEngine(QueryDict(f'ordering={ordering}')).get_ordering()
+
+
+def test_wrong_ordering():
+    """
+    Test parsing the ordering parameter with a field that cannot be used for ordering.
+    """
+    params = QueryDict('ordering=description')
+
+    with pytest.raises(ValidationError) as error:
+        MongoSearchEngine(params).get_ordering()
+
+    assert error.type == ValidationError
+
+
+def test_compile_text_search():
+    """
+    Test compiling a full-text search combined with a filter.
+    """
+    params = QueryDict('q=ceramic+100nF&quantity__gt=0')
+
+    mongo_filter = MongoSearchEngine(params).compile_filters()
+
+    assert mongo_filter == {'quantity': {'$gt': 0}, '$text': {'$search': 'ceramic 100nF'}}
+
+
+def test_limit():
+    """
+    Test parsing the limit parameter, capped at the maximum limit.
+    """
+    assert MongoSearchEngine(QueryDict('limit=5')).get_limit() == 5
+    assert MongoSearchEngine(QueryDict('limit=5000')).get_limit() == MAX_LIMIT
+    assert MongoSearchEngine(QueryDict('')).get_limit(TEXT_SEARCH_LIMIT) == TEXT_SEARCH_LIMIT
+
+
+def test_wrong_limit():
+    """
+    Test parsing a limit that is not a positive integer.
+    """
+    with pytest.raises(ValidationError) as error:
+        MongoSearchEngine(QueryDict('limit=0')).get_limit()
+
+    assert error.type == ValidationError
+
+
+def test_compile_wrong_category_id():
+    """
+    Test compiling a filter with an invalid category_id.
+    """
+    params = QueryDict('category_id=wrong_id')
+
+    with pytest.raises(ValidationError) as error:
+        MongoSearchEngine(params).compile_filters()
+
+    assert error.type == ValidationError
+
+
+def test_compile_wrong_quantity():
+    """
+    Test compiling a filter with a quantity that is not an integer.
+    """
+    params = QueryDict('quantity=abc')
+
+    with pytest.raises(ValidationError) as error:
+        MongoSearchEngine(params).compile_filters()
+
+    assert str(error.value.detail['error']) == 'Invalid value for quantity: abc'
+
+
+def test_get_search_engine_from_param():
+    """
+    Test selecting the search engine with the 'engine' query parameter.
+    """
+    assert isinstance(get_search_engine(QueryDict('engine=mongo')), MongoSearchEngine)
+    assert isinstance(get_search_engine(QueryDict('engine=orm')), OrmSearchEngine)
+
+
+@override_settings(PARTS_SEARCH_ENGINE='mongo')
+def test_get_search_engine_from_settings():
+    """
+    Test selecting the search engine with the 'PARTS_SEARCH_ENGINE' setting.
+    """
+    assert isinstance(get_search_engine(QueryDict('name=part_A')), MongoSearchEngine)
+
+
+def test_get_search_engine_for_text_search():
+    """
+    Test that the full-text search is always run by the mongo engine.
+    """
+    assert isinstance(get_search_engine(QueryDict('engine=orm&q=resistor')), MongoSearchEngine)
+
+
+def test_get_search_engine_for_location():
+    """
+    Test that the searches filtering on the location are always run by the mongo engine.
+    """
+    assert isinstance(get_search_engine(QueryDict('engine=orm&room=A')), MongoSearchEngine)
+    assert isinstance(get_search_engine(QueryDict('engine=orm&quantity__gte=5')), OrmSearchEngine)
+
+
+def test_orm_location_filters():
+    """
+    Test rejecting the location filters in the ORM engine, instead of resolving them to a list of ids.
+    """
+    with pytest.raises(ValidationError) as error:
+        OrmSearchEngine(QueryDict('room=A')).get_queryset()
+
+    assert str(error.value.detail['error']) == 'The location filters require the mongo engine.'
+
+
+def test_get_wrong_search_engine():
+    """
+    Test selecting a search engine that does not exist.
+    """
+    with pytest.raises(ValidationError) as error:
+        get_search_engine(QueryDict('engine=wrong_engine'))
+
+    assert error.type == ValidationError
+
+
+def test_fields():
+    """
+    Test parsing the selected fields, always starting with '_id', without compiling them into filters.
+    """
+    engine = MongoSearchEngine(QueryDict('fields=name,quantity&name=part_A'))
+
+    assert engine.get_fields() == ['_id', 'name', 'quantity']
+    assert engine.compile_filters() == {'name': 'part_A'}
+
+
+def test_wrong_fields():
+    """
+    Test rejecting a selected field that is not a field of the model.
+    """
+    with pytest.raises(ValidationError):
+        MongoSearchEngine(QueryDict('fields=name,room')).get_fields()
+
+
+def test_count_only_is_not_compiled():
+    """
+    Test compiling the filters used to count the parts of any engine, without the 'count_only' parameter.
+    """
+    params = QueryDict('count_only=1&quantity__gte=5&room=A')
+
+    assert OrmSearchEngine(params).compile_filters() == {'quantity': {'$gte': 5}, 'location.room': 'A'}
+
+
+def test_is_count_only():
+    """
+    Test detecting the count-only requests.
+    """
+    assert is_count_only(QueryDict('count_only=1'))
+    assert is_count_only(QueryDict('count_only=True'))
+    assert not is_count_only(QueryDict('count_only=0'))
+    assert not is_count_only(QueryDict(''))
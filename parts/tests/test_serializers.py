@@ -8,7 +8,8 @@ from rest_framework.exceptions import ValidationError
 
 from .factories import PartFactory
 from categories.tests.factories import SideCategoryFactory, MainCategoryFactory
-from parts.serializers import PartSerializer
+from parts.models import Part
+from parts.serializers import PartSerializer, part_document_representation
 
 
 class TestPartSerializer(TestCase):
@@ -107,3 +108,46 @@ class TestPartSerializer(TestCase):
             self.serializer.validate(part_attrs_with_main_category)
 
         assert error.type == ValidationError
+
+    def test_part_document_representation(self):
+        """
+        Test that the representation of a raw document matches the serialized data.
+        """
+        document = Part.objects.mongo_find_one({'_id': self.part._id})
+
+        assert part_document_representation(document) == self.serializer.data
+
+    def test_get_changed_fields(self):
+        """
+        Test that only the changed fields and location keys are set.
+        """
+        location = {**self.part_attributes['location'], 'shelf': 'y'}
+        validated_data = {'name': self.part_attributes['name'], 'price': 1.5, 'location': location}
+
+        fields = self.serializer.get_changed_fields(self.part, validated_data)
+
+        assert fields == {'price': 1.5, 'location.shelf': 'y'}
+
+    def test_update_changed_fields(self):
+        """
+        Test updating a part with a partial '$set' of the changed fields.
+        """
+        serializer = PartSerializer(self.part, data={'quantity': 5, 'location': {'room': '13'}}, partial=True)
+        serializer.is_valid(raise_exception=True)
+
+        serializer.save()
+
+        document = Part.objects.mongo_find_one({'_id': self.part._id})
+        assert document['quantity'] == 5
+        assert document['location'] == {**self.part_attributes['location'], 'room': '13'}
+        assert document['name'] == self.part_attributes['name']
+
+    def test_update_with_wrong_location(self):
+        """
+        Test updating a part with a location key that is not allowed.
+        """
+        serializer = PartSerializer(self.part, data={'location': {'wrong_field': '1'}}, partial=True)
+        serializer.is_valid(raise_exception=True)
+
+        with pytest.raises(ValidationError):
+            serializer.save()
@@ -0,0 +1,121 @@
+"""
+This module contains unit tests for testing the coalescing of identical concurrent reads.
+"""
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from Parts_Warehouse_API.singleflight import SingleFlight
+
+
+class SlowComputation:
+    """
+    Computation blocked until it is released, counting its runs.
+    """
+    def __init__(self, result=b'[]', error: Exception | None = None):
+        self.result = result
+        self.error = error
+        self.started = Event()
+        self.released = Event()
+        self.runs = 0
+
+    def __call__(self):
+        self.runs += 1
+        self.started.set()
+        assert self.released.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def run_in_threads(single_flight: SingleFlight, key: str, compute: SlowComputation, number: int) -> list:
+    """
+    Start a first computation, then identical concurrent ones, and release the computation.
+    """
+    results = [None] * number
+
+    def target(index):
+        try:
+            results[index] = single_flight.do(key, compute)
+        except Exception as error:
+            results[index] = error
+
+    threads = [Thread(target=target, args=(index,)) for index in range(number)]
+    threads[0].start()
+    assert compute.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    sleep(0.05)
+    compute.released.set()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_coalesce_concurrent_calls():
+    """
+    Test computing the result once for the identical concurrent calls.
+    """
+    compute = SlowComputation()
+
+    results = run_in_threads(SingleFlight(False, 5), 'key', compute, 5)
+
+    assert results == [b'[]'] * 5
+    assert compute.runs == 1
+
+
+def test_share_error():
+    """
+    Test raising the error of the computation in all the concurrent calls.
+    """
+    compute = SlowComputation(error=ValueError('failed'))
+
+    results = run_in_threads(SingleFlight(False, 5), 'key', compute, 3)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert compute.runs == 1
+
+
+def test_no_result_after_flight():
+    """
+    Test computing the result again once the previous computation is finished.
+    """
+    single_flight = SingleFlight(False, 5)
+
+    assert single_flight.do('key', lambda: 1) == 1
+    assert single_flight.do('key', lambda: 2) == 2
+    assert single_flight.flights == {}
+
+
+def test_coalesce_across_workers():
+    """
+    Test taking the result computed by another worker through the cache.
+    """
+    first_worker, second_worker = SingleFlight(True, 5), SingleFlight(True, 5)
+    compute = SlowComputation()
+    thread = Thread(target=first_worker.do, args=('shared_key', compute))
+    thread.start()
+    assert compute.started.wait(5)
+
+    Thread(target=lambda: (sleep(0.05), compute.released.set())).start()
+
+    assert second_worker.do('shared_key', lambda: pytest.fail('computed twice')) == b'[]'
+    thread.join(5)
+    assert compute.runs == 1
+
+
+def test_compute_after_timeout():
+    """
+    Test computing the result when the other worker does not finish in time.
+    """
+    first_worker, second_worker = SingleFlight(True, 5), SingleFlight(True, 0.05)
+    compute = SlowComputation()
+    thread = Thread(target=first_worker.do, args=('slow_key', compute))
+    thread.start()
+    assert compute.started.wait(5)
+
+    assert second_worker.do('slow_key', lambda: b'{}') == b'{}'
+
+    compute.released.set()
+    thread.join(5)
@@ -0,0 +1,125 @@
+"""
+This module contains unit tests for testing the buffer of the stock movements.
+"""
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from parts import stock
+from parts.stock import StockBuffer, get_stock_filter
+
+
+PART_A = ObjectId('5fc6e6ba9f84e500c7f3b89c')
+PART_B = ObjectId('5fc6e6ba9f84e500c7f3b89d')
+
+
+def test_stock_filter():
+    """
+    Test that only a decrement requires the quantity to cover the delta.
+    """
+    assert get_stock_filter(PART_A, 5) == {'_id': PART_A}
+    assert get_stock_filter(PART_A, -5) == {'_id': PART_A, 'quantity': {'$gte': 5}}
+
+
+def test_buffer_sums_increments_per_part():
+    """
+    Test summing the buffered increments of each part.
+    """
+    buffer = StockBuffer(interval=60, max_size=10)
+
+    buffer.add(PART_A, 5)
+    buffer.add(PART_A, 2)
+    buffer.add(PART_B, 3)
+
+    assert buffer.drain() == {PART_A: 7, PART_B: 3}
+    assert buffer.drain() == {}
+    assert buffer.timer is None
+
+
+@pytest.mark.parametrize('delta', [0, -2])
+def test_buffer_rejects_decrements(delta):
+    """
+    Test that only the increments can be buffered, so a decrement never cancels other movements.
+    """
+    buffer = StockBuffer(interval=60, max_size=10)
+
+    with pytest.raises(ValueError):
+        buffer.add(PART_A, delta)
+
+    assert buffer.drain() == {}
+
+
+def test_buffer_keeps_increments_after_failed_write():
+    """
+    Test putting the increments back in the buffer when the write fails.
+    """
+    buffer = StockBuffer(interval=60, max_size=10)
+    buffer.add(PART_B, 1)
+
+    with mock.patch.object(stock, 'Part') as part, mock.patch.object(stock, 'invalidate_parts'):
+        part.objects.mongo_bulk_write.side_effect = AutoReconnect()
+        buffer.write({PART_A: 5, PART_B: 2})
+
+    assert buffer.drain() == {PART_A: 5, PART_B: 3}
+
+
+def test_buffer_stays_bounded_when_writes_fail():
+    """
+    Test refusing the increments of new parts while the restored increments fill the buffer.
+    """
+    buffer = StockBuffer(interval=60, max_size=1)
+
+    with mock.patch.object(stock, 'Part') as part, mock.patch.object(stock, 'invalidate_parts'):
+        part.objects.mongo_bulk_write.side_effect = AutoReconnect()
+        assert buffer.add(PART_A, 5) is True
+        assert buffer.add(PART_B, 2) is False
+        assert buffer.add(PART_A, 1) is True
+
+    assert buffer.writing == 0
+    assert buffer.drain() == {PART_A: 6}
+
+
+def test_buffer_keeps_rejected_increments():
+    """
+    Test putting only the rejected increments back in the buffer when some operations of the write fail.
+    """
+    buffer = StockBuffer(interval=60, max_size=10)
+
+    with mock.patch.object(stock, 'Part') as part, mock.patch.object(stock, 'invalidate_parts'):
+        part.objects.mongo_bulk_write.side_effect = BulkWriteError({'writeErrors': [{'index': 1}]})
+        buffer.write({PART_A: 5, PART_B: 2})
+
+    assert buffer.drain() == {PART_B: 2}
+
+
+def test_buffer_flushes_synchronously_when_full():
+    """
+    Test flushing the buffer synchronously when a new part does not fit in it.
+    """
+    buffer = StockBuffer(interval=60, max_size=1)
+
+    with mock.patch.object(buffer, 'write') as write:
+        buffer.add(PART_A, 5)
+        buffer.add(PART_A, 1)
+        write.assert_not_called()
+
+        buffer.add(PART_B, 2)
+        write.assert_called_once_with({PART_A: 6})
+
+    assert buffer.drain() == {PART_B: 2}
+
+
+def test_buffer_flushes_after_interval():
+    """
+    Test flushing the buffer by the timer started with the first buffered movement.
+    """
+    buffer = StockBuffer(interval=0.01, max_size=10)
+
+    with mock.patch.object(buffer, 'write') as write:
+        buffer.add(PART_A, 5)
+        buffer.timer.join()
+
+    write.assert_called_once_with({PART_A: 5})
+    assert buffer.timer is None
@@ -3,7 +3,9 @@ This module contains unit tests for testing the URL patterns related to part man
 """
 from django.urls import resolve, reverse
 
-from parts.views import PartsList, PartSearch, PartDetails
+from parts.views import (
+    PartsList, PartsBatch, PartsBulk, PartSearch, PartDetails, PartAutocomplete, PartBySerialNumber, PartsExport, PartStock,
+)
 
 
 def test_list():
@@ -17,6 +19,28 @@ def test_list():
     assert resolve('/parts/').view_name == 'parts:parts_list'
 
 
+def test_batch():
+    """
+    Test resolving URLs for the parts batch view.
+    """
+    found = resolve(reverse('parts:parts_batch'))
+
+    assert found.func.view_class == PartsBatch
+    assert reverse('parts:parts_batch') == '/parts/batch/'
+    assert resolve('/parts/batch/').view_name == 'parts:parts_batch'
+
+
+def test_bulk():
+    """
+    Test resolving URLs for the parts bulk view.
+    """
+    found = resolve(reverse('parts:parts_bulk'))
+
+    assert found.func.view_class == PartsBulk
+    assert reverse('parts:parts_bulk') == '/parts/bulk/'
+    assert resolve('/parts/bulk/').view_name == 'parts:parts_bulk'
+
+
 def test_search():
     """
     Test resolving URLs for the part search view.
@@ -28,6 +52,39 @@ def test_search():
     assert resolve('/parts/search/').view_name == 'parts:parts_search'
 
 
+def test_autocomplete():
+    """
+    Test resolving URLs for the part autocomplete view.
+    """
+    found = resolve(reverse('parts:parts_autocomplete'))
+
+    assert found.func.view_class == PartAutocomplete
+    assert reverse('parts:parts_autocomplete') == '/parts/autocomplete/'
+    assert resolve('/parts/autocomplete/').view_name == 'parts:parts_autocomplete'
+
+
+def test_by_serial_number():
+    """
+    Test resolving URLs for the part by serial number view.
+    """
+    found = resolve(reverse('parts:part_by_serial_number', args=['123123a']))
+
+    assert found.func.view_class == PartBySerialNumber
+    assert reverse('parts:part_by_serial_number', args=['123123a']) == '/parts/by-serial/123123a/'
+    assert resolve('/parts/by-serial/123123a/').view_name == 'parts:part_by_serial_number'
+
+
+def test_export():
+    """
+    Test resolving URLs for the parts export view.
+    """
+    found = resolve(reverse('parts:parts_export'))
+
+    assert found.func.view_class == PartsExport
+    assert reverse('parts:parts_export') == '/parts/export/'
+    assert resolve('/parts/export/').view_name == 'parts:parts_export'
+
+
 def test_details():
     """
     Test resolving URLs for the part details view.
@@ -37,3 +94,15 @@ def test_details():
     assert found.func.view_class == PartDetails
     assert reverse('parts:part_details', kwargs={'object_id': '1'}) == '/parts/1/'
     assert resolve('/parts/1/').view_name == 'parts:part_details'
+
+
+def test_stock():
+    """
+    Test resolving URLs for the part stock view.
+    """
+    object_id = '5fc6e6ba9f84e500c7f3b89c'
+    found = resolve(reverse('parts:part_stock', args=[object_id]))
+
+    assert found.func.view_class == PartStock
+    assert reverse('parts:part_stock', args=[object_id]) == f'/parts/{object_id}/stock/'
+    assert resolve(f'/parts/{object_id}/stock/').view_name == 'parts:part_stock'
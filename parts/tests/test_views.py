@@ -2,9 +2,13 @@
 This module contains unit test cases for testing the API views related to part management.
 """
 import json
+from unittest import mock
 
 from bson import ObjectId
 
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIRequestFactory, APITestCase
@@ -13,7 +17,10 @@ from .factories import PartFactory
 from categories.tests.factories import SideCategoryFactory, MainCategoryFactory
 from parts.models import Part
 from parts.serializers import PartSerializer
-from parts.views import PartsList, PartDetails, PartSearch
+from parts.stock import stock_buffer
+from parts.views import (
+    PartsList, PartsBatch, PartsBulk, PartDetails, PartSearch, PartAutocomplete, PartBySerialNumber, PartsExport, PartStock,
+)
 
 
 class TestPartsList(APITestCase):
@@ -32,14 +39,16 @@ class TestPartsList(APITestCase):
         Test retrieving a list of parts.
         """
         PartFactory.create_batch(10)
-        parts = Part.objects.all()
+        parts = Part.objects.order_by('_id')
 
         request = self.factory.get('/parts/')
         response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 10
-        assert response.data == PartSerializer(parts, many=True).data
+        assert len(data['results']) == 10
+        assert data['results'] == PartSerializer(parts, many=True).data
+        assert data['next'] is None
 
     def get_parts_no_results(self):
         """
@@ -47,9 +56,157 @@ class TestPartsList(APITestCase):
         """
         request = self.factory.get('/parts/')
         response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 0
+        assert len(data['results']) == 0
+
+    def test_get_parts_queries_count_independent_of_parts_number(self):
+        """
+        Test that listing parts does not issue a query per part.
+        """
+        PartFactory.create_batch(2)
+        with CaptureQueriesContext(connection) as few_parts_queries:
+            self.view(self.factory.get('/parts/'))
+
+        PartFactory.create_batch(10)
+        with CaptureQueriesContext(connection) as many_parts_queries:
+            response = self.view(self.factory.get('/parts/'))
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert len(data['results']) == 12
+        assert len(many_parts_queries) == len(few_parts_queries)
+
+    def test_get_parts_with_fields(self):
+        """
+        Test retrieving a list of parts with a subset of their fields.
+        """
+        part = PartFactory()
+
+        request = self.factory.get('/parts/', {'fields': 'name,quantity'})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data['results'] == [{'_id': str(part._id), 'name': part.name, 'quantity': part.quantity}]
+
+    def test_get_parts_total_count(self):
+        """
+        Test retrieving a page of parts with the total number of parts in the header.
+        """
+        PartFactory.create_batch(3)
+
+        request = self.factory.get('/parts/', {'limit': 2})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert len(data['results']) == 2
+        assert response['X-Total-Count'] == '3'
+
+    def test_get_parts_count_only(self):
+        """
+        Test retrieving only the number of parts.
+        """
+        PartFactory.create_batch(3)
+
+        request = self.factory.get('/parts/', {'count_only': 1})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data == {'count': 3}
+
+    def test_get_parts_not_modified(self):
+        """
+        Test revalidating a page of parts with its ETag, before and after a part is deleted.
+        """
+        part, _ = PartFactory.create_batch(2)
+        etag = self.view(self.factory.get('/parts/'))['ETag']
+
+        response = self.view(self.factory.get('/parts/', HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert response.content == b''
+
+        PartDetails.as_view()(self.factory.delete(f'parts/{part._id}/'), object_id=part._id)
+        response = self.view(self.factory.get('/parts/', HTTP_IF_NONE_MATCH=etag))
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(data['results']) == 1
+
+    def test_get_parts_pages(self):
+        """
+        Test walking through the list of parts with the cursor from the 'next' link.
+        """
+        PartFactory.create_batch(5)
+        parts = PartSerializer(Part.objects.order_by('_id'), many=True).data
+
+        request = self.factory.get('/parts/', {'limit': 2})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+        results = list(data['results'])
+        while data['next']:
+            request = self.factory.get(data['next'])
+            response = self.view(request)
+            data = json.loads(response.content.decode('utf-8'))
+            results.extend(data['results'])
+
+            assert response.status_code == status.HTTP_200_OK
+            assert len(data['results']) <= 2
+
+        assert results == parts
+
+    def test_get_parts_limit_above_maximum(self):
+        """
+        Test that the page size cannot exceed the maximum page size.
+        """
+        PartFactory.create_batch(3)
+
+        with mock.patch.object(PartsList.pagination_class, 'max_page_size', 2):
+            request = self.factory.get('/parts/', {'limit': 3})
+            response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(data['results']) == 2
+        assert data['next'] is not None
+
+    def test_get_parts_invalid_cursor(self):
+        """
+        Test retrieving a list of parts with an invalid cursor.
+        """
+        request = self.factory.get('/parts/', {'cursor': 'wrong_cursor'})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_parts_by_ids(self):
+        """
+        Test retrieving parts by their ids in the order of the request.
+        """
+        part_a, part_b, _ = PartFactory(), PartFactory(), PartFactory()
+        missing_id = '5fc6e6ba9f84e500c7f3b123'
+
+        request = self.factory.get('/parts/', {'ids': f'{part_b._id},{missing_id},{part_a._id}'})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert data == {
+            'results': [PartSerializer(part_b).data, PartSerializer(part_a).data],
+            'missing': [missing_id],
+        }
+
+    def test_get_parts_by_wrong_ids(self):
+        """
+        Test retrieving parts by ids that are not valid ObjectIds.
+        """
+        request = self.factory.get('/parts/', {'ids': 'wrong_id'})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_successfully_create_part(self):
         """
@@ -129,6 +286,279 @@ class TestPartsList(APITestCase):
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+class TestPartsBatch(APITestCase):
+    """
+    Test case class for testing the PartsBatch API view.
+    """
+    def setUp(self):
+        """
+        Set up necessary components for each test.
+        """
+        self.factory = APIRequestFactory()
+        self.view = PartsBatch.as_view()
+        self.part_a, self.part_b = PartFactory(), PartFactory()
+
+    def test_get_parts_by_ids(self):
+        """
+        Test retrieving parts by a JSON list of ids.
+        """
+        missing_id = '5fc6e6ba9f84e500c7f3b123'
+        payload = {'ids': [str(self.part_b._id), missing_id, str(self.part_a._id)]}
+
+        request = self.factory.post('/parts/batch/', payload, format='json')
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [part['_id'] for part in data['results']] == [str(self.part_b._id), str(self.part_a._id)]
+        assert data['missing'] == [missing_id]
+
+    def test_get_parts_by_form_ids(self):
+        """
+        Test retrieving parts by a comma-separated form field.
+        """
+        request = self.factory.post('/parts/batch/', {'ids': f'{self.part_a._id},{self.part_b._id}'})
+        response = self.view(request)
+        data = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [part['_id'] for part in data['results']] == [str(self.part_a._id), str(self.part_b._id)]
+
+    def test_get_parts_without_ids(self):
+        """
+        Test retrieving parts without ids.
+        """
+        request = self.factory.post('/parts/batch/', {}, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'error': 'The ids must be a non-empty list.'}
+
+
+class TestPartsBulk(APITestCase):
+    """
+    Test case class for testing the PartsBulk API view.
+    """
+    def setUp(self):
+        """
+        Set up necessary components for each test.
+        """
+        self.factory = APIRequestFactory()
+        self.view = PartsBulk.as_view()
+        self.category = SideCategoryFactory()
+
+    def get_row(self, serial_number: str, **kwargs) -> dict:
+        """
+        Get a valid row for the bulk creation of parts.
+        """
+        return {
+            'serial_number': serial_number,
+            'name': 'part_A',
+            'description': 'test descrption',
+            'category_id': str(self.category._id),
+            'quantity': 222,
+            'price': 10.82,
+            'room': '99',
+            'shelf': 'zy',
+            **kwargs,
+        }
+
+    def test_successfully_create_parts(self):
+        """
+        Test successfully creating many parts.
+        """
+        payload = [self.get_row('123123a'), self.get_row('123123b', quantity=5)]
+
+        request = self.factory.post('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['errors'] == []
+        assert [part['index'] for part in response.data['results']] == [0, 1]
+        assert response.data['results'][1]['quantity'] == 5
+        assert response.data['results'][1]['location'] == {'room': '99', 'shelf': 'zy'}
+        assert response.data['results'][1]['category_id'] == str(self.category._id)
+        assert Part.objects.get(serial_number='123123b').quantity == 5
+
+    def test_partially_create_parts(self):
+        """
+        Test creating many parts with invalid rows.
+        """
+        PartFactory(serial_number='123123c')
+        main_category = MainCategoryFactory()
+        payload = [
+            self.get_row('123123a'),
+            self.get_row('123123b', category_id=str(main_category._id)),
+            self.get_row('123123d', wrong_field='x'),
+            self.get_row('123123e', quantity=-1),
+            self.get_row('123123a'),
+            self.get_row('123123c'),
+            self.get_row('123123f', category_id='wrong_id'),
+        ]
+
+        request = self.factory.post('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert [part['index'] for part in response.data['results']] == [0]
+        assert [error['index'] for error in response.data['errors']] == [1, 2, 3, 4, 5, 6]
+        assert response.data['errors'][0]['category_id'] == ['Cannot add data to a base category.']
+        assert response.data['errors'][1]['location'] == ['Invalid field: wrong_field']
+        assert 'quantity' in response.data['errors'][2]
+        assert response.data['errors'][3]['serial_number'] == ['Duplicate serial number in the request.']
+        assert response.data['errors'][4]['serial_number'] == ['Part with this serial number already exists.']
+        assert 'category_id' in response.data['errors'][5]
+        assert Part.objects.filter(serial_number__in=['123123b', '123123d', '123123e', '123123f']).count() == 0
+
+    def test_unsuccessfully_create_parts(self):
+        """
+        Test creating many parts when all rows are invalid.
+        """
+        payload = [self.get_row('123123a', category_id=None), 'wrong_row']
+
+        request = self.factory.post('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['results'] == []
+        assert response.data['errors'] == [
+            {'index': 0, 'category_id': ['This field is required.']},
+            {'index': 1, 'error': 'Each row must be an object.'},
+        ]
+
+    def test_create_parts_without_list(self):
+        """
+        Test creating many parts with a request that is not a list.
+        """
+        request = self.factory.post('/parts/bulk/', self.get_row('123123a'), format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'error': 'The request must be a non-empty list.'}
+
+
+    def test_successfully_update_parts(self):
+        """
+        Test successfully updating many parts.
+        """
+        category = SideCategoryFactory()
+        part_a = PartFactory(location={'room': '1', 'shelf': 'a'})
+        part_b = PartFactory()
+        payload = [
+            {'_id': str(part_a._id), 'changes': {'quantity': 5, 'shelf': 'b'}},
+            {'_id': str(part_b._id), 'changes': {'name': 'part_B', 'category_id': str(category._id)}},
+        ]
+
+        request = self.factory.patch('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            'results': [{'index': 0, '_id': str(part_a._id)}, {'index': 1, '_id': str(part_b._id)}],
+            'errors': [],
+        }
+        part_a.refresh_from_db()
+        part_b.refresh_from_db()
+        assert part_a.quantity == 5
+        assert part_a.location == {'room': '1', 'shelf': 'b'}
+        assert part_b.name == 'part_B'
+        assert part_b.category_id_id == category._id
+
+    def test_partially_update_parts(self):
+        """
+        Test updating many parts with invalid items.
+        """
+        part_a, part_b, part_c = PartFactory(), PartFactory(), PartFactory()
+        main_category = MainCategoryFactory()
+        payload = [
+            {'_id': str(part_a._id), 'changes': {'quantity': 5}},
+            {'_id': str(part_a._id), 'changes': {'quantity': 6}},
+            {'_id': str(part_b._id), 'changes': {'category_id': str(main_category._id)}},
+            {'_id': str(part_c._id), 'changes': {'serial_number': part_b.serial_number}},
+            {'_id': '5fc6e6ba9f84e500c7f3b123', 'changes': {'quantity': 5}},
+            {'_id': str(PartFactory()._id), 'changes': {'wrong_field': 'x', 'price': 'x'}},
+            {'_id': str(part_b._id)},
+        ]
+
+        request = self.factory.patch('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert response.data['results'] == [{'index': 0, '_id': str(part_a._id)}]
+        assert response.data['errors'][0] == {'index': 1, '_id': ['Duplicate _id in the request.']}
+        assert response.data['errors'][1] == {'index': 2, 'category_id': ['Cannot add data to a base category.']}
+        assert response.data['errors'][2] == {
+            'index': 3, 'serial_number': ['Part with this serial number already exists.'],
+        }
+        assert response.data['errors'][3] == {'index': 4, '_id': ['Part not found.']}
+        assert response.data['errors'][4]['location'] == ['Invalid field: wrong_field']
+        assert 'price' in response.data['errors'][4]
+        assert response.data['errors'][5]['index'] == 6
+        part_a.refresh_from_db()
+        part_b.refresh_from_db()
+        assert part_a.quantity == 5
+        assert part_b.category_id_id != main_category._id
+
+
+    def test_delete_parts_by_ids(self):
+        """
+        Test deleting many parts by their ids.
+        """
+        part_a, part_b, part_c = PartFactory(), PartFactory(), PartFactory()
+        payload = {'ids': [str(part_a._id), str(part_b._id)]}
+
+        request = self.factory.delete('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'deleted': 2}
+        assert list(Part.objects.values_list('_id', flat=True)) == [part_c._id]
+
+    def test_delete_parts_by_filter(self):
+        """
+        Test deleting many parts by a search filter.
+        """
+        PartFactory(price=1.5, location={'room': '12'})
+        PartFactory(price=7.5, location={'room': '12'})
+        part = PartFactory(price=1.5, location={'room': '13'})
+        payload = {'filter': {'room': '12', 'price__lt': 5}}
+
+        request = self.factory.delete('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'deleted': 1}
+        assert Part.objects.count() == 2
+        assert Part.objects.filter(pk=part._id).exists()
+
+    def test_delete_parts_dry_run(self):
+        """
+        Test counting the parts to delete without deleting them.
+        """
+        PartFactory(location={'room': '12'})
+        PartFactory(location={'room': '12'})
+        payload = {'filter': {'room': '12'}, 'dry_run': True}
+
+        request = self.factory.delete('/parts/bulk/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'count': 2}
+        assert Part.objects.count() == 2
+
+    def test_delete_parts_without_selection(self):
+        """
+        Test deleting many parts without ids or filter.
+        """
+        PartFactory()
+
+        request = self.factory.delete('/parts/bulk/', {}, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Part.objects.count() == 1
+
+
 class TestPartDetails(APITestCase):
     """
     Test case class for testing the PartDetails API view.
@@ -165,15 +595,57 @@ class TestPartDetails(APITestCase):
         """
         request = self.factory.get(f'parts/{self.part._id}/')
         response = self.view(request, object_id=self.part._id)
+        data = json.loads(response.content.decode('utf-8'))
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data.get('serial_number') == self.part.serial_number
-        assert response.data.get('name') == self.part.name
-        assert response.data.get('description') == self.part.description
-        assert response.data.get('category_id') == str(self.part.category_id._id)
-        assert response.data.get('quantity') == self.part.quantity
-        assert response.data.get('price') == self.part.price
-        assert response.data.get('location') == self.part.location
+        assert data.get('serial_number') == self.part.serial_number
+        assert data.get('name') == self.part.name
+        assert data.get('description') == self.part.description
+        assert data.get('category_id') == str(self.part.category_id._id)
+        assert data.get('quantity') == self.part.quantity
+        assert data.get('price') == self.part.price
+        assert data.get('location') == self.part.location
+
+    def test_get_part_details_not_modified(self):
+        """
+        Test revalidating the details of a part with its ETag, before and after an update.
+        """
+        object_id = self.part._id
+        etag = self.view(self.factory.get(f'parts/{object_id}/'), object_id=object_id)['ETag']
+
+        response = self.view(self.factory.get(f'parts/{object_id}/', HTTP_IF_NONE_MATCH=etag), object_id=object_id)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert response.content == b''
+
+        self.view(self.factory.put(f'parts/{object_id}/', {'quantity': 3}, format='json'), object_id=object_id)
+        response = self.view(self.factory.get(f'parts/{object_id}/', HTTP_IF_NONE_MATCH=etag), object_id=object_id)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_get_part_details_after_update(self):
+        """
+        Test retrieving the updated details of a part after reading the cached details.
+        """
+        self.view(self.factory.get(f'parts/{self.part._id}/'), object_id=self.part._id)
+        self.view(self.factory.put(f'parts/{self.part._id}/', {'quantity': 3}, format='json'), object_id=self.part._id)
+
+        response = self.view(self.factory.get(f'parts/{self.part._id}/'), object_id=self.part._id)
+
+        assert json.loads(response.content.decode('utf-8')).get('quantity') == 3
+
+    def test_get_part_details_after_delete(self):
+        """
+        Test retrieving the details of a deleted part after reading the cached details.
+        """
+        self.view(self.factory.get(f'parts/{self.part._id}/'), object_id=self.part._id)
+        self.view(self.factory.delete(f'parts/{self.part._id}/'), object_id=self.part._id)
+
+        response = self.view(self.factory.get(f'parts/{self.part._id}/'), object_id=self.part._id)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_get_non_existent_part_details(self):
         """
@@ -354,6 +826,22 @@ class TestPartDetails(APITestCase):
         response = self.view(request, object_id=self.part._id)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'location': [ErrorDetail(string='Invalid field: wrong_field', code='invalid')]}
+
+    def test_update_keeps_unchanged_location_keys(self):
+        """
+        Test that updating one location key keeps the other location keys of a part.
+        """
+        payload = {'price': 1.5, 'shelf': 'ab'}
+
+        request = self.factory.put(f'/parts/{self.part._id}', payload, format='json')
+        response = self.view(request, object_id=self.part._id)
+
+        assert response.status_code == status.HTTP_200_OK
+        document = Part.objects.mongo_find_one({'_id': self.part._id})
+        assert document['price'] == 1.5
+        assert document['location'] == {**self.part_attrs['location'], 'shelf': 'ab'}
+        assert document['description'] == self.part_attrs['description']
 
     def test_delete_part(self):
         """
@@ -365,6 +853,156 @@ class TestPartDetails(APITestCase):
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
+class TestPartStock(APITestCase):
+    """
+    Test case class for testing the PartStock API view.
+    """
+    def setUp(self):
+        """
+        Set up necessary components for each test.
+        """
+        self.factory = APIRequestFactory()
+        self.view = PartStock.as_view()
+        self.part = PartFactory(quantity=10)
+
+    def test_increment_stock(self):
+        """
+        Test incrementing the quantity of a part.
+        """
+        request = self.factory.post(f'/parts/{self.part._id}/stock/', {'delta': 5}, format='json')
+        response = self.view(request, object_id=str(self.part._id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'_id': str(self.part._id), 'quantity': 15}
+        self.part.refresh_from_db()
+        assert self.part.quantity == 15
+
+    def test_decrement_stock(self):
+        """
+        Test decrementing the quantity of a part down to zero.
+        """
+        request = self.factory.post(f'/parts/{self.part._id}/stock/', {'delta': -10}, format='json')
+        response = self.view(request, object_id=str(self.part._id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['quantity'] == 0
+
+    def test_decrement_stock_below_zero(self):
+        """
+        Test rejecting a decrement larger than the quantity of a part.
+        """
+        request = self.factory.post(f'/parts/{self.part._id}/stock/', {'delta': -11}, format='json')
+        response = self.view(request, object_id=str(self.part._id))
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data == {'error': 'Insufficient stock.'}
+        self.part.refresh_from_db()
+        assert self.part.quantity == 10
+
+    def test_stock_of_non_existent_part(self):
+        """
+        Test moving the stock of a non-existent part.
+        """
+        non_existent_part_id = '5fc6e6ba9f84e500c7f3b123'
+        request = self.factory.post(f'/parts/{non_existent_part_id}/stock/', {'delta': 1}, format='json')
+        response = self.view(request, object_id=non_existent_part_id)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @override_settings(PARTS_STOCK_WRITE_BEHIND=True)
+    def test_stock_with_write_behind(self):
+        """
+        Test buffering the stock increments and writing them with a single flush, and applying the decrements
+        immediately.
+        """
+        movements = [(5, status.HTTP_202_ACCEPTED), (-2, status.HTTP_200_OK), (4, status.HTTP_202_ACCEPTED)]
+        for delta, status_code in movements:
+            request = self.factory.post(f'/parts/{self.part._id}/stock/', {'delta': delta}, format='json')
+            response = self.view(request, object_id=str(self.part._id))
+
+            assert response.status_code == status_code
+
+        stock_buffer.flush()
+        self.part.refresh_from_db()
+        assert self.part.quantity == 17
+
+    @override_settings(PARTS_STOCK_WRITE_BEHIND=True)
+    def test_stock_with_write_behind_insufficient_stock(self):
+        """
+        Test that a decrement larger than the stock is rejected without cancelling the buffered increments.
+        """
+        request = self.factory.post(f'/parts/{self.part._id}/stock/', {'delta': 5}, format='json')
+        response = self.view(request, object_id=str(self.part._id))
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data == {'_id': str(self.part._id), 'delta': 5}
+
+        request = self.factory.post(f'/parts/{self.part._id}/stock/', {'delta': -20}, format='json')
+        response = self.view(request, object_id=str(self.part._id))
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+        stock_buffer.flush()
+        self.part.refresh_from_db()
+        assert self.part.quantity == 15
+
+    @override_settings(PARTS_STOCK_WRITE_BEHIND=True)
+    def test_stock_with_write_behind_of_non_existent_part(self):
+        """
+        Test that an increment of a non-existent part is rejected instead of being buffered.
+        """
+        non_existent_part_id = '5fc6e6ba9f84e500c7f3b123'
+        request = self.factory.post(f'/parts/{non_existent_part_id}/stock/', {'delta': 1}, format='json')
+        response = self.view(request, object_id=non_existent_part_id)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert stock_buffer.drain() == {}
+
+    def test_stock_with_wrong_delta(self):
+        """
+        Test moving the stock with a delta that is not an integer.
+        """
+        request = self.factory.post(f'/parts/{self.part._id}/stock/', {'delta': 1.5}, format='json')
+        response = self.view(request, object_id=str(self.part._id))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'error': 'The delta must be an integer.'}
+
+
+class TestPartBySerialNumber(APITestCase):
+    """
+    Test case class for testing the PartBySerialNumber API view.
+    """
+    def setUp(self):
+        """
+        Set up necessary components for each test.
+        """
+        self.factory = APIRequestFactory()
+        self.view = PartBySerialNumber.as_view()
+        self.part = PartFactory(serial_number='123123a')
+        PartFactory(serial_number='123123b')
+
+    def test_get_part_by_serial_number(self):
+        """
+        Test retrieving a part by its serial number with the representation of the part details.
+        """
+        request = self.factory.get('/parts/by-serial/123123a/')
+        response = self.view(request, serial_number='123123a')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == PartSerializer(self.part).data
+
+    def test_get_part_by_non_existent_serial_number(self):
+        """
+        Test retrieving a part by a serial number that does not exist.
+        """
+        request = self.factory.get('/parts/by-serial/123123/')
+        response = self.view(request, serial_number='123123')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data == {'detail': ErrorDetail(string='Not found.', code='not_found')}
+
+
 class TestPartSearch(APITestCase):
     """
     Test case class for testing the PartSearch API view.
@@ -568,6 +1206,23 @@ class TestPartSearch(APITestCase):
         assert response.status_code == status.HTTP_200_OK
         assert result == [self.expected_result]
 
+    def test_search_in_location_by_room_and_bookcase(self):
+        """
+        Test searching for a part by a prefix of the location hierarchy.
+        """
+        PartFactory(location={'room': self.part_attrs['location']['room'], 'bookcase': 'other_bookcase'})
+        payload = {
+            'room': self.part_attrs['location']['room'],
+            'bookcase': self.part_attrs['location']['bookcase'],
+        }
+
+        request = self.factory.get('/parts/search/', payload, format='json')
+        response = self.view(request)
+        result = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert result == [self.expected_result]
+
     def test_search_by_non_existent_name(self):
         """
         Test searching for a non-existent part by name.
@@ -593,3 +1248,341 @@ class TestPartSearch(APITestCase):
 
         assert response.status_code == status.HTTP_200_OK
         assert result == []
+
+    def test_search_with_mongo_engine_by_category_id_and_price(self):
+        """
+        Test searching for a part by category_id and price with the mongo engine.
+        """
+        payload = {'engine': 'mongo', 'category_id': str(self.category._id), 'price': self.part_attrs['price']}
+
+        request = self.factory.get('/parts/search/', payload, format='json')
+        response = self.view(request)
+        result = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert result == [self.expected_result]
+
+    def test_search_with_mongo_engine_by_quantity(self):
+        """
+        Test searching for a part by quantity with the mongo engine.
+        """
+        payload = {'engine': 'mongo', 'quantity': self.part_attrs['quantity']}
+
+        request = self.factory.get('/parts/search/', payload, format='json')
+        response = self.view(request)
+        result = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert result == [self.expected_result]
+
+    def test_search_with_mongo_engine_in_location(self):
+        """
+        Test searching for a part by room and shelf location with the mongo engine.
+        """
+        payload = {
+            'engine': 'mongo',
+            'room': self.part_attrs['location']['room'],
+            'shelf': self.part_attrs['location']['shelf'],
+        }
+
+        request = self.factory.get('/parts/search/', payload, format='json')
+        response = self.view(request)
+        result = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert result == [self.expected_result]
+
+    def test_search_with_mongo_engine_by_non_existent_field(self):
+        """
+        Test searching for a part using a non-existent field with the mongo engine.
+        """
+        payload = {'engine': 'mongo', 'non_existent_field': 'value'}
+
+        request = self.factory.get('/parts/search/', payload, format='json')
+        response = self.view(request)
+        result = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert result == []
+
+    def test_search_by_price_and_quantity_ranges_with_ordering(self):
+        """
+        Test searching for parts by price and quantity ranges, cheapest first, with both engines.
+        """
+        cheap_part = PartFactory(price=1.5, quantity=10)
+        PartFactory(price=2.5, quantity=0)
+        PartFactory(price=99.0, quantity=10)
+        payload = {'price__lte': 20, 'quantity__gt': 0, 'ordering': 'price'}
+
+        for engine in ['orm', 'mongo']:
+            request = self.factory.get('/parts/search/', {**payload, 'engine': engine}, format='json')
+            response = self.view(request)
+            result = json.loads(response.content.decode('utf-8'))
+
+            assert response.status_code == status.HTTP_200_OK
+            assert [part['_id'] for part in result] == [str(cheap_part._id), str(self.part._id)]
+
+    def test_search_with_descending_ordering(self):
+        """
+        Test searching for parts ordered by descending quantity with both engines.
+        """
+        PartFactory(quantity=1)
+        PartFactory(quantity=500)
+
+        for engine in ['orm', 'mongo']:
+            request = self.factory.get('/parts/search/', {'ordering': '-quantity', 'engine': engine}, format='json')
+            response = self.view(request)
+            result = json.loads(response.content.decode('utf-8'))
+
+            assert response.status_code == status.HTTP_200_OK
+            assert [part['quantity'] for part in result] == [500, 222, 1]
+
+    def test_search_with_wrong_ordering(self):
+        """
+        Test searching for parts ordered by a field that cannot be used for ordering.
+        """
+        request = self.factory.get('/parts/search/', {'ordering': 'description'}, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_search_with_fields(self):
+        """
+        Test searching for parts with a subset of their fields, with both engines.
+        """
+        part = PartFactory(location={'room': '1'})
+        expected = [{'_id': str(part._id), 'name': part.name, 'location': {'room': '1'}}]
+
+        for engine in ['orm', 'mongo']:
+            request = self.factory.get('/parts/search/', {'room': '1', 'fields': 'name,location', 'engine': engine})
+            response = self.view(request)
+
+            assert response.status_code == status.HTTP_200_OK
+            assert json.loads(response.content.decode('utf-8')) == expected
+
+    def test_search_total_count(self):
+        """
+        Test searching for parts with the number of matching parts in the header, regardless of the limit,
+        with both engines.
+        """
+        PartFactory.create_batch(3, quantity=5)
+
+        for engine in ['orm', 'mongo']:
+            request = self.factory.get('/parts/search/', {'quantity': 5, 'limit': 1, 'engine': engine})
+            response = self.view(request)
+
+            assert len(json.loads(response.content.decode('utf-8'))) == 1
+            assert response['X-Total-Count'] == '3'
+
+    def test_search_not_modified(self):
+        """
+        Test revalidating a search with its ETag, before and after a matching part is updated.
+        """
+        params = {'quantity': 222}
+        etag = self.view(self.factory.get('/parts/search/', params))['ETag']
+
+        response = self.view(self.factory.get('/parts/search/', params, HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+
+        PartDetails.as_view()(
+            self.factory.put(f'parts/{self.part._id}/', {'quantity': 3}, format='json'), object_id=self.part._id
+        )
+        response = self.view(self.factory.get('/parts/search/', params, HTTP_IF_NONE_MATCH=etag))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(response.content.decode('utf-8')) == []
+
+    def test_search_count_only(self):
+        """
+        Test counting the matching parts without retrieving them, with both engines.
+        """
+        PartFactory.create_batch(3, quantity=5)
+
+        for engine in ['orm', 'mongo']:
+            request = self.factory.get('/parts/search/', {'quantity': 5, 'count_only': 1, 'engine': engine})
+            response = self.view(request)
+
+            assert response.status_code == status.HTTP_200_OK
+            assert json.loads(response.content.decode('utf-8')) == {'count': 3}
+
+    def test_full_text_search(self):
+        """
+        Test the full-text search, with the matches in the name ranked first.
+        """
+        description_match = PartFactory(name='Capacitor', description='Ceramic capacitor 100nF.')
+        name_match = PartFactory(name='Ceramic Capacitor', description='Capacitor 100nF.')
+        PartFactory(name='Resistor', description='Carbon film resistor.')
+
+        request = self.factory.get('/parts/search/', {'q': 'ceramic'}, format='json')
+        response = self.view(request)
+        result = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [part['_id'] for part in result] == [str(name_match._id), str(description_match._id)]
+        assert 'score' not in result[0]
+
+    def test_full_text_search_with_limit(self):
+        """
+        Test the full-text search with a limit on the number of results.
+        """
+        PartFactory.create_batch(3, name='Ceramic Capacitor')
+
+        request = self.factory.get('/parts/search/', {'q': 'ceramic', 'limit': 2}, format='json')
+        response = self.view(request)
+        result = json.loads(response.content.decode('utf-8'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(result) == 2
+
+    def test_search_with_wrong_engine(self):
+        """
+        Test searching for a part with an engine that does not exist.
+        """
+        payload = {'engine': 'wrong_engine'}
+
+        request = self.factory.get('/parts/search/', payload, format='json')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestPartAutocomplete(APITestCase):
+    """
+    Test case class for testing the PartAutocomplete API view.
+    """
+    def setUp(self):
+        """
+        Set up necessary components for each test.
+        """
+        self.factory = APIRequestFactory()
+        self.view = PartAutocomplete.as_view()
+        self.part_b = PartFactory(serial_number='ABC-200')
+        self.part_a = PartFactory(serial_number='ABC-100')
+        PartFactory(serial_number='ABD-100')
+        PartFactory(serial_number='abc-300')
+
+    def test_autocomplete(self):
+        """
+        Test suggesting parts by a serial number prefix, ordered by serial number.
+        """
+        request = self.factory.get('/parts/autocomplete/', {'serial_number': 'ABC'})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {'_id': str(self.part_a._id), 'serial_number': 'ABC-100', 'name': self.part_a.name},
+            {'_id': str(self.part_b._id), 'serial_number': 'ABC-200', 'name': self.part_b.name},
+        ]
+
+    def test_autocomplete_with_limit(self):
+        """
+        Test suggesting parts with a limit on the number of suggestions.
+        """
+        request = self.factory.get('/parts/autocomplete/', {'serial_number': 'AB', 'limit': 2})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [part['serial_number'] for part in response.data] == ['ABC-100', 'ABC-200']
+
+    def test_autocomplete_no_results(self):
+        """
+        Test suggesting parts for a prefix without matches.
+        """
+        request = self.factory.get('/parts/autocomplete/', {'serial_number': 'XYZ'})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+
+    def test_autocomplete_special_characters(self):
+        """
+        Test suggesting parts for a prefix with regex metacharacters or ending with the last code point.
+        """
+        PartFactory(serial_number='A.C-100')
+
+        for prefix, expected in [('A.C', ['A.C-100']), ('A.', ['A.C-100']), ('ABC\U0010ffff', [])]:
+            request = self.factory.get('/parts/autocomplete/', {'serial_number': prefix})
+            response = self.view(request)
+
+            assert response.status_code == status.HTTP_200_OK
+            assert [part['serial_number'] for part in response.data] == expected
+
+    def test_autocomplete_without_prefix(self):
+        """
+        Test suggesting parts without a serial number prefix.
+        """
+        request = self.factory.get('/parts/autocomplete/')
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestPartsExport(APITestCase):
+    """
+    Test case class for testing the PartsExport API view.
+    """
+    def setUp(self):
+        """
+        Set up necessary components for each test.
+        """
+        self.factory = APIRequestFactory()
+        self.view = PartsExport.as_view()
+        PartFactory.create_batch(5)
+        self.expected_result = json.loads(json.dumps(PartSerializer(Part.objects.order_by('_id'), many=True).data))
+
+    def test_export_ndjson(self):
+        """
+        Test exporting parts as newline-delimited JSON.
+        """
+        request = self.factory.get('/parts/export/', {'batch_size': 2})
+        response = self.view(request)
+        content = b''.join(response.streaming_content).decode('utf-8')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert [json.loads(line) for line in content.splitlines()] == self.expected_result
+
+    def test_export_json(self):
+        """
+        Test exporting parts as a JSON array.
+        """
+        request = self.factory.get('/parts/export/', {'type': 'json', 'batch_size': 2})
+        response = self.view(request)
+        content = b''.join(response.streaming_content).decode('utf-8')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/json'
+        assert json.loads(content) == self.expected_result
+
+    def test_export_json_no_results(self):
+        """
+        Test exporting an empty catalog as a JSON array.
+        """
+        Part.objects.all().delete()
+
+        request = self.factory.get('/parts/export/', {'type': 'json'})
+        response = self.view(request)
+        content = b''.join(response.streaming_content).decode('utf-8')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(content) == []
+
+    def test_export_wrong_type(self):
+        """
+        Test exporting parts with an unsupported type.
+        """
+        request = self.factory.get('/parts/export/', {'type': 'xml'})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_export_wrong_batch_size(self):
+        """
+        Test exporting parts with an invalid batch size.
+        """
+        request = self.factory.get('/parts/export/', {'batch_size': 'abc'})
+        response = self.view(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -4,24 +4,47 @@ URL patterns for the 'parts' app.
 These patterns define the endpoints for handling part-related operations.
 
 - '' (empty path):
-    - GET: List all parts.
+    - GET: List all parts, or the parts with the given ids.
     - POST: Add a new part.
+- 'batch/':
+    - POST: Retrieve many parts by their ids.
+- 'bulk/':
+    - POST: Add many parts.
+    - PATCH: Update many parts.
+    - DELETE: Delete many parts by their ids or a search filter.
 - 'search/':
     - GET: Search for parts based on specified criteria.
+- 'autocomplete/':
+    - GET: Suggest parts by a prefix of their serial number.
+- 'by-serial/<str:serial_number>/':
+    - GET: Retrieve a specific part by its serial_number.
+- 'export/':
+    - GET: Stream all parts as NDJSON or a JSON array.
 - '<str:object_id>/':
     - GET: Retrieve a specific part by its object_id.
     - PUT: Update a specific part by its object_id.
     - DELETE: Delete a specific part by its object_id.
+- '<str:object_id>/stock/':
+    - POST: Apply a signed delta to the quantity of a specific part.
 """
 from django.urls import path
 
-from .views import PartsList, PartDetails, PartSearch
+from .views import (
+    PartsList, PartsBatch, PartsBulk, PartDetails, PartSearch, PartAutocomplete, PartBySerialNumber, PartsExport,
+    PartStock,
+)
 
 
 app_name = 'parts'
 
 urlpatterns = [
     path('', PartsList.as_view(), name='parts_list'),
+    path('batch/', PartsBatch.as_view(), name='parts_batch'),
+    path('bulk/', PartsBulk.as_view(), name='parts_bulk'),
     path('search/', PartSearch.as_view(), name='parts_search'),
+    path('autocomplete/', PartAutocomplete.as_view(), name='parts_autocomplete'),
+    path('by-serial/<str:serial_number>/', PartBySerialNumber.as_view(), name='part_by_serial_number'),
+    path('export/', PartsExport.as_view(), name='parts_export'),
     path('<str:object_id>/', PartDetails.as_view(), name='part_details'),
+    path('<str:object_id>/stock/', PartStock.as_view(), name='part_stock'),
 ]
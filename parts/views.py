@@ -1,44 +1,132 @@
-from bson import ObjectId
+from json import dumps
+from re import escape
+from typing import Iterator
 
+from bson import ObjectId
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.http import JsonResponse, HttpRequest
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import status
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .bulk import (
+    MAX_BULK_SIZE, create_parts, delete_parts, get_delete_filter, get_parts, parse_ids, render_parts_batch,
+    update_parts,
+)
+from .cache import get_cached_part_json, get_cached_search, get_search_key, invalidate_parts, render_parts
 from .models import Part
-from .serializers import PartSerializer
+from .search import SearchEngine, get_search_engine
+from .serializers import PartSerializer, part_document_representation
+from .stock import apply_stock_delta, stock_buffer
 from categories.models import Category
+from Parts_Warehouse_API.cache import encode_json, get_query_key
+from Parts_Warehouse_API.etags import conditional_response, get_content_etag, get_key_etag
+from Parts_Warehouse_API.fieldsets import get_fieldset
+from Parts_Warehouse_API.pagination import ObjectIdCursorPagination, get_counted_response, is_count_only
+from Parts_Warehouse_API.singleflight import single_flight
 from Parts_Warehouse_API.validators import valid_object_id
 
 
+def get_parts_response(object_ids: list[ObjectId], fields: list[str] | None = None) -> HttpResponse:
+    """
+    Get the response with many parts, in the order of their ids, and the ids of the missing parts.
+
+    Args:
+        object_ids (list[ObjectId]): The ids of the parts.
+        fields (list[str]): The fields to return, or None for all fields.
+
+    Returns:
+        HttpResponse: Response assembled from the cached JSON of the parts if all fields are returned,
+        or with the selected fields read from the database.
+    """
+    if fields is None:
+        return HttpResponse(render_parts_batch(object_ids), content_type='application/json')
+    results, missing = get_parts(object_ids, fields)
+    return Response({'results': results, 'missing': missing})
+
+
 class PartsList(APIView):
     """
     API view for listing all parts or creating a new part.
 
     GET:
-    List all parts.
+    List all parts, one page at a time.
 
     POST:
     Create a new part.
 
+    The list is paginated with a cursor keyed on '_id'. The 'limit' query parameter sets the page size
+    and the 'next' link of the response points to the following page.
+
+    With the 'ids' query parameter (a comma-separated list of ids), only the given parts are returned,
+    fetched with a single query (see 'PartsBatch').
+
+    The 'fields' query parameter (a comma-separated list of field names) selects the returned fields,
+    which are the only fields read from the database. Without it, only the ids of the page are read and
+    the page is assembled from the cached JSON of the parts, so only the uncached parts are read and serialized.
+
+    The total number of parts, taken from the collection metadata, is returned in the 'X-Total-Count' header.
+    With the 'count_only' query parameter, only this number is returned.
+
+    The identical pages requested concurrently are read once and shared (see 'Parts_Warehouse_API.singleflight').
+
+    The ETag of the responses is derived from the generation of the parts, so a client revalidating its copy
+    with 'If-None-Match' gets 304 Not Modified without reading the database until a part is written.
+
     Additionally, any extra fields in the request data that are not part of the 'Part' model
     will be treated as part of the 'location' field in the new part.
     """
-    def get(self, request: HttpRequest) -> Response:
+    pagination_class = ObjectIdCursorPagination
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        """
+        Retrieve a page of parts.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponse: Response with the serialized data of the parts on the page
+            and the links to the next and previous pages, or with the number of parts,
+            or 304 Not Modified response if the client's copy is current.
+        """
+        fields = get_fieldset(request.query_params, Part)
+        key = get_query_key(Part._meta.db_table, request.build_absolute_uri())
+
+        def get_response() -> HttpResponse:
+            if 'ids' in request.query_params:
+                return get_parts_response(parse_ids(request.query_params['ids'].split(',')), fields)
+            content, count = single_flight.do(key, lambda: self.get_page(request, fields))
+            return get_counted_response(content, count)
+
+        return conditional_response(request, get_key_etag(key), get_response)
+
+    def get_page(self, request: HttpRequest, fields: list[str] | None) -> tuple[bytes, int]:
         """
-        Retrieve a list of all parts.
+        Read and encode a page of parts, or their number.
 
         Args:
             request (HttpRequest): The HTTP request object.
+            fields (list[str]): The fields to return, or None for all fields.
 
         Returns:
-            Response: Response with the serialized data of all parts.
+            tuple: The encoded page (or number of parts) and the total number of parts.
         """
-        parts = Part.objects.all()
-        serializer = PartSerializer(parts, many=True)
-        return Response(serializer.data)
+        count = Part.objects.mongo_estimated_document_count()
+        if is_count_only(request.query_params):
+            return encode_json({'count': count}), count
+
+        paginator = self.pagination_class()
+        if fields:
+            parts = paginator.paginate_queryset(Part.objects.only(*fields), request, view=self)
+            results = encode_json(PartSerializer(parts, many=True, fields=fields).data)
+        else:
+            parts = paginator.paginate_queryset(Part.objects.only('_id'), request, view=self)
+            results = render_parts([part._id for part in parts])
+        return paginator.get_encoded_page(results), count
 
     def post(self, request: HttpRequest) -> Response:
         """
@@ -69,27 +157,185 @@ class PartsList(APIView):
         serializer = PartSerializer(data=data)
         if serializer.is_valid():
             try:
-                serializer.save()
+                part = serializer.save()
+                invalidate_parts([part._id])
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             except ValidationError:
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class PartsBatch(APIView):
+    """
+    API view for retrieving many parts by their ids.
+
+    POST:
+    Retrieve the parts with the ids given in the request data, for lists of ids too long for the 'ids'
+    query parameter of 'PartsList'. The ids are a JSON list ({'ids': [...]}) or a comma-separated form field.
+
+    The parts are taken from the cache of their JSON, the uncached parts are fetched with a single '$in' query,
+    and they are returned in the order of the ids. The ids of the parts that do not exist are listed in 'missing'.
+    """
+    def post(self, request: HttpRequest) -> Response:
+        """
+        Retrieve many parts.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: Response with the serialized parts and the ids of the missing parts.
+        """
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if isinstance(ids, str):
+            ids = ids.split(',')
+        return get_parts_response(parse_ids(ids))
+
+
+class PartsBulk(APIView):
+    """
+    API view for operating on many parts in a single request.
+
+    POST:
+    Create many parts from a list of rows.
+
+    Each row has the format accepted by 'PartsList.post'. The rows are validated together, with a single
+    query fetching the categories of the whole batch, and the valid rows are inserted with a single unordered
+    'insert_many'. Each row is reported with its index in the request, so the invalid rows do not reject the batch.
+
+    PATCH:
+    Update many parts from a list of {'_id': <part id>, 'changes': <fields>} items.
+
+    The changes have the format accepted by 'PartDetails.put'. The items are validated together and the valid
+    items are applied with a single unordered 'bulk_write' of '$set' operations, with the location keys
+    set by their dotted paths.
+
+    DELETE:
+    Delete the parts selected by a list of ids ({'ids': [...]}) or by a filter in the format of the 'PartSearch'
+    query parameters ({'filter': {...}}), with a 'delete_many' per batch of 'MAX_BULK_SIZE' parts.
+    With '"dry_run": true', the matching parts are only counted.
+
+    The responses use the following status codes:
+    - POST: 201 CREATED if all rows were added, 207 MULTI-STATUS if some rows were rejected, and 400 BAD REQUEST
+      if no row was added or the request is not a list of at most 'MAX_BULK_SIZE' rows.
+    - PATCH: 200 OK if all items were applied, 207 MULTI-STATUS if some items were rejected, and 400 BAD REQUEST
+      if no item was applied or the request is not a list of at most 'MAX_BULK_SIZE' items.
+    - DELETE: 200 OK with the number of deleted (or, in the dry-run mode, matching) parts, and 400 BAD REQUEST
+      if the selection is missing, empty or invalid.
+    """
+    def get_rows(self, request: HttpRequest) -> list | Response:
+        """
+        Get the rows of a bulk request.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            list: The rows, or error response if the request data is not a valid list of rows.
+        """
+        rows = request.data
+        if not isinstance(rows, list) or not rows:
+            return Response({'error': 'The request must be a non-empty list.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > MAX_BULK_SIZE:
+            return Response(
+                {'error': f'The request cannot contain more than {MAX_BULK_SIZE} rows.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return rows
+
+    @staticmethod
+    def get_status(results: list, errors: list, success_status: int) -> int:
+        """
+        Get the status code of a bulk response.
+
+        Args:
+            results (list): The applied rows.
+            errors (list): The rejected rows.
+            success_status (int): The status code if all rows were applied.
+
+        Returns:
+            int: The status code of the response.
+        """
+        if not errors:
+            return success_status
+        if not results:
+            return status.HTTP_400_BAD_REQUEST
+        return status.HTTP_207_MULTI_STATUS
+
+    def post(self, request: HttpRequest) -> Response:
+        """
+        Create many parts.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: Response with the serialized created parts and the errors of the rejected rows.
+        """
+        rows = self.get_rows(request)
+        if isinstance(rows, Response):
+            return rows
+
+        results, errors = create_parts(rows)
+        return Response(
+            {'results': results, 'errors': errors},
+            status=self.get_status(results, errors, status.HTTP_201_CREATED)
+        )
+
+    def patch(self, request: HttpRequest) -> Response:
+        """
+        Update many parts.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: Response with the ids of the updated parts and the errors of the rejected items.
+        """
+        items = self.get_rows(request)
+        if isinstance(items, Response):
+            return items
+
+        results, errors = update_parts(items)
+        return Response(
+            {'results': results, 'errors': errors},
+            status=self.get_status(results, errors, status.HTTP_200_OK)
+        )
+
+    def delete(self, request: HttpRequest) -> Response:
+        """
+        Delete many parts.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: Response with the number of deleted parts, or of matching parts in the dry-run mode.
+        """
+        mongo_filter = get_delete_filter(request.data)
+        if request.data.get('dry_run'):
+            return Response({'count': delete_parts(mongo_filter, dry_run=True)})
+        return Response({'deleted': delete_parts(mongo_filter)})
+
+
 class PartDetails(APIView):
     """
     API view for retrieving, updating, or deleting a specific part instance.
 
     GET:
     Retrieve details of a specific part by its object_id.
+    The part is served from the read-through cache of its JSON, invalidated by every write to the part.
+    Its ETag is the hash of its cached JSON, so a client revalidating its copy with 'If-None-Match'
+    gets 304 Not Modified until the part changes.
 
     PUT:
     Update details of a specific part by its object_id.
+    Only the changed fields are written, with the changed location keys set by their dotted paths.
 
     DELETE:
     Delete a specific part by its object_id.
     """
-    def get(self, request: HttpRequest, object_id: str) -> Response:
+    def get(self, request: HttpRequest, object_id: str) -> HttpResponse:
         """
         Retrieve details of a specific part.
 
@@ -98,11 +344,18 @@ class PartDetails(APIView):
             object_id (str): The ID of the part.
 
         Returns:
-            Response: Response with the serialized part data.
+            HttpResponse: Response with the serialized part data,
+            or 304 Not Modified response if the client's copy is current.
+
+        Raises:
+            NotFound: If the part does not exist.
         """
-        part = get_object_or_404(Part, pk=valid_object_id(object_id))
-        serializer = PartSerializer(part)
-        return Response(serializer.data)
+        part = get_cached_part_json(valid_object_id(object_id))
+        if part is None:
+            raise NotFound()
+        return conditional_response(
+            request, get_content_etag(part), lambda: HttpResponse(part, content_type='application/json')
+        )
 
     def put(self, request: HttpRequest, object_id: str) -> Response:
         """
@@ -119,7 +372,7 @@ class PartDetails(APIView):
         category_id = request.data.get('category_id')
         data = request.data.copy()
 
-        location = part.location
+        location = dict(part.location)
         for key, value in request.data.items():
             if key not in [field.name for field in Part._meta.get_fields()]:
                 location[key] = value
@@ -135,6 +388,7 @@ class PartDetails(APIView):
         if serializer.is_valid():
             try:
                 serializer.save()
+                invalidate_parts([part._id])
                 return Response(serializer.data)
             except ValidationError:
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -151,11 +405,96 @@ class PartDetails(APIView):
         Returns:
             Response: Response with the status of the delete operation.
         """
-        category = get_object_or_404(Part, pk=valid_object_id(object_id))
+        object_id = valid_object_id(object_id)
+        category = get_object_or_404(Part, pk=object_id)
         category.delete()
+        invalidate_parts([object_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class PartStock(APIView):
+    """
+    API view for moving the stock of a specific part.
+
+    POST:
+    Apply a signed delta to the quantity of a specific part by its object_id.
+
+    The delta is applied with a single conditional '$inc', so concurrent movements are never lost
+    and a decrement larger than the quantity in stock is rejected atomically.
+
+    With the 'PARTS_STOCK_WRITE_BEHIND' setting, an increment is buffered and written with the other increments
+    of the worker by the next flush of the stock buffer. The response is then sent before the write,
+    so it contains the accepted delta instead of the new quantity. The decrements are always applied immediately,
+    so an insufficient stock is reported in the response, and so are the increments refused by a full buffer.
+    """
+    def post(self, request: HttpRequest, object_id: str) -> Response:
+        """
+        Apply a stock movement to a specific part.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            object_id (str): The ID of the part.
+
+        Returns:
+            Response: Response with the new quantity of the part (or the accepted increment in the write-behind mode),
+            or error response if the delta is invalid or larger than the quantity in stock.
+
+        Raises:
+            NotFound: If the part does not exist.
+        """
+        object_id = valid_object_id(object_id)
+        delta = request.data.get('delta')
+        try:
+            if isinstance(delta, bool) or not isinstance(delta, (int, str)):
+                raise ValueError
+            delta = int(delta)
+        except ValueError:
+            return Response({'error': 'The delta must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if settings.PARTS_STOCK_WRITE_BEHIND and delta > 0:
+            if get_cached_part_json(object_id) is None:
+                raise NotFound()
+            if stock_buffer.add(object_id, delta):
+                return Response({'_id': str(object_id), 'delta': delta}, status=status.HTTP_202_ACCEPTED)
+
+        quantity = apply_stock_delta(object_id, delta)
+        if quantity is None:
+            if Part.objects.mongo_find_one({'_id': object_id}, {'_id': 1}) is None:
+                raise NotFound()
+            return Response({'error': 'Insufficient stock.'}, status=status.HTTP_409_CONFLICT)
+        return Response({'_id': str(object_id), 'quantity': quantity})
+
+
+class PartBySerialNumber(APIView):
+    """
+    API view for retrieving a specific part by its serial number.
+
+    GET:
+    Retrieve details of a specific part by its serial_number.
+
+    The part is read with a single point query on the unique 'serial_number' index and returned
+    with the same representation as 'PartDetails'.
+    """
+    def get(self, request: HttpRequest, serial_number: str) -> Response:
+        """
+        Retrieve details of a specific part.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            serial_number (str): The serial number of the part.
+
+        Returns:
+            Response: Response with the serialized part data.
+
+        Raises:
+            NotFound: If no part has the given serial number.
+        """
+        document = Part.objects.mongo_find_one({'serial_number': serial_number})
+        if document is None:
+            raise NotFound()
+        return Response(part_document_representation(document))
+
+
 class PartSearch(APIView):
     """
     API view for searching parts based on specified filters.
@@ -164,41 +503,199 @@ class PartSearch(APIView):
     Retrieve a list of parts based on query parameters provided in the request.
     Supports filtering by various fields, including 'location' fields.
 
+    The search is executed by the engine selected with the 'engine' query parameter ('orm' or 'mongo'),
+    or by the 'PARTS_SEARCH_ENGINE' setting if the parameter is not provided.
+
+    Without the 'fields' query parameter, only the ids of the matching parts are read and the response
+    is assembled from the cached JSON of the parts.
+
+    The responses are cached by query string until the next write to the parts (see 'parts.cache'),
+    and the identical searches missing from the cache concurrently are run once and shared.
+    The ETag of the responses is derived from their cache key, so a client revalidating its copy
+    with 'If-None-Match' gets 304 Not Modified without reading the cache until a part is written.
+
+    The number of matching parts, regardless of the limit, is counted on the server and returned
+    in the 'X-Total-Count' header. With the 'count_only' query parameter, only this number is returned.
+
     The response includes the serialized data of matching parts.
     """
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Retrieve a list of parts based on specified filters.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            *args: Variable-length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            HttpResponse: Response with the serialized data of matching parts, or with their number,
+            or 304 Not Modified response if the client's copy is current.
+        """
+        engine = get_search_engine(request.GET)
+        key = get_search_key(request.GET)
+
+        def get_response() -> HttpResponse:
+            content, count = get_cached_search(key, lambda: single_flight.do(key, lambda: self.search(engine)))
+            return get_counted_response(content, count)
+
+        return conditional_response(request, get_key_etag(key), get_response)
+
+    @staticmethod
+    def search(engine: SearchEngine) -> tuple[bytes, int]:
+        """
+        Run a search.
+
+        Args:
+            engine (SearchEngine): The search engine of the request.
+
+        Returns:
+            tuple: The encoded response and the number of matching parts.
+        """
+        count = engine.count()
+        if is_count_only(engine.params):
+            return encode_json({'count': count}), count
+        if engine.get_fields() is None:
+            return render_parts(engine.search_ids()), count
+        return encode_json(engine.search()), count
+
+
+class PartAutocomplete(APIView):
+    """
+    API view for suggesting parts by a prefix of their serial number.
+
+    GET:
+    Retrieve the parts whose serial number starts with the given prefix, ordered by serial number.
+
+    The prefix is resolved as a range scan on the unique 'serial_number' index and only the '_id',
+    'serial_number' and 'name' fields are returned, so the lookup stays cheap at keystroke rate.
+
+    Query parameters:
+    - serial_number (str): The prefix of the serial number.
+    - limit (int): The maximum number of suggestions, capped at 'max_limit'.
+    """
+    limit = 10
+    max_limit = 50
 
-    def get_queryset(self):
+    def get(self, request: HttpRequest) -> Response:
         """
-        Get the queryset based on request filters.
+        Retrieve the parts matching a serial number prefix.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
 
         Returns:
-            QuerySet: The filtered queryset of parts.
+            Response: Response with the suggested parts, or error response if the query parameters are invalid.
         """
-        queryset = Part.objects.all()
-        queryset_filters = self.request.GET.copy()
-        if 'category_id' in queryset_filters:
-            queryset_filters['category_id'] = ObjectId(queryset_filters['category_id'])
+        prefix = request.query_params.get('serial_number')
+        if not prefix:
+            return Response({'error': 'The serial_number prefix is required.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = int(request.query_params.get('limit', self.limit))
+        except ValueError:
+            return Response({'error': 'The limit must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1:
+            return Response({'error': 'The limit must be positive.'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(limit, self.max_limit)
+
+        # MongoDB runs a case-sensitive regex anchored at the start of the string as a range scan
+        # on the 'serial_number' index, bounded by the escaped prefix.
+        documents = Part.objects.mongo_find(
+            {'serial_number': {'$regex': f'^{escape(prefix)}'}},
+            {'serial_number': 1, 'name': 1},
+        ).sort('serial_number').limit(limit)
+
+        return Response([
+            {'_id': str(document['_id']), 'serial_number': document['serial_number'], 'name': document['name']}
+            for document in documents
+        ])
+
+
+class PartsExport(APIView):
+    """
+    API view for exporting the whole parts catalog as a stream.
 
-        fields_name = [field.name for field in Part._meta.get_fields()]
-        for key, value in queryset_filters.items():
-            if key not in fields_name:
-                queryset = queryset.filter(location__exact={key: value})
-            else:
-                queryset = queryset.filter(**{key: value})
-        return queryset
+    GET:
+    Stream all parts ordered by '_id', either as newline-delimited JSON (one part per line)
+    or as a JSON array.
 
-    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    The parts are read from a server-side MongoDB cursor and written to the response as soon as
+    they are serialized, so the memory used by the worker does not depend on the size of the catalog.
+
+    Query parameters:
+    - type (str): 'ndjson' (default) or 'json'.
+    - batch_size (int): The number of documents fetched from MongoDB per round trip,
+      capped at 'max_batch_size'.
+    """
+    content_types = {
+        'ndjson': 'application/x-ndjson',
+        'json': 'application/json',
+    }
+    batch_size = 1000
+    max_batch_size = 10000
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse | Response:
         """
-        Retrieve a list of parts based on specified filters.
+        Stream all parts.
 
         Args:
             request (HttpRequest): The HTTP request object.
-            *args: Variable-length argument list.
-            **kwargs: Arbitrary keyword arguments.
 
         Returns:
-            JsonResponse: Response with the serialized data of matching parts.
+            StreamingHttpResponse: Response streaming the serialized parts,
+            or error response if the query parameters are invalid.
+        """
+        export_type = request.query_params.get('type', 'ndjson')
+        if export_type not in self.content_types:
+            return Response(
+                {'error': f'Invalid type: {export_type}. Allowed types: {", ".join(self.content_types)}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            batch_size = int(request.query_params.get('batch_size', self.batch_size))
+        except ValueError:
+            return Response({'error': 'The batch_size must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+        if batch_size < 1:
+            return Response({'error': 'The batch_size must be positive.'}, status=status.HTTP_400_BAD_REQUEST)
+        batch_size = min(batch_size, self.max_batch_size)
+
+        documents = Part.objects.mongo_find({}, batch_size=batch_size).sort('_id')
+        if export_type == 'json':
+            content = self.stream_json(documents)
+        else:
+            content = self.stream_ndjson(documents)
+        return StreamingHttpResponse(content, content_type=self.content_types[export_type])
+
+    @staticmethod
+    def stream_ndjson(documents: Iterator[dict]) -> Iterator[str]:
+        """
+        Yield the documents as newline-delimited JSON.
+
+        Args:
+            documents (Iterator[dict]): The documents from the 'parts' collection.
+
+        Yields:
+            str: One serialized part per line.
+        """
+        for document in documents:
+            yield dumps(part_document_representation(document)) + '\n'
+
+    @staticmethod
+    def stream_json(documents: Iterator[dict]) -> Iterator[str]:
+        """
+        Yield the documents as chunks of a JSON array.
+
+        Args:
+            documents (Iterator[dict]): The documents from the 'parts' collection.
+
+        Yields:
+            str: The chunks of the JSON array, one serialized part per chunk.
         """
-        queryset = self.get_queryset().distinct()
-        serializer = PartSerializer(queryset, many=True)
-        return JsonResponse(serializer.data, safe=False)
+        yield '['
+        separator = ''
+        for document in documents:
+            yield separator + dumps(part_document_representation(document))
+            separator = ','
+        yield ']'
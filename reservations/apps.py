@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+from Parts_Warehouse_API.indexes import create_missing_indexes
+
+
+class ReservationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'reservations'
+
+    def ready(self):
+        post_migrate.connect(create_missing_indexes, sender=self)
@@ -0,0 +1,150 @@
+"""
+This module implements the operations on the stock reservations.
+
+The available quantity of a part is its 'quantity' minus the quantities of its active reservations,
+summed by an aggregation on the 'part_expires_at' index. A reservation is inserted first and checked
+against the available quantity afterwards, so concurrent reservations can never hold more than the stock:
+if the check fails, the reservation removes itself.
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any
+
+from bson import ObjectId
+from django.utils import timezone
+
+from .models import Reservation
+from parts.models import Part
+from parts.stock import apply_stock_delta
+
+
+def get_held_quantity(part_id: ObjectId, now: datetime | None = None) -> int:
+    """
+    Sum the quantities of the active reservations of a part.
+
+    Args:
+        part_id (ObjectId): The ID of the part.
+        now (datetime): The current date and time.
+
+    Returns:
+        int: The held quantity.
+    """
+    result = list(Reservation.objects.mongo_aggregate([
+        {'$match': {'part_id': part_id, 'expires_at': {'$gt': now or timezone.now()}}},
+        {'$group': {'_id': None, 'held': {'$sum': '$quantity'}}},
+    ]))
+    return result[0]['held'] if result else 0
+
+
+def get_availability(part_id: ObjectId) -> dict[str, Any] | None:
+    """
+    Get the quantity, held quantity and available quantity of a part.
+
+    Args:
+        part_id (ObjectId): The ID of the part.
+
+    Returns:
+        dict: The stock of the part, or None if the part does not exist.
+    """
+    part = Part.objects.mongo_find_one({'_id': part_id}, {'quantity': 1})
+    if part is None:
+        return None
+    held = get_held_quantity(part_id)
+    return {
+        'part_id': str(part_id),
+        'quantity': part['quantity'],
+        'held': held,
+        'available': part['quantity'] - held,
+    }
+
+
+def reserve(part_id: ObjectId, quantity: int, ttl: int) -> dict[str, Any] | None:
+    """
+    Reserve a quantity of a part.
+
+    Args:
+        part_id (ObjectId): The ID of the part.
+        quantity (int): The quantity to reserve.
+        ttl (int): The lifetime of the reservation in seconds.
+
+    Returns:
+        dict: The reservation document, or None if the available quantity is lower than the requested quantity.
+
+    Raises:
+        Part.DoesNotExist: If the part does not exist.
+    """
+    now = timezone.now()
+    document = {
+        '_id': ObjectId(),
+        'part_id': part_id,
+        'quantity': quantity,
+        'expires_at': now + timedelta(seconds=ttl),
+    }
+    Reservation.objects.mongo_insert_one(document)
+
+    part = Part.objects.mongo_find_one({'_id': part_id}, {'quantity': 1})
+    if part is None or get_held_quantity(part_id, now) > part['quantity']:
+        Reservation.objects.mongo_delete_one({'_id': document['_id']})
+        if part is None:
+            raise Part.DoesNotExist
+        return None
+    return document
+
+
+def confirm(reservation_id: ObjectId) -> int | None:
+    """
+    Confirm an active reservation: remove it and take its quantity out of the stock of the part.
+
+    Args:
+        reservation_id (ObjectId): The ID of the reservation.
+
+    Returns:
+        int: The new quantity of the part, or None if the quantity of the part is lower than the reserved quantity,
+        in which case the reservation is kept.
+
+    Raises:
+        Reservation.DoesNotExist: If the reservation does not exist or has expired.
+    """
+    document = Reservation.objects.mongo_find_one_and_delete(
+        {'_id': reservation_id, 'expires_at': {'$gt': timezone.now()}}
+    )
+    if document is None:
+        raise Reservation.DoesNotExist
+
+    quantity = apply_stock_delta(document['part_id'], -document['quantity'])
+    if quantity is None:
+        Reservation.objects.mongo_insert_one(document)
+    return quantity
+
+
+def release(reservation_id: ObjectId) -> bool:
+    """
+    Release a reservation.
+
+    Args:
+        reservation_id (ObjectId): The ID of the reservation.
+
+    Returns:
+        bool: True if the reservation was released, False if it does not exist.
+    """
+    return Reservation.objects.mongo_delete_one({'_id': reservation_id}).deleted_count > 0
+
+
+def reservation_document_representation(document: dict[str, Any]) -> dict:
+    """
+    Convert a raw 'reservations' document to its JSON-compatible representation.
+
+    Args:
+        document (dict): The document from the 'reservations' collection.
+
+    Returns:
+        dict: The JSON-compatible representation of the document.
+    """
+    expires_at = document['expires_at']
+    if timezone.is_naive(expires_at):
+        expires_at = expires_at.replace(tzinfo=dt_timezone.utc)
+    return {
+        '_id': str(document['_id']),
+        'part_id': str(document['part_id']),
+        'quantity': document['quantity'],
+        'expires_at': expires_at.isoformat(),
+    }
@@ -0,0 +1,18 @@
+"""
+This module declares the MongoDB indexes of the 'reservations' collection.
+
+The indexes are created after migrations and can be verified with the 'sync_indexes' management command.
+"""
+from pymongo import ASCENDING, IndexModel
+
+from .models import Reservation
+
+
+MODEL = Reservation
+
+INDEXES = [
+    # Removes the reservations as soon as they expire (the TTL monitor of MongoDB runs every minute).
+    IndexModel([('expires_at', ASCENDING)], name='expires_at_ttl', expireAfterSeconds=0),
+    # Used by the aggregation summing the active reservations of a part.
+    IndexModel([('part_id', ASCENDING), ('expires_at', ASCENDING)], name='part_expires_at'),
+]
@@ -0,0 +1,39 @@
+"""
+This module defines a Django model 'Reservation' representing stock reservations.
+"""
+from djongo import models as djongo_models
+from django.db import models
+
+from parts.models import Part
+
+
+class Reservation(models.Model):
+    """
+    The 'Reservation' model represents a hold on the stock of a part, e.g. for the content of a cart.
+
+    A reservation is active until it expires. Expired reservations are removed by MongoDB with the TTL index
+    on 'expires_at', and confirmed or released reservations are deleted, so the collection only holds the
+    active reservations and the expired ones not yet removed.
+
+    Fields:
+    - _id (ObjectId): The primary key of the reservation.
+    - part_id (ForeignKey): The foreign key reference to the reserved part.
+    - quantity (PositiveIntegerField): The reserved quantity.
+    - expires_at (DateTimeField): The date and time when the reservation expires.
+
+    Manager:
+        objects (DjongoManager): The default manager, which also exposes the pymongo collection methods
+        prefixed with 'mongo_' (e.g. 'Reservation.objects.mongo_find()').
+
+    Meta:
+        db_table (str): The database table name for the 'Reservation' model.
+    """
+    _id = djongo_models.ObjectIdField(primary_key=True)
+    part_id = models.ForeignKey(Part, on_delete=models.CASCADE, db_column='part_id')
+    quantity = models.PositiveIntegerField()
+    expires_at = models.DateTimeField()
+
+    objects = djongo_models.DjongoManager()
+
+    class Meta:
+        db_table = 'reservations'
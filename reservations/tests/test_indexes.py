@@ -0,0 +1,16 @@
+"""
+This module contains unit tests for the indexes of the 'reservations' collection.
+"""
+from pymongo import ASCENDING
+
+from reservations.indexes import INDEXES
+
+
+def test_ttl_index():
+    """
+    Test that the reservations expire with a TTL index on 'expires_at'.
+    """
+    index = next(index.document for index in INDEXES if index.document['name'] == 'expires_at_ttl')
+
+    assert list(index['key'].items()) == [('expires_at', ASCENDING)]
+    assert index['expireAfterSeconds'] == 0
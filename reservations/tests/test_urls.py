@@ -0,0 +1,50 @@
+"""
+This module contains unit tests for testing the URL patterns related to stock reservations.
+"""
+from django.urls import resolve, reverse
+
+from reservations.views import ReservationsList, PartAvailability, ReservationDetails, ReservationConfirm
+
+
+def test_list():
+    """
+    Test resolving URLs for the reservations list view.
+    """
+    found = resolve(reverse('reservations:reservations_list'))
+
+    assert found.func.view_class == ReservationsList
+    assert reverse('reservations:reservations_list') == '/reservations/'
+    assert resolve('/reservations/').view_name == 'reservations:reservations_list'
+
+
+def test_availability():
+    """
+    Test resolving URLs for the part availability view.
+    """
+    found = resolve(reverse('reservations:part_availability', kwargs={'part_id': '1'}))
+
+    assert found.func.view_class == PartAvailability
+    assert reverse('reservations:part_availability', kwargs={'part_id': 'a1'}) == '/reservations/availability/a1/'
+    assert resolve('/reservations/availability/1/').view_name == 'reservations:part_availability'
+
+
+def test_details():
+    """
+    Test resolving URLs for the reservation details view.
+    """
+    found = resolve(reverse('reservations:reservation_details', kwargs={'object_id': '1'}))
+
+    assert found.func.view_class == ReservationDetails
+    assert reverse('reservations:reservation_details', kwargs={'object_id': 'a1'}) == '/reservations/a1/'
+    assert resolve('/reservations/1/').view_name == 'reservations:reservation_details'
+
+
+def test_confirm():
+    """
+    Test resolving URLs for the reservation confirm view.
+    """
+    found = resolve(reverse('reservations:reservation_confirm', kwargs={'object_id': '1'}))
+
+    assert found.func.view_class == ReservationConfirm
+    assert reverse('reservations:reservation_confirm', kwargs={'object_id': 'a1'}) == '/reservations/a1/confirm/'
+    assert resolve('/reservations/1/confirm/').view_name == 'reservations:reservation_confirm'
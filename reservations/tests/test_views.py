@@ -0,0 +1,196 @@
+"""
+This module contains unit test cases for testing the API views related to stock reservations.
+"""
+from datetime import timedelta
+
+from bson import ObjectId
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from parts.models import Part
+from parts.tests.factories import PartFactory
+from reservations.models import Reservation
+from reservations.views import ReservationsList, PartAvailability, ReservationDetails, ReservationConfirm
+
+
+class ReservationTestCase(APITestCase):
+    """
+    Base test case class with a part in stock and helpers to reserve it.
+    """
+    def setUp(self):
+        """
+        Set up necessary components for each test.
+        """
+        self.factory = APIRequestFactory()
+        self.part = PartFactory(quantity=10)
+
+    def reserve(self, quantity: int, **kwargs):
+        """
+        Reserve a quantity of the part.
+        """
+        payload = {'part_id': str(self.part._id), 'quantity': quantity, **kwargs}
+        request = self.factory.post('/reservations/', payload, format='json')
+        return ReservationsList.as_view()(request)
+
+    def get_availability(self) -> dict:
+        """
+        Get the availability of the part.
+        """
+        request = self.factory.get(f'/reservations/availability/{self.part._id}/')
+        return PartAvailability.as_view()(request, part_id=str(self.part._id)).data
+
+
+class TestReservationsList(ReservationTestCase):
+    """
+    Test case class for testing the ReservationsList API view.
+    """
+    def test_reserve(self):
+        """
+        Test reserving a quantity of a part.
+        """
+        response = self.reserve(4)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['part_id'] == str(self.part._id)
+        assert response.data['quantity'] == 4
+        assert Reservation.objects.filter(pk=ObjectId(response.data['_id'])).exists()
+        assert self.get_availability() == {'part_id': str(self.part._id), 'quantity': 10, 'held': 4, 'available': 6}
+
+    def test_reserve_more_than_available(self):
+        """
+        Test rejecting a reservation larger than the available quantity.
+        """
+        self.reserve(6)
+        response = self.reserve(5)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data == {'error': 'Insufficient stock.'}
+        assert Reservation.objects.count() == 1
+
+    @override_settings(RESERVATIONS_MAX_TTL=60)
+    def test_reserve_with_ttl_above_maximum(self):
+        """
+        Test capping the lifetime of a reservation.
+        """
+        response = self.reserve(1, ttl=3600)
+
+        reservation = Reservation.objects.get(pk=ObjectId(response.data['_id']))
+        assert reservation.expires_at <= timezone.now() + timedelta(seconds=60)
+
+    def test_reserve_non_existent_part(self):
+        """
+        Test reserving a quantity of a non-existent part.
+        """
+        payload = {'part_id': '5fc6e6ba9f84e500c7f3b123', 'quantity': 1}
+        request = self.factory.post('/reservations/', payload, format='json')
+        response = ReservationsList.as_view()(request)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert Reservation.objects.count() == 0
+
+    def test_reserve_with_wrong_quantity(self):
+        """
+        Test reserving a quantity that is not a positive integer.
+        """
+        response = self.reserve(0)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'error': 'The quantity must be positive.'}
+
+
+class TestPartAvailability(ReservationTestCase):
+    """
+    Test case class for testing the PartAvailability API view.
+    """
+    def test_availability_without_expired_reservations(self):
+        """
+        Test that the expired reservations do not hold the stock before MongoDB removes them.
+        """
+        Reservation.objects.create(part_id=self.part, quantity=3, expires_at=timezone.now() - timedelta(seconds=1))
+        self.reserve(2)
+
+        assert self.get_availability()['held'] == 2
+        assert self.get_availability()['available'] == 8
+
+    def test_availability_of_non_existent_part(self):
+        """
+        Test retrieving the availability of a non-existent part.
+        """
+        request = self.factory.get('/reservations/availability/5fc6e6ba9f84e500c7f3b123/')
+        response = PartAvailability.as_view()(request, part_id='5fc6e6ba9f84e500c7f3b123')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestReservationDetails(ReservationTestCase):
+    """
+    Test case class for testing the ReservationDetails API view.
+    """
+    def test_release(self):
+        """
+        Test releasing a reservation.
+        """
+        reservation_id = self.reserve(4).data['_id']
+
+        request = self.factory.delete(f'/reservations/{reservation_id}/')
+        response = ReservationDetails.as_view()(request, object_id=reservation_id)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert self.get_availability()['available'] == 10
+
+    def test_release_non_existent_reservation(self):
+        """
+        Test releasing a non-existent reservation.
+        """
+        request = self.factory.delete('/reservations/5fc6e6ba9f84e500c7f3b123/')
+        response = ReservationDetails.as_view()(request, object_id='5fc6e6ba9f84e500c7f3b123')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestReservationConfirm(ReservationTestCase):
+    """
+    Test case class for testing the ReservationConfirm API view.
+    """
+    def test_confirm(self):
+        """
+        Test confirming a reservation.
+        """
+        reservation_id = self.reserve(4).data['_id']
+
+        request = self.factory.post(f'/reservations/{reservation_id}/confirm/')
+        response = ReservationConfirm.as_view()(request, object_id=reservation_id)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'quantity': 6}
+        assert Part.objects.get(pk=self.part._id).quantity == 6
+        assert self.get_availability() == {'part_id': str(self.part._id), 'quantity': 6, 'held': 0, 'available': 6}
+
+    def test_confirm_expired_reservation(self):
+        """
+        Test confirming an expired reservation.
+        """
+        reservation = Reservation.objects.create(
+            part_id=self.part, quantity=3, expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        request = self.factory.post(f'/reservations/{reservation._id}/confirm/')
+        response = ReservationConfirm.as_view()(request, object_id=str(reservation._id))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert Part.objects.get(pk=self.part._id).quantity == 10
+
+    def test_confirm_with_insufficient_stock(self):
+        """
+        Test confirming a reservation after the stock of the part was reduced.
+        """
+        reservation_id = self.reserve(4).data['_id']
+        Part.objects.filter(pk=self.part._id).update(quantity=2)
+
+        request = self.factory.post(f'/reservations/{reservation_id}/confirm/')
+        response = ReservationConfirm.as_view()(request, object_id=reservation_id)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert Reservation.objects.filter(pk=ObjectId(reservation_id)).exists()
@@ -0,0 +1,27 @@
+"""
+URL patterns for the 'reservations' app.
+
+These patterns define the endpoints for handling stock reservations.
+
+- '' (empty path):
+    - POST: Reserve a quantity of a part.
+- 'availability/<str:part_id>/':
+    - GET: Retrieve the available quantity of a part.
+- '<str:object_id>/':
+    - DELETE: Release a specific reservation by its object_id.
+- '<str:object_id>/confirm/':
+    - POST: Confirm a specific reservation by its object_id.
+"""
+from django.urls import path
+
+from .views import ReservationsList, PartAvailability, ReservationDetails, ReservationConfirm
+
+
+app_name = 'reservations'
+
+urlpatterns = [
+    path('', ReservationsList.as_view(), name='reservations_list'),
+    path('availability/<str:part_id>/', PartAvailability.as_view(), name='part_availability'),
+    path('<str:object_id>/', ReservationDetails.as_view(), name='reservation_details'),
+    path('<str:object_id>/confirm/', ReservationConfirm.as_view(), name='reservation_confirm'),
+]
@@ -0,0 +1,163 @@
+from django.conf import settings
+from django.http import HttpRequest
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .holds import confirm, get_availability, release, reservation_document_representation, reserve
+from .models import Reservation
+from parts.models import Part
+from Parts_Warehouse_API.validators import valid_object_id
+
+
+def get_positive_integer(value, name: str) -> int | Response:
+    """
+    Convert a value from the request data to a positive integer.
+
+    Args:
+        value: The value from the request data.
+        name (str): The name of the value, used in the error message.
+
+    Returns:
+        int: The converted value, or error response if the value is not a positive integer.
+    """
+    try:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError
+        value = int(value)
+    except ValueError:
+        return Response({'error': f'The {name} must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+    if value < 1:
+        return Response({'error': f'The {name} must be positive.'}, status=status.HTTP_400_BAD_REQUEST)
+    return value
+
+
+class ReservationsList(APIView):
+    """
+    API view for reserving the stock of a part.
+
+    POST:
+    Reserve a quantity of a part for 'ttl' seconds (the 'RESERVATIONS_TTL' setting by default,
+    at most 'RESERVATIONS_MAX_TTL').
+
+    The reservation is only created if the available quantity of the part, i.e. its quantity minus its
+    active reservations, covers the requested quantity. Expired reservations are removed by MongoDB.
+    """
+    def post(self, request: HttpRequest) -> Response:
+        """
+        Reserve a quantity of a part.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            Response: Response with the created reservation, or error response if the data is invalid
+            or the available quantity is too low.
+
+        Raises:
+            NotFound: If the part does not exist.
+        """
+        if not request.data.get('part_id'):
+            return Response({'error': 'The part_id is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        part_id = valid_object_id(request.data['part_id'])
+        quantity = get_positive_integer(request.data.get('quantity'), 'quantity')
+        if isinstance(quantity, Response):
+            return quantity
+        ttl = get_positive_integer(request.data.get('ttl', settings.RESERVATIONS_TTL), 'ttl')
+        if isinstance(ttl, Response):
+            return ttl
+
+        try:
+            document = reserve(part_id, quantity, min(ttl, settings.RESERVATIONS_MAX_TTL))
+        except Part.DoesNotExist:
+            raise NotFound()
+        if document is None:
+            return Response({'error': 'Insufficient stock.'}, status=status.HTTP_409_CONFLICT)
+        return Response(reservation_document_representation(document), status=status.HTTP_201_CREATED)
+
+
+class PartAvailability(APIView):
+    """
+    API view for retrieving the available quantity of a part.
+
+    GET:
+    Retrieve the quantity of a specific part, the quantity held by its active reservations,
+    and the available quantity.
+    """
+    def get(self, request: HttpRequest, part_id: str) -> Response:
+        """
+        Retrieve the available quantity of a part.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            part_id (str): The ID of the part.
+
+        Returns:
+            Response: Response with the stock of the part.
+
+        Raises:
+            NotFound: If the part does not exist.
+        """
+        availability = get_availability(valid_object_id(part_id))
+        if availability is None:
+            raise NotFound()
+        return Response(availability)
+
+
+class ReservationDetails(APIView):
+    """
+    API view for releasing a specific reservation.
+
+    DELETE:
+    Release a specific reservation by its object_id, making its quantity available again.
+    """
+    def delete(self, request: HttpRequest, object_id: str) -> Response:
+        """
+        Release a specific reservation.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            object_id (str): The ID of the reservation.
+
+        Returns:
+            Response: Response with the status of the release.
+
+        Raises:
+            NotFound: If the reservation does not exist.
+        """
+        if not release(valid_object_id(object_id)):
+            raise NotFound()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ReservationConfirm(APIView):
+    """
+    API view for confirming a specific reservation.
+
+    POST:
+    Confirm an active reservation by its object_id: the reservation is removed and its quantity
+    is taken out of the stock of the part.
+    """
+    def post(self, request: HttpRequest, object_id: str) -> Response:
+        """
+        Confirm a specific reservation.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            object_id (str): The ID of the reservation.
+
+        Returns:
+            Response: Response with the new quantity of the part, or error response if the quantity
+            of the part is lower than the reserved quantity.
+
+        Raises:
+            NotFound: If the reservation does not exist or has expired.
+        """
+        try:
+            quantity = confirm(valid_object_id(object_id))
+        except Reservation.DoesNotExist:
+            raise NotFound()
+        if quantity is None:
+            return Response({'error': 'Insufficient stock.'}, status=status.HTTP_409_CONFLICT)
+        return Response({'quantity': quantity})